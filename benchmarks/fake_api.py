@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Pelican api.cgi endpoint.
+
+Serves the same XML format as the cloud API for any number of simulated
+thermostats, with optional latency and failure injection, and applies SET
+requests to its in-memory state. Run it directly to point a development
+Home Assistant instance at it:
+
+    python -m benchmarks.fake_api --thermostats 50 --port 8080
+
+and use http://127.0.0.1:8080/api.cgi as the Base URL.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import random
+from typing import Any
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+API_PATH = "/api.cgi"
+USERNAME = "bench@example.com"
+PASSWORD = "bench"
+DAYS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+
+def make_thermostat(index: int) -> dict[str, str]:
+    """Return the API values of one simulated thermostat."""
+    return {
+        "temperature": f"{68 + index % 7}.{index % 10}",
+        "humidity": str(35 + index % 20),
+        "co2Level": str(450 + index % 300),
+        "runStatus": "Heat-Stage1" if index % 4 == 0 else "Off",
+        "status": "Occupied",
+        "auxStatus": "Off",
+        "statusDisplay": "Normal",
+        "system": "Auto",
+        "heatSetting": "68",
+        "coolSetting": "76",
+        "schedule": "On",
+        "fan": "Auto",
+        "setBy": "Schedule",
+        "frontKeypad": "On",
+        "humidifySetting": "30",
+        "dehumidifySetting": "60",
+        "humidityControl": "None",
+        "co2Setting": "1000",
+        "heatStages": "1",
+        "coolStages": "1",
+        "fanStages": "1",
+        "systemType": "Conventional",
+        "temperatureFormat": "Fahrenheit",
+        "cycleRate": "4",
+        "anticipationDegrees": "0.5",
+        "calibrationOffset": "0",
+        "minHeatSetting": "45",
+        "maxHeatSetting": "85",
+        "minCoolSetting": "60",
+        "maxCoolSetting": "90",
+        "minSafeTemp": "45",
+        "maxSafeTemp": "90",
+        "serialNo": f"SN{index:06d}",
+        "gateway": f"GW{index // 32:04d}",
+        "version": "2.4.1",
+        "installDate": "2021-05-04",
+        "notificationSensitivity": "Normal",
+        "notificationSetpoint": "5",
+        "notificationUnreachable": "On",
+    }
+
+
+def make_schedule() -> dict[str, list[dict[str, str]]]:
+    """Return the weekly schedule of one simulated thermostat, by day."""
+    workday = [("06:00", "68", "76"), ("08:00", "70", "74"), ("18:00", "68", "76"), ("22:00", "62", "80")]
+    weekend = [("08:00", "68", "76"), ("22:00", "62", "80")]
+    return {
+        day: [
+            {
+                "startTime": start,
+                "system": "Auto",
+                "heatSetting": heat,
+                "coolSetting": cool,
+                "fan": "Auto",
+                "keypad": "On",
+            }
+            for start, heat, cool in (weekend if day in ("Saturday", "Sunday") else workday)
+        ]
+        for day in DAYS
+    }
+
+
+@dataclass
+class FakePelicanAPI:
+    """In-memory Pelican site served over HTTP."""
+
+    thermostats: int = 10
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # random extra latency, up to this many seconds
+    failure_rate: float = 0.0  # fraction of requests answered with HTTP 503
+    # Names listed without readings and that hang on targeted requests
+    offline: set[str] = field(default_factory=set)
+    offline_delay: float = 30.0
+    seed: int = 0
+    state: dict[str, dict[str, str]] = field(init=False)
+    schedules: dict[str, dict[str, list[dict[str, str]]]] = field(init=False)
+    requests: dict[str, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Build the simulated site."""
+        self.state = {
+            self.name(index): make_thermostat(index) for index in range(self.thermostats)
+        }
+        self.schedules = {name: make_schedule() for name in self.state}
+        self.requests = {"get": 0, "set": 0, "failed": 0}
+        self._random = random.Random(self.seed)
+
+    @staticmethod
+    def name(index: int) -> str:
+        """Return the name of the thermostat at an index."""
+        return f"Thermostat {index:04d}"
+
+    def render(self, names: list[str], values: list[str]) -> bytes:
+        """Render a GET response for some thermostats and values."""
+        parts = ["<result><success>1</success>"]
+        for name in names:
+            thermostat = {} if name in self.offline else self.state[name]
+            parts.append("<Thermostat>")
+            for value in values:
+                text = name if value == "name" else thermostat.get(value, "")
+                parts.append(f"<{value}>{escape(text)}</{value}>")
+            parts.append("</Thermostat>")
+        parts.append("</result>")
+        return "".join(parts).encode()
+
+    def render_schedules(self, names: list[str], days: list[str]) -> bytes:
+        """Render a ThermostatSchedule GET response."""
+        parts = ["<result><success>1</success>"]
+        for name in names:
+            for day in days:
+                for set_time, period in enumerate(self.schedules[name].get(day, []), start=1):
+                    parts.append(
+                        f"<ThermostatSchedule><name>{escape(name)}</name>"
+                        f"<dayOfWeek>{day}</dayOfWeek><setTime>{set_time}</setTime>"
+                    )
+                    parts.extend(f"<{key}>{escape(value)}</{key}>" for key, value in period.items())
+                    parts.append("</ThermostatSchedule>")
+        parts.append("</result>")
+        return "".join(parts).encode()
+
+    def set_schedule(self, names: list[str], selection: dict[str, str], value: str) -> bool:
+        """Apply a ThermostatSchedule SET; return False if the selection is invalid."""
+        day = selection.get("dayofweek")
+        if day not in DAYS:
+            return False
+        for name in names:
+            periods = self.schedules[name].setdefault(day, [])
+            if value == "deleteAll":
+                periods.clear()
+                continue
+            try:
+                index = int(selection["settime"]) - 1
+            except (KeyError, ValueError):
+                return False
+            if value == "delete":
+                if index < len(periods):
+                    del periods[index]
+                continue
+            if index > len(periods):
+                return False
+            if index == len(periods):
+                periods.append({})
+            for clause in value.split(";"):
+                key, _, item = clause.partition(":")
+                if key:
+                    periods[index][key] = item
+        return True
+
+    def apply_set(self, names: list[str], values: dict[str, str]) -> str | None:
+        """Apply a Thermostat SET; return an error message to reject it."""
+        for name in names:
+            self.state[name].update(values)
+        return None
+
+    @staticmethod
+    def _selection(selection: str) -> dict[str, str]:
+        """Return the attributes of an API selection other than the name."""
+        pairs = (clause.partition(":") for clause in selection.split(";") if clause)
+        return {key.lower(): value for key, _, value in pairs if key != "name"}
+
+    def _selected(self, selection: str) -> list[str]:
+        """Return the thermostat names matching an API selection."""
+        if not selection:
+            return list(self.state)
+        names = []
+        for clause in selection.split(";"):
+            key, _, value = clause.partition(":")
+            if key == "name" and value in self.state:
+                names.append(value)
+        return names
+
+    @staticmethod
+    def _error(message: str) -> web.Response:
+        """Return an API-level error."""
+        return web.Response(
+            text=f"<result><success>0</success><message>{escape(message)}</message></result>",
+            content_type="text/xml",
+        )
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Answer one api.cgi request."""
+        query = request.query
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            self.requests["failed"] += 1
+            raise web.HTTPServiceUnavailable()
+        if query.get("username") != USERNAME or query.get("password") != PASSWORD:
+            return self._error("Invalid username or password")
+
+        names = self._selected(query.get("selection", ""))
+        if query.get("selection") and any(name in self.offline for name in names):
+            await asyncio.sleep(self.offline_delay)
+
+        if query.get("object") == "ThermostatSchedule":
+            return self._handle_schedule(query, names)
+
+        if query.get("request") == "set":
+            self.requests["set"] += 1
+            if not names:
+                return self._error("No thermostat matches the selection")
+            values = {}
+            for clause in query.get("value", "").split(";"):
+                key, _, value = clause.partition(":")
+                if key:
+                    values[key] = value
+            error = self.apply_set(names, values)
+            if error:
+                return self._error(error)
+            return web.Response(
+                text="<result><success>1</success></result>", content_type="text/xml"
+            )
+
+        self.requests["get"] += 1
+        values = [value for value in query.get("value", "").split(";") if value]
+        return web.Response(body=self.render(names, values), content_type="text/xml")
+
+    def _handle_schedule(self, query: Any, names: list[str]) -> web.Response:
+        """Answer one ThermostatSchedule request."""
+        selection = self._selection(query.get("selection", ""))
+        if query.get("request") == "set":
+            self.requests["set"] += 1
+            if not names or not self.set_schedule(names, selection, query.get("value", "")):
+                return self._error("Invalid schedule selection")
+            return web.Response(
+                text="<result><success>1</success></result>", content_type="text/xml"
+            )
+        self.requests["get"] += 1
+        days = [selection["dayofweek"]] if "dayofweek" in selection else list(DAYS)
+        return web.Response(body=self.render_schedules(names, days), content_type="text/xml")
+
+    def make_app(self) -> web.Application:
+        """Return the aiohttp application serving the API."""
+        app = web.Application()
+        app.router.add_get(API_PATH, self.handle)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, str]:
+        """Start serving and return the runner and the api.cgi URL."""
+        runner = web.AppRunner(self.make_app())
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        bound_port = runner.addresses[0][1]
+        return runner, f"http://{host}:{bound_port}{API_PATH}"
+
+
+def main() -> None:
+    """Serve a fake site until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--thermostats", type=int, default=10)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    api = FakePelicanAPI(
+        thermostats=args.thermostats,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+    )
+    print(f"Serving {args.thermostats} thermostats on http://{args.host}:{args.port}{API_PATH}")
+    print(f"Username: {USERNAME}  Password: {PASSWORD}")
+    web.run_app(api.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""Load test the Pelican Thermostat integration against a simulated fleet.
+
+Boots Home Assistant, sets the integration up against the thermal simulator
+and lets it poll for a while. Measures, for each fleet size:
+
+- loop_lag: how late a 100 ms timer on the event loop fires
+- state_writes_per_s: state changes written to the state machine
+- recorder volume: the state rows and distinct attribute sets the recorder
+  would store for those changes; with --recorder, the growth of its SQLite
+  database as well
+- rss_kb_per_thermostat: growth of the process memory from before setup
+
+Every size runs in a fresh process, and the simulator in processes of its
+own, so earlier runs and the simulation itself do not skew the numbers:
+
+    python -m benchmarks.load_test --sizes 100,500,2000 --duration 300 --output load.json
+
+Poll intervals below the options flow minimum can be passed to compress a
+run; the simulated fleet runs --time-scale times faster than real time.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    issue_registry as ir,
+    translation,
+)
+from homeassistant.helpers.json import json_bytes_strip_null
+from homeassistant.loader import async_setup as async_setup_loader
+from homeassistant.setup import async_setup_component
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
+
+from .fake_api import API_PATH, PASSWORD, USERNAME
+from .run_benchmarks import integration_version
+from .simulator import SimulatedPelicanAPI
+
+DOMAIN = "pelican_thermostat"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_DIR = os.path.join(ROOT, "custom_components", DOMAIN)
+
+DEFAULT_SIZES = "100,500,2000"
+DEFAULT_OUTPUT = "load_test_results.json"
+LAG_INTERVAL = 0.1  # seconds between event loop lag samples
+SIMULATOR_START_TIMEOUT = 30  # seconds
+
+
+@dataclass
+class RecorderLoad:
+    """What the recorder would write for the state changes seen."""
+
+    states: int = 0  # state rows
+    state_bytes: int = 0  # entity ids and state values
+    attribute_sets: int = 0  # distinct attribute sets, stored once each
+    attribute_bytes: int = 0
+
+    def __post_init__(self) -> None:
+        """Start with no attribute sets seen."""
+        self._seen: set[bytes] = set()
+
+    def record(self, event: Event) -> None:
+        """Count one state change."""
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        self.states += 1
+        self.state_bytes += len(new_state.entity_id) + len(new_state.state)
+        attributes = json_bytes_strip_null(dict(new_state.attributes))
+        if attributes not in self._seen:
+            self._seen.add(attributes)
+            self.attribute_sets += 1
+            self.attribute_bytes += len(attributes)
+
+
+def rss_bytes() -> int:
+    """Return the resident memory of this process."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current memory, in kB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def free_port() -> int:
+    """Return a TCP port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def async_boot(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant that loads the integration from this tree."""
+    custom_components = os.path.join(config_dir, "custom_components")
+    os.makedirs(custom_components)
+    os.symlink(COMPONENT_DIR, os.path.join(custom_components, DOMAIN))
+
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    async_setup_loader(hass)
+    translation.async_setup(hass)
+    entity.async_setup(hass)
+    for registry in (ar, dr, er, ir):
+        await registry.async_load(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    hass.set_state(CoreState.running)
+    await async_setup_component(hass, "homeassistant", {})
+    await async_setup_component(hass, "persistent_notification", {})
+    return hass
+
+
+async def async_start_simulators(
+    size: int, options: dict[str, Any]
+) -> tuple[list[str], list[Any]]:
+    """Start one simulated site per config entry; return their URLs and handles."""
+    sites = options["sites"]
+    urls, handles = [], []
+    for index in range(sites):
+        thermostats = size // sites + (index < size % sites)
+        settings = {
+            "thermostats": thermostats,
+            "latency": options["latency"],
+            "time_scale": options["time_scale"],
+            "offline_rate": options["offline_rate"],
+            "seed": index,
+        }
+        if options["in_process"]:
+            runner, url = await SimulatedPelicanAPI(**settings).start()
+            urls.append(url)
+            handles.append(runner)
+            continue
+        port = free_port()
+        arguments = [f"--port={port}"] + [
+            f"--{key.replace('_', '-')}={value}" for key, value in settings.items()
+        ]
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "benchmarks.simulator",
+            *arguments,
+            cwd=ROOT,
+            stdout=asyncio.subprocess.DEVNULL,
+        )
+        handles.append(process)
+        deadline = time.monotonic() + SIMULATOR_START_TIMEOUT
+        while True:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Simulator on port {port} did not start") from None
+                await asyncio.sleep(0.1)
+                continue
+            writer.close()
+            break
+        urls.append(f"http://127.0.0.1:{port}{API_PATH}")
+    return urls, handles
+
+
+async def async_stop_simulators(handles: list[Any]) -> None:
+    """Stop the simulated sites."""
+    for handle in handles:
+        if isinstance(handle, asyncio.subprocess.Process):
+            handle.terminate()
+            await handle.wait()
+        else:
+            await handle.cleanup()
+
+
+async def sample_loop_lag(samples: list[float]) -> None:
+    """Record how late a timer on the event loop fires, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(loop.time() - start - LAG_INTERVAL)
+
+
+async def async_run_size(size: int, options: dict[str, Any]) -> dict[str, Any]:
+    """Load test one fleet size and return its measurements."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_boot(config_dir)
+        database = os.path.join(config_dir, "home-assistant_v2.db")
+        if options["recorder"]:
+            await async_setup_component(
+                hass,
+                "recorder",
+                {"recorder": {"db_url": f"sqlite:///{database}", "commit_interval": 1}},
+            )
+        urls, handles = await async_start_simulators(size, options)
+        try:
+            recorder = RecorderLoad()
+
+            @callback
+            def _state_changed(event: Event) -> None:
+                recorder.record(event)
+
+            hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+            baseline = rss_bytes()
+            database_baseline = _database_bytes(database)
+
+            start = time.perf_counter()
+            for index, url in enumerate(urls):
+                interval = options["poll_interval"]
+                entry = ConfigEntry(
+                    version=1,
+                    minor_version=1,
+                    domain=DOMAIN,
+                    title=f"Load test {index}",
+                    data={"base_url": url, "username": USERNAME, "password": PASSWORD},
+                    options={
+                        "poll_interval": interval,
+                        "min_poll_interval": interval,
+                        "max_poll_interval": interval,
+                    },
+                    source="user",
+                )
+                await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done()
+            setup_seconds = time.perf_counter() - start
+            setup_states = recorder.states
+
+            # Only steady-state polling counts from here on
+            recorder = RecorderLoad()
+            lag: list[float] = []
+            sampler = asyncio.create_task(sample_loop_lag(lag))
+            start = time.perf_counter()
+            await asyncio.sleep(options["duration"])
+            duration = time.perf_counter() - start
+            sampler.cancel()
+            memory = rss_bytes() - baseline
+
+            coordinators = list(hass.data[DOMAIN].values())
+            polls = sum(coordinator.refresh_stats.fetched for coordinator in coordinators)
+            entities = len(hass.states.async_all())
+            database_bytes = None
+            if options["recorder"]:
+                from homeassistant.components.recorder import get_instance
+
+                await get_instance(hass).async_block_till_done()
+                database_bytes = _database_bytes(database) - database_baseline
+            for entry in hass.config_entries.async_entries(DOMAIN):
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_stop(force=True)
+        finally:
+            await async_stop_simulators(handles)
+
+    lag_ms = sorted(sample * 1000 for sample in lag) or [0.0]
+    return {
+        "thermostats": size,
+        "sites": len(urls),
+        "entities": entities,
+        "setup_s": round(setup_seconds, 2),
+        "setup_state_writes": setup_states,
+        "duration_s": round(duration, 1),
+        "simulated_hours": round(duration * options["time_scale"] / 3600, 2),
+        "polls": polls,
+        "loop_lag_mean_ms": round(statistics.fmean(lag_ms), 2),
+        "loop_lag_p95_ms": round(lag_ms[min(len(lag_ms) - 1, int(len(lag_ms) * 0.95))], 2),
+        "loop_lag_max_ms": round(lag_ms[-1], 2),
+        "state_writes_per_s": round(recorder.states / duration, 2),
+        "recorder": {
+            **asdict(recorder),
+            "bytes_per_s": round((recorder.state_bytes + recorder.attribute_bytes) / duration, 1),
+            "database_bytes": database_bytes,
+        },
+        "rss_mb": round(memory / 2**20, 1),
+        "rss_kb_per_thermostat": round(memory / 1024 / size, 1),
+    }
+
+
+def _database_bytes(database: str) -> int:
+    """Return the size of the recorder database and its write-ahead log."""
+    return sum(
+        os.path.getsize(path)
+        for path in (database, f"{database}-wal")
+        if os.path.exists(path)
+    )
+
+
+def run_size(size: int, options: dict[str, Any]) -> dict[str, Any]:
+    """Load test one fleet size; runs in a process of its own."""
+    logging.basicConfig(level=logging.DEBUG if options["verbose"] else logging.ERROR)
+    return asyncio.run(async_run_size(size, options))
+
+
+def print_table(results: list[dict[str, Any]]) -> None:
+    """Print the results as a table."""
+    print(
+        f"{'thermostats':>11}{'entities':>10}{'polls':>7}{'lag ms':>9}{'p95 ms':>9}"
+        f"{'max ms':>9}{'writes/s':>10}{'rec kB/s':>10}{'kB/unit':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['thermostats']:>11}{result['entities']:>10}{result['polls']:>7}"
+            f"{result['loop_lag_mean_ms']:>9.2f}{result['loop_lag_p95_ms']:>9.2f}"
+            f"{result['loop_lag_max_ms']:>9.2f}{result['state_writes_per_s']:>10.2f}"
+            f"{result['recorder']['bytes_per_s'] / 1024:>10.2f}"
+            f"{result['rss_kb_per_thermostat']:>9.1f}"
+        )
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    parser = argparse.ArgumentParser(description="Pelican Thermostat load test")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated fleet sizes")
+    parser.add_argument("--sites", type=int, default=1, help="config entries to split a fleet over")
+    parser.add_argument("--duration", type=float, default=300, help="seconds measured per size")
+    parser.add_argument("--poll-interval", type=int, default=30, help="seconds between polls")
+    parser.add_argument("--time-scale", type=float, default=60.0, help="simulated seconds per second")
+    parser.add_argument("--offline-rate", type=float, default=0.02, help="offline chance per simulated hour")
+    parser.add_argument("--latency", type=float, default=0.0, help="added server latency in seconds")
+    parser.add_argument("--recorder", action="store_true", help="also run the recorder on SQLite")
+    parser.add_argument("--in-process", action="store_true", help="run the simulator on the event loop")
+    parser.add_argument("--verbose", action="store_true", help="log at debug level")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON results file")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    options = vars(args)
+    results = []
+    for size in sizes:
+        print(f"Load testing {size} thermostats for {args.duration:g} s...", flush=True)
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results.append(pool.submit(run_size, size, options).result())
+    print_table(results)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "integration_version": integration_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {key: value for key, value in options.items() if key != "output"},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
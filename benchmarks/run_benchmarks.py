@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Benchmark the Pelican Thermostat integration against the local fake API.
+
+Measures, for each site size:
+
+- poll_full: GET of every value for every thermostat, parsed while streaming
+- poll_tiered: the coordinator's regular tiered poll, including the merge
+- parse: parsing a full response that is already in memory
+- set_round_trip: one compound SET to a single thermostat
+- fanout: diffing a poll and notifying the subscribed entity listeners
+- fanout_all: notifying every listener, as before per-key change detection
+
+Results are printed as a table and written as JSON so runs can be compared
+between releases:
+
+    python -m benchmarks.run_benchmarks --sizes 1,10,100,1000 --output results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+import aiohttp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "custom_components"))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from pelican_thermostat.climate import CLIMATE_KEYS  # noqa: E402
+from pelican_thermostat.const import (  # noqa: E402
+    CONF_BASE_URL,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DOMAIN,
+    VALUE_HEAT_SETTING,
+)
+from pelican_thermostat.coordinator import (  # noqa: E402
+    PelicanThermostatCoordinator,
+    diff_snapshots,
+)
+from pelican_thermostat.fields import (  # noqa: E402
+    ALL_VALUES,
+    NUMBER_FIELDS,
+    SENSOR_FIELDS,
+)
+from pelican_thermostat.parser import parse_thermostat_response  # noqa: E402
+
+from .fake_api import PASSWORD, USERNAME, FakePelicanAPI  # noqa: E402
+
+DEFAULT_SIZES = "1,10,100,1000"
+DEFAULT_OUTPUT = "benchmark_results.json"
+CHANGED_FRACTION = 0.1  # share of thermostats whose temperature moves per poll
+
+# Listener contexts of the entities created for one thermostat
+ENTITY_KEYS = (
+    [frozenset(CLIMATE_KEYS), frozenset(("schedule",)), frozenset(("front_keypad",))]
+    + [frozenset((field.key,)) for field in SENSOR_FIELDS]
+    + [frozenset((field.key,)) for field in NUMBER_FIELDS]
+)
+
+
+def summarize(size: int, metric: str, samples: list[float], **extra: Any) -> dict[str, Any]:
+    """Return timing statistics, in milliseconds, for one metric."""
+    samples_ms = sorted(sample * 1000 for sample in samples)
+    return {
+        "thermostats": size,
+        "metric": metric,
+        "iterations": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 4),
+        "median_ms": round(statistics.median(samples_ms), 4),
+        "p95_ms": round(samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.95))], 4),
+        "min_ms": round(samples_ms[0], 4),
+        "max_ms": round(samples_ms[-1], 4),
+        **extra,
+    }
+
+
+async def time_async(func: Callable[[], Awaitable[Any]], iterations: int) -> list[float]:
+    """Time an awaitable factory over a number of iterations."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def time_sync(func: Callable[[], Any], iterations: int) -> list[float]:
+    """Time a callable over a number of iterations."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def move_temperatures(api: FakePelicanAPI, iteration: int) -> None:
+    """Change the temperature of a share of the simulated thermostats."""
+    names = list(api.state)
+    count = max(1, int(len(names) * CHANGED_FRACTION))
+    offset = iteration * count
+    for index in range(count):
+        thermostat = api.state[names[(offset + index) % len(names)]]
+        thermostat["temperature"] = f"{float(thermostat['temperature']) + 0.1:.1f}"
+
+
+async def bench_size(
+    hass: HomeAssistant, size: int, iterations: int, latency: float
+) -> list[dict[str, Any]]:
+    """Run every benchmark for one site size."""
+    api = FakePelicanAPI(thermostats=size, latency=latency)
+    runner, url = await api.start()
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"Benchmark {size}",
+        data={CONF_BASE_URL: url, CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+        source="user",
+    )
+    session = aiohttp.ClientSession()
+    coordinator = PelicanThermostatCoordinator(hass, entry, session)
+    results = []
+    try:
+        # Warm the connection pool so every metric measures steady state
+        coordinator.data = await coordinator._async_update_data()
+
+        body = api.render(list(api.state), ALL_VALUES)
+        results.append(
+            summarize(
+                size,
+                "poll_full",
+                await time_async(coordinator._fetch_thermostat_data, iterations),
+                response_bytes=len(body),
+            )
+        )
+
+        async def tiered_poll() -> None:
+            coordinator.data = await coordinator._async_update_data()
+
+        results.append(summarize(size, "poll_tiered", await time_async(tiered_poll, iterations)))
+        results.append(
+            summarize(
+                size, "parse", time_sync(lambda: parse_thermostat_response(body), iterations)
+            )
+        )
+
+        name = next(iter(api.state))
+        results.append(
+            summarize(
+                size,
+                "set_round_trip",
+                await time_async(
+                    lambda: coordinator._set_thermostat_values(name, {VALUE_HEAT_SETTING: "69"}),
+                    iterations,
+                ),
+            )
+        )
+
+        notified = 0
+        listeners = 0
+
+        def on_update() -> None:
+            nonlocal notified
+            notified += 1
+
+        for thermostat_name in api.state:
+            for keys in ENTITY_KEYS:
+                coordinator.async_add_listener(on_update, (thermostat_name, keys))
+                listeners += 1
+
+        fanout, fanout_all = [], []
+        notified_changed = 0
+        for iteration in range(iterations):
+            move_temperatures(api, iteration)
+            old = coordinator.data
+            new = await coordinator._async_update_data()
+            notified = 0
+            start = time.perf_counter()
+            coordinator._changed = diff_snapshots(old, new)
+            coordinator.data = new
+            coordinator.async_update_listeners()
+            fanout.append(time.perf_counter() - start)
+            notified_changed += notified
+
+            start = time.perf_counter()
+            coordinator._changed = None
+            coordinator.async_update_listeners()
+            fanout_all.append(time.perf_counter() - start)
+
+        results.append(
+            summarize(
+                size,
+                "fanout",
+                fanout,
+                listeners=listeners,
+                notified_per_poll=notified_changed / iterations,
+            )
+        )
+        results.append(
+            summarize(size, "fanout_all", fanout_all, listeners=listeners, notified_per_poll=listeners)
+        )
+    finally:
+        await session.close()
+        await runner.cleanup()
+    return results
+
+
+async def run(sizes: list[int], iterations: int, latency: float) -> list[dict[str, Any]]:
+    """Run the benchmarks for every site size."""
+    results = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for size in sizes:
+            results.extend(await bench_size(hass, size, iterations, latency))
+    return results
+
+
+def integration_version() -> str:
+    """Return the integration version from its manifest."""
+    manifest = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        "custom_components",
+        DOMAIN,
+        "manifest.json",
+    )
+    with open(manifest, encoding="utf-8") as file:
+        return json.load(file)["version"]
+
+
+def print_table(results: list[dict[str, Any]]) -> None:
+    """Print the results as a table."""
+    print(f"{'thermostats':>11}  {'metric':<15}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for result in results:
+        print(
+            f"{result['thermostats']:>11}  {result['metric']:<15}"
+            f"{result['mean_ms']:>10.3f}{result['p95_ms']:>10.3f}{result['max_ms']:>10.3f}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="Pelican Thermostat benchmarks")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated site sizes")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="added server latency in seconds")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON results file")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    results = asyncio.run(run(sizes, args.iterations, args.latency))
+    print_table(results)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "integration_version": integration_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "sizes": sizes,
+            "iterations": args.iterations,
+            "latency": args.latency,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Simulated Pelican site with simple thermal dynamics.
+
+Extends the fake api.cgi endpoint so the readings move like a real fleet:
+every thermostat conditions a zone that drifts towards a daily outdoor
+temperature cycle, starts and stops its heating or cooling stages with
+hysteresis and a minimum cycle time, rejects setpoints outside its limits,
+and drops offline at a configurable rate. Simulated time runs
+``time_scale`` times faster than real time and advances whenever a request
+comes in, so a load test of a few minutes covers hours of equipment cycles.
+
+It runs in-process through ``start()`` like the fake API, or on its own:
+
+    python -m benchmarks.simulator --thermostats 500 --time-scale 60 --offline-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+import math
+import time
+
+from aiohttp import web
+
+from .fake_api import API_PATH, PASSWORD, USERNAME, FakePelicanAPI
+
+OUTDOOR_MEAN = 60.0  # °F
+OUTDOOR_SWING = 18.0  # °F either side of the mean; coldest at 05:00
+OUTDOOR_COLDEST = 5 * 3600  # seconds after midnight
+DEADBAND = 0.5  # °F either side of a setpoint before a stage starts or stops
+SECOND_STAGE_ERROR = 2.0  # °F off the setpoint that brings in a second stage
+MIN_CYCLE = 180  # simulated seconds a stage runs or rests at least
+STEP = 60  # simulated seconds per integration step
+CO2_OUTDOOR = 420  # ppm
+OCCUPIED_HOURS = (8, 18)
+VACANT_OCCUPANCY = 0.1  # share of the occupied load left outside those hours
+DAY = 86400
+
+RUN_STATUS = {
+    0: "Off",
+    1: "Heat-Stage1",
+    2: "Heat-Stage2",
+    -1: "Cool-Stage1",
+    -2: "Cool-Stage2",
+}
+
+
+@dataclass(slots=True)
+class Zone:
+    """Thermal state of the space one thermostat conditions."""
+
+    temperature: float  # °F
+    time_constant: float  # seconds to close 63% of the gap to outdoors
+    heat_rate: float  # °F per hour one heating stage adds
+    cool_rate: float  # °F per hour one cooling stage removes
+    gain: float  # °F per hour people and equipment add while occupied
+    occupancy: float  # ppm of CO2 added while occupied
+    stage: int = 0  # heating stages running if positive, cooling if negative
+    switched_at: float = -math.inf  # simulated time the stage last changed
+
+
+def outdoor_temperature(clock: float) -> float:
+    """Return the outdoor temperature at a simulated time."""
+    return OUTDOOR_MEAN - OUTDOOR_SWING * math.cos(2 * math.pi * (clock - OUTDOOR_COLDEST) / DAY)
+
+
+def occupancy(clock: float) -> float:
+    """Return the share of the occupied load present at a simulated time."""
+    hour = clock % DAY / 3600
+    return 1.0 if OCCUPIED_HOURS[0] <= hour < OCCUPIED_HOURS[1] else VACANT_OCCUPANCY
+
+
+@dataclass
+class SimulatedPelicanAPI(FakePelicanAPI):
+    """Fake Pelican site whose thermostats heat and cool simulated zones."""
+
+    time_scale: float = 60.0  # simulated seconds per real second
+    offline_rate: float = 0.0  # chance per simulated hour that a unit drops offline
+    offline_duration: float = 1800.0  # mean simulated seconds a unit stays offline
+    start_clock: float = 7 * 3600  # simulated seconds after midnight at start
+    zones: dict[str, Zone] = field(init=False)
+    clock: float = field(init=False)
+    _offline_until: dict[str, float] = field(init=False)
+    _real: float | None = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Build the simulated site and give every zone its own dynamics."""
+        super().__post_init__()
+        self.clock = self.start_clock
+        self._real = None
+        self._offline_until = {}
+        self.zones = {
+            name: Zone(
+                temperature=float(values["temperature"]),
+                time_constant=self._random.uniform(4, 12) * 3600,
+                heat_rate=self._random.uniform(4, 8),
+                cool_rate=self._random.uniform(3, 6),
+                gain=self._random.uniform(0.5, 2.5),
+                occupancy=self._random.uniform(200, 800),
+                stage=1 if "Heat" in values["runStatus"] else 0,
+            )
+            for name, values in self.state.items()
+        }
+
+    def advance(self, seconds: float) -> None:
+        """Run the simulation forward by some simulated seconds."""
+        elapsed = seconds
+        while seconds > 0:
+            step = min(STEP, seconds)
+            self.clock += step
+            seconds -= step
+            outdoor = outdoor_temperature(self.clock)
+            load = occupancy(self.clock)
+            for name, zone in self.zones.items():
+                if zone.stage > 0:
+                    drive = zone.heat_rate * zone.stage
+                else:
+                    drive = zone.cool_rate * zone.stage
+                drive += zone.gain * load
+                zone.temperature += step * (
+                    (outdoor - zone.temperature) / zone.time_constant + drive / 3600
+                )
+                self._control(zone, self.state[name])
+        self._update_availability(elapsed)
+        self._publish()
+
+    def _control(self, zone: Zone, values: dict[str, str]) -> None:
+        """Start, stage or stop a zone's equipment like the thermostat would."""
+        if self.clock - zone.switched_at < MIN_CYCLE:
+            return
+        mode = values["system"]
+        heat = float(values["heatSetting"])
+        cool = float(values["coolSetting"])
+        temperature = zone.temperature
+        stage = 0
+        if mode in ("Heat", "Auto") and (
+            temperature < heat - DEADBAND or (zone.stage > 0 and temperature < heat + DEADBAND)
+        ):
+            second = heat - temperature > SECOND_STAGE_ERROR and int(values["heatStages"]) > 1
+            stage = 2 if second else 1
+        elif mode in ("Cool", "Auto") and (
+            temperature > cool + DEADBAND or (zone.stage < 0 and temperature > cool - DEADBAND)
+        ):
+            second = temperature - cool > SECOND_STAGE_ERROR and int(values["coolStages"]) > 1
+            stage = -2 if second else -1
+        if stage != zone.stage:
+            zone.stage = stage
+            zone.switched_at = self.clock
+
+    def _update_availability(self, elapsed: float) -> None:
+        """Take units offline at the configured rate and bring them back."""
+        for name, until in list(self._offline_until.items()):
+            if self.clock >= until:
+                del self._offline_until[name]
+                self.offline.discard(name)
+        if not self.offline_rate:
+            return
+        chance = 1 - math.exp(-self.offline_rate * elapsed / 3600)
+        for name in self.zones:
+            if name not in self.offline and self._random.random() < chance:
+                self.offline.add(name)
+                self._offline_until[name] = self.clock + self._random.expovariate(
+                    1 / self.offline_duration
+                )
+
+    def _publish(self) -> None:
+        """Write the zone states into the values the API serves."""
+        load = occupancy(self.clock)
+        for name, zone in self.zones.items():
+            values = self.state[name]
+            values["temperature"] = f"{zone.temperature:.1f}"
+            values["runStatus"] = RUN_STATUS[zone.stage]
+            values["status"] = "Occupied" if load == 1.0 else "Vacant"
+            co2 = CO2_OUTDOOR + zone.occupancy * load + self._random.uniform(-15, 15)
+            values["co2Level"] = str(round(co2))
+
+    def apply_set(self, names: list[str], values: dict[str, str]) -> str | None:
+        """Apply a SET, rejecting setpoints outside a thermostat's limits."""
+        for name in names:
+            current = self.state[name]
+            try:
+                heat = float(values.get("heatSetting", current["heatSetting"]))
+                cool = float(values.get("coolSetting", current["coolSetting"]))
+            except ValueError:
+                return "Setpoints must be numbers"
+            if not float(current["minHeatSetting"]) <= heat <= float(current["maxHeatSetting"]):
+                return f"Heat setting {heat:g} is outside the limits of {name}"
+            if not float(current["minCoolSetting"]) <= cool <= float(current["maxCoolSetting"]):
+                return f"Cool setting {cool:g} is outside the limits of {name}"
+            if heat >= cool:
+                return f"Heat setting must be below the cool setting on {name}"
+        return super().apply_set(names, values)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Bring the simulation up to date, then answer the request."""
+        now = time.monotonic()
+        if self._real is not None:
+            self.advance((now - self._real) * self.time_scale)
+        self._real = now
+        return await super().handle(request)
+
+
+def main() -> None:
+    """Serve a simulated site until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--thermostats", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--time-scale", type=float, default=60.0)
+    parser.add_argument("--offline-rate", type=float, default=0.0)
+    parser.add_argument("--offline-duration", type=float, default=1800.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    api = SimulatedPelicanAPI(
+        thermostats=args.thermostats,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+        time_scale=args.time_scale,
+        offline_rate=args.offline_rate,
+        offline_duration=args.offline_duration,
+    )
+    print(f"Simulating {args.thermostats} thermostats on http://{args.host}:{args.port}{API_PATH}")
+    print(f"Username: {USERNAME}  Password: {PASSWORD}", flush=True)
+    web.run_app(api.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
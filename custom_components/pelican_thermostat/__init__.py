@@ -1,16 +1,40 @@
 """The Pelican Thermostat integration."""
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import DOMAIN
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_BASE_URL,
+    CONF_DAILY_BUDGET,
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_REQUEST_RATE,
+    DEFAULT_BASE_URL,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_REQUEST_RATE,
+    DOMAIN,
+    SCHEDULE_CHECK_INTERVAL,
+    STORAGE_VERSION,
+)
 from .coordinator import PelicanThermostatCoordinator
+from .poll_group import async_join_poll_group, async_leave_poll_group
+from .services import async_setup_services, async_unload_services
+from .session import (
+    async_acquire_session,
+    async_get_scheduler,
+    async_release_session,
+    async_warm_up_session,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,19 +53,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Pelican Thermostat from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    coordinator = PelicanThermostatCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
-
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
-
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    # Ensure the coordinator is properly set up for polling
-    # The coordinator will automatically start polling when entities are added
-    _LOGGER.info("Coordinator setup complete, update_interval: %s", coordinator.update_interval)
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    base_url = entry.data.get(CONF_BASE_URL, DEFAULT_BASE_URL)
+    session = async_acquire_session(hass, base_url)
+    try:
+        coordinator = await _async_setup_coordinator(hass, entry, session, base_url)
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+
+        # Ensure the coordinator is properly set up for polling
+        # The coordinator will automatically start polling when entities are added
+        _LOGGER.info("Coordinator setup complete, update_interval: %s", coordinator.update_interval)
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except BaseException:
+        # Home Assistant only runs the unload callbacks for some setup
+        # errors, so the shared session and poll slot are handed back here
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await async_release_session(hass, base_url, entry.entry_id)
+        async_leave_poll_group(hass, entry.entry_id)
+        raise
+    async_setup_services(hass)
+    coordinator.async_start_phase()
+
+    # Schedules are only downloaded once used; keep the cached ones fresh
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_refresh_stale_schedules,
+            timedelta(seconds=SCHEDULE_CHECK_INTERVAL),
+        )
+    )
 
     # Register options update listener
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -49,6 +89,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, session: aiohttp.ClientSession, base_url: str
+) -> PelicanThermostatCoordinator:
+    """Create the coordinator of an entry and give it its first data."""
+    scheduler = async_get_scheduler(
+        hass,
+        base_url,
+        entry.entry_id,
+        entry.options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+        entry.options.get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET),
+    )
+    poll_group = async_join_poll_group(
+        hass,
+        entry.entry_id,
+        entry.options.get(CONF_MAX_CONCURRENT_POLLS, DEFAULT_MAX_CONCURRENT_POLLS),
+    )
+    coordinator = PelicanThermostatCoordinator(hass, entry, session, scheduler, poll_group)
+    await coordinator.async_load_schedules()
+    await coordinator.journal.async_load()
+
+    if await coordinator.async_load_snapshot():
+        # Start from the last run's data; the cloud is contacted in the background
+        async def _async_first_refresh() -> None:
+            await async_warm_up_session(session, base_url)
+            await coordinator.async_refresh()
+
+        entry.async_create_background_task(
+            hass, _async_first_refresh(), f"{DOMAIN} first refresh {entry.title}"
+        )
+    else:
+        await async_warm_up_session(session, base_url)
+        await coordinator.async_config_entry_first_refresh()
+        if not coordinator.last_update_success:
+            raise ConfigEntryNotReady
+    return coordinator
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -57,6 +134,19 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok 
\ No newline at end of file
+        coordinator: PelicanThermostatCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_save_snapshot()
+        await coordinator.journal.async_save()
+        await async_release_session(hass, coordinator.base_url, entry.entry_id)
+        async_leave_poll_group(hass, entry.entry_id)
+        async_unload_services(hass)
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted snapshot, schedules and writes of a removed config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.schedules").async_remove()
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.writes").async_remove()
+ 
\ No newline at end of file
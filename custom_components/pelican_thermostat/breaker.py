@@ -0,0 +1,87 @@
+"""Per-thermostat circuit breaker for Pelican Thermostat."""
+from __future__ import annotations
+
+from enum import StrEnum
+import random
+import time
+
+from .const import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_JITTER,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_TRIAL_TIMEOUT,
+)
+
+
+class BreakerState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop sending requests to a thermostat that keeps failing.
+
+    After a number of consecutive failures the breaker opens and requests
+    are refused until a backoff with jitter has passed. One trial request is
+    then let through (half-open); a success closes the breaker, a failure
+    opens it again with twice the backoff.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base: float = BREAKER_BASE_BACKOFF,
+        maximum: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the breaker."""
+        self.threshold = threshold
+        self.base = base
+        self.maximum = maximum
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.opened = 0  # times opened since the last success
+        self.retry_at = 0.0
+        self.last_success: float | None = None
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state is BreakerState.CLOSED:
+            return True
+        now = time.monotonic()
+        if now < self.retry_at:
+            return False
+        # Let one trial through; if it never reports back, allow another later
+        self.state = BreakerState.HALF_OPEN
+        self.retry_at = now + BREAKER_TRIAL_TIMEOUT
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful response."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.last_success = time.time()
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker once the threshold is reached."""
+        self.failures += 1
+        if self.state is BreakerState.OPEN:
+            # Already backing off; site-wide polls keep reporting the unit
+            return
+        if self.state is BreakerState.HALF_OPEN or self.failures >= self.threshold:
+            self.opened += 1
+            backoff = min(self.base * 2 ** (self.opened - 1), self.maximum)
+            backoff *= 1 + random.uniform(-BREAKER_JITTER, BREAKER_JITTER)
+            self.state = BreakerState.OPEN
+            self.retry_at = time.monotonic() + backoff
+
+    @property
+    def retry_in(self) -> float | None:
+        """Return the seconds until the next request is allowed, if open."""
+        if self.state is BreakerState.CLOSED:
+            return None
+        return max(0.0, self.retry_at - time.monotonic())
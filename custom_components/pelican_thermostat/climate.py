@@ -10,7 +10,6 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_TEMPERATURE,
@@ -22,7 +21,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
-    CONF_THERMOSTAT_NAME,
     DOMAIN,
     FAN_AUTO,
     FAN_ON,
@@ -34,6 +32,8 @@ from .const import (
     SYSTEM_OFF,
 )
 from .coordinator import PelicanThermostatCoordinator
+from .entity import PelicanThermostatBaseEntity, async_add_thermostat_entities
+from .runtime import classify_run_status
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +65,17 @@ PRESET_MODE_MAP = {
 
 PRESET_MODE_MAP_REVERSE = {v: k for k, v in PRESET_MODE_MAP.items()}
 
+# Data keys the climate entity renders
+CLIMATE_KEYS = (
+    "temperature",
+    "heat_setting",
+    "cool_setting",
+    "system_mode",
+    "run_status",
+    "fan_mode",
+    "status",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -76,13 +87,21 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    async_add_entities([PelicanThermostatEntity(coordinator, config_entry)])
+    async_add_thermostat_entities(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        lambda thermostat_name: [
+            PelicanThermostatEntity(coordinator, config_entry, thermostat_name)
+        ],
+    )
 
 
-class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
+class PelicanThermostatEntity(PelicanThermostatBaseEntity, ClimateEntity):
     """Representation of a Pelican Thermostat."""
 
-    _attr_has_entity_name = True
+    _attr_name = None
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
@@ -91,13 +110,15 @@ class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
     )
 
     def __init__(
-        self, coordinator: PelicanThermostatCoordinator, config_entry: ConfigEntry
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        thermostat_name: str,
     ) -> None:
         """Initialize the thermostat."""
-        super().__init__(coordinator)
-        self.config_entry = config_entry
-        self._attr_name = config_entry.data[CONF_THERMOSTAT_NAME]
-        self._attr_unique_id = f"{config_entry.entry_id}_climate"
+        super().__init__(
+            coordinator, config_entry, thermostat_name, "climate", CLIMATE_KEYS
+        )
         self._attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
         self._attr_hvac_modes = list(HVAC_MODE_MAP.values())
         self._attr_target_temperature_step = 1.0
@@ -109,13 +130,13 @@ class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         return data.get("temperature")
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         if self.hvac_mode == HVACMode.HEAT:
             return data.get("heat_setting")
         if self.hvac_mode == HVACMode.COOL:
@@ -125,19 +146,19 @@ class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
     @property
     def target_temperature_high(self) -> float | None:
         """Return the high target temperature."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         return data.get("cool_setting")
 
     @property
     def target_temperature_low(self) -> float | None:
         """Return the low target temperature."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         return data.get("heat_setting")
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         system_mode = data.get("system_mode")
         if system_mode is None and not self.coordinator.last_update_success:
             # If we can't get the mode and last update failed, assume offline
@@ -147,37 +168,41 @@ class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
     @property
     def run_status(self) -> str | None:
         """Return the current run status."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         return data.get("run_status")
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
+        values = {}
         if ATTR_TEMPERATURE in kwargs:
             temperature = kwargs[ATTR_TEMPERATURE]
             if self.hvac_mode == HVACMode.HEAT:
-                await self.coordinator.set_heat_setting(temperature)
+                values["heat_setting"] = temperature
             elif self.hvac_mode == HVACMode.COOL:
-                await self.coordinator.set_cool_setting(temperature)
+                values["cool_setting"] = temperature
 
         # Handle temperature range for AUTO mode
         if self.hvac_mode == HVACMode.AUTO:
             if "target_temp_high" in kwargs:
-                await self.coordinator.set_cool_setting(kwargs["target_temp_high"])
+                values["cool_setting"] = kwargs["target_temp_high"]
             if "target_temp_low" in kwargs:
-                await self.coordinator.set_heat_setting(kwargs["target_temp_low"])
+                values["heat_setting"] = kwargs["target_temp_low"]
 
-        await self.coordinator.async_request_refresh()
+        # Both setpoints go out as one compound SET
+        if values:
+            await self.coordinator.async_set_values(self.thermostat_name, values)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         system_mode = HVAC_MODE_MAP_REVERSE.get(hvac_mode, SYSTEM_OFF)
-        await self.coordinator.set_system_mode(system_mode)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values(
+            self.thermostat_name, {"system_mode": system_mode}
+        )
 
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         pelican_fan_mode = data.get("fan_mode")
         return FAN_MODE_MAP.get(pelican_fan_mode)
 
@@ -185,13 +210,14 @@ class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
         """Set new fan mode."""
         pelican_fan_mode = FAN_MODE_MAP_REVERSE.get(fan_mode)
         if pelican_fan_mode:
-            await self.coordinator.set_fan_mode(pelican_fan_mode)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_values(
+                self.thermostat_name, {"fan_mode": pelican_fan_mode}
+            )
 
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         status = data.get("status")
         return PRESET_MODE_MAP.get(status)
 
@@ -206,26 +232,7 @@ class PelicanThermostatEntity(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current HVAC action (heating, cooling, idle, etc)."""
-        data = self.coordinator.data
-        run_status = data.get("run_status")
-        
-        if not run_status:
-            return HVACAction.IDLE
-        
-        run_status_lower = run_status.lower()
-        
-        # Map run status to HVAC actions
-        if "heat" in run_status_lower:
-            return HVACAction.HEATING
-        elif "cool" in run_status_lower:
-            return HVACAction.COOLING
-        elif "fan" in run_status_lower:
-            return HVACAction.FAN
-        elif "idle" in run_status_lower or "off" in run_status_lower:
-            return HVACAction.IDLE
-        
-        # Default to idle if we can't determine
-        return HVACAction.IDLE
+        return classify_run_status(self.thermostat_data.get("run_status"))
 
 
     @property
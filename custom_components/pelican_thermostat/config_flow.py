@@ -1,33 +1,105 @@
 """Minimal config flow for Pelican Thermostat integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .const import (
+    API_OBJECT,
+    API_PASSWORD,
+    API_REQUEST,
+    API_SELECTION,
+    API_USERNAME,
+    API_VALUE,
     CONF_BASE_URL,
+    CONF_BURST_DURATION,
+    CONF_DAILY_BUDGET,
+    CONF_HISTORY_RETENTION,
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     CONF_PASSWORD,
     CONF_POLL_INTERVAL,
+    CONF_REQUEST_RATE,
     CONF_THERMOSTAT_NAME,
+    CONF_THERMOSTATS,
     CONF_USERNAME,
     DEFAULT_BASE_URL,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_REQUEST_RATE,
+    DISCOVERY_TIMEOUT,
     DOMAIN,
+    OBJECT_THERMOSTAT,
+    REQUEST_GET,
+    VALUE_NAME,
 )
+from .parser import PelicanParseError, create_parser
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class InvalidAuth(Exception):
+    """The API refused the credentials."""
+
+
+async def async_list_thermostats(
+    hass: HomeAssistant, base_url: str, username: str, password: str
+) -> list[str]:
+    """Log in with one site-wide GET and return the names of the account's thermostats."""
+    params = {
+        API_USERNAME: username,
+        API_PASSWORD: password,
+        API_REQUEST: REQUEST_GET,
+        API_OBJECT: OBJECT_THERMOSTAT,
+        API_SELECTION: "",
+        API_VALUE: VALUE_NAME,
+    }
+    session = async_get_clientsession(hass)
+    async with asyncio.timeout(DISCOVERY_TIMEOUT):
+        async with session.get(base_url, params=params) as response:
+            response.raise_for_status()
+            body = await response.read()
+    parser = create_parser()
+    try:
+        parser.feed(body)
+        return sorted(parser.close())
+    except PelicanParseError as err:
+        if parser.success:
+            # Logged in, but the account has no thermostats
+            return []
+        raise InvalidAuth from err
+
+
 class PelicanThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pelican Thermostat."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._data: dict[str, Any] = {}
+        self._thermostats: list[str] = []
+
     @staticmethod
     def async_get_options_flow(config_entry: config_entries.ConfigEntry):
         """Get the options flow for this handler."""
@@ -36,12 +108,26 @@ class PelicanThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Log in and list the thermostats of the account."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(
-                title=f"Pelican Thermostat - {user_input[CONF_THERMOSTAT_NAME]}",
-                data=user_input,
-            )
+            try:
+                self._thermostats = await async_list_thermostats(
+                    self.hass,
+                    user_input.get(CONF_BASE_URL, DEFAULT_BASE_URL),
+                    user_input[CONF_USERNAME],
+                    user_input[CONF_PASSWORD],
+                )
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Could not list thermostats: %s", err)
+                errors["base"] = "cannot_connect"
+            else:
+                if self._thermostats:
+                    self._data = user_input
+                    return await self.async_step_thermostats()
+                errors["base"] = "no_thermostats"
 
         return self.async_show_form(
             step_id="user",
@@ -50,14 +136,69 @@ class PelicanThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_USERNAME): str,
                     vol.Required(CONF_PASSWORD): str,
                     vol.Optional(CONF_BASE_URL, default=DEFAULT_BASE_URL): str,
-                    vol.Required(CONF_THERMOSTAT_NAME): str,
                     vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): vol.All(
                         vol.Coerce(int), vol.Range(min=30, max=300)
                     ),
                 }
             ),
+            errors=errors,
+        )
+
+    async def async_step_thermostats(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick the thermostats to add as one site entry."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            selected = [
+                name for name in self._thermostats if name in user_input[CONF_THERMOSTATS]
+            ]
+            if selected:
+                return await self._async_create_site(selected)
+            errors["base"] = "no_thermostats_selected"
+
+        return self.async_show_form(
+            step_id="thermostats",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_THERMOSTATS, default=self._thermostats): SelectSelector(
+                        SelectSelectorConfig(
+                            options=self._thermostats,
+                            multiple=True,
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                }
+            ),
+            description_placeholders={"count": str(len(self._thermostats))},
+            errors=errors,
         )
 
+    async def _async_create_site(self, selected: list[str]) -> FlowResult:
+        """Create the entry for the picked thermostats.
+
+        Picking every thermostat creates a site entry, which also takes
+        thermostats added to the account later. A single thermostat gets
+        an entry of its own, and other picks an entry limited to them.
+        """
+        data = dict(self._data)
+        username = data[CONF_USERNAME]
+        # One entry per site account; a named thermostat gets its own entry
+        unique_id = f"{data.get(CONF_BASE_URL, DEFAULT_BASE_URL)}_{username}"
+        title = f"Pelican Thermostat - {username}"
+        if len(selected) == 1:
+            data[CONF_THERMOSTAT_NAME] = selected[0]
+            unique_id = f"{unique_id}_{selected[0]}"
+            title = f"Pelican Thermostat - {selected[0]}"
+        elif len(selected) < len(self._thermostats):
+            data[CONF_THERMOSTATS] = selected
+            unique_id = f"{unique_id}_{','.join(selected)}"
+            title = f"{title} ({len(selected)} thermostats)"
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(title=title, data=data)
+
 
 class PelicanThermostatOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Pelican Thermostat."""
@@ -66,12 +207,26 @@ class PelicanThermostatOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.config_entry = config_entry
 
+    def _get(self, key: str, default: Any) -> Any:
+        """Return the current value of a setting."""
+        return self.config_entry.options.get(
+            key, self.config_entry.data.get(key, default)
+        )
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if not (
+                user_input[CONF_MIN_POLL_INTERVAL]
+                <= user_input[CONF_POLL_INTERVAL]
+                <= user_input[CONF_MAX_POLL_INTERVAL]
+            ):
+                errors["base"] = "invalid_poll_intervals"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
@@ -79,11 +234,37 @@ class PelicanThermostatOptionsFlow(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_POLL_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_POLL_INTERVAL,
-                            self.config_entry.data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
-                        ),
+                        default=self._get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
                     ): vol.All(vol.Coerce(int), vol.Range(min=30, max=300)),
+                    vol.Optional(
+                        CONF_MIN_POLL_INTERVAL,
+                        default=self._get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                    vol.Optional(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=self._get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+                    vol.Optional(
+                        CONF_BURST_DURATION,
+                        default=self._get(CONF_BURST_DURATION, DEFAULT_BURST_DURATION),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                    vol.Optional(
+                        CONF_REQUEST_RATE,
+                        default=self._get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+                    vol.Optional(
+                        CONF_DAILY_BUDGET,
+                        default=self._get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_HISTORY_RETENTION,
+                        default=self._get(CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=48)),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_POLLS,
+                        default=self._get(CONF_MAX_CONCURRENT_POLLS, DEFAULT_MAX_CONCURRENT_POLLS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
                 }
             ),
-        ) 
\ No newline at end of file
+            errors=errors,
+        )
\ No newline at end of file
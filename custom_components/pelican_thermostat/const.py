@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 DOMAIN = "pelican_thermostat"
+MANUFACTURER = "Pelican Wireless Systems"
 
 # Configuration keys
 CONF_BASE_URL = "base_url"
 CONF_THERMOSTAT_NAME = "thermostat_name"
+CONF_THERMOSTATS = "thermostats"  # names picked for an entry covering part of a site
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+CONF_REQUEST_RATE = "requests_per_minute"
+CONF_DAILY_BUDGET = "daily_request_budget"
 
 # Default values
 DEFAULT_BASE_URL = "https://demo.officeclimatecontrol.net/api.cgi"
@@ -26,6 +30,10 @@ REQUEST_SET = "set"
 
 # API objects
 OBJECT_THERMOSTAT = "Thermostat"
+OBJECT_THERMOSTAT_SCHEDULE = "ThermostatSchedule"
+
+# API values for get requests - Identity
+VALUE_NAME = "name"
 
 # API values for get requests - Measurements
 VALUE_TEMPERATURE = "temperature"
@@ -86,6 +94,16 @@ VALUE_SYSTEM = "system"
 VALUE_HEAT_SETTING = "heatSetting"
 VALUE_COOL_SETTING = "coolSetting"
 
+# The config flow lists the account's thermostats with one GET
+DISCOVERY_TIMEOUT = 15  # seconds
+
+# Dispatcher signal, formatted with the entry id, sent with the names of
+# thermostats that appeared on the account after setup
+SIGNAL_NEW_THERMOSTATS = f"{DOMAIN}_new_thermostats_{{}}"
+
+# Writes to one thermostat within this window are merged into a single SET
+WRITE_DEBOUNCE = 0.3  # seconds
+
 # System modes
 SYSTEM_AUTO = "Auto"
 SYSTEM_HEAT = "Heat"
@@ -119,6 +137,101 @@ AUX_OFF = "Off"
 
 # Configuration keys
 CONF_POLL_INTERVAL = "poll_interval"
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_BURST_DURATION = "burst_duration"
+CONF_HISTORY_RETENTION = "history_retention"
+CONF_MAX_CONCURRENT_POLLS = "max_concurrent_polls"
 
 # Update interval
-DEFAULT_POLL_INTERVAL = 70  # seconds (1 minute 10 seconds) 
\ No newline at end of file
+DEFAULT_POLL_INTERVAL = 70  # seconds (1 minute 10 seconds)
+
+# Adaptive polling: fast while heating/cooling or after a write, slow when idle
+DEFAULT_MIN_POLL_INTERVAL = 30  # seconds
+DEFAULT_MAX_POLL_INTERVAL = 300  # seconds
+DEFAULT_BURST_DURATION = 120  # seconds of fast polling after a write
+DEFAULT_HISTORY_RETENTION = 6  # hours of readings kept in memory per thermostat
+IDLE_AFTER = 1800  # seconds without heating/cooling before polling slows down
+
+# Staggered polling across sites: each site polls on its own phase of the
+# interval, and the strictest concurrent poll limit of the sites applies
+DATA_POLL_GROUP = f"{DOMAIN}_poll_group"
+DEFAULT_MAX_CONCURRENT_POLLS = 4
+POLL_PHASE_JITTER = 0.2  # share of a site's slot its phase may shift by
+POLL_MIN_GAP = 0.5  # share of the interval a re-phased poll waits at least
+
+# Polling tiers: telemetry every poll, settings every few polls, config hourly
+TIER_TELEMETRY = "telemetry"
+TIER_SETTINGS = "settings"
+TIER_CONFIG = "config"
+SETTINGS_POLL_EVERY = 5  # polls
+CONFIG_REFRESH_INTERVAL = 3600  # seconds
+
+# Responses are parsed in chunks of this size as they stream in
+PARSE_CHUNK_SIZE = 16384  # bytes
+
+# HTTP session settings (one pooled session is shared per base URL)
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+SESSION_LIMIT_PER_HOST = 4
+SESSION_DNS_CACHE_TTL = 300  # seconds
+SESSION_KEEPALIVE_TIMEOUT = DEFAULT_POLL_INTERVAL + 20  # outlive one poll cycle
+SESSION_WARM_UP_TIMEOUT = 10  # seconds
+
+# Bulk writes that need one SET per thermostat send at most this many at once
+BULK_WRITE_CONCURRENCY = SESSION_LIMIT_PER_HOST
+
+# Shared request scheduler (one per base URL); entries sharing a base URL
+# are held to the strictest of their limits
+DEFAULT_REQUEST_RATE = 30  # requests per minute
+DEFAULT_REQUEST_BURST = 10  # requests sent back to back before the rate applies
+DEFAULT_DAILY_BUDGET = 0  # requests per day; 0 is unlimited
+
+# Circuit breaker for unreachable thermostats
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures before the breaker opens
+BREAKER_BASE_BACKOFF = 60  # seconds the breaker stays open the first time
+BREAKER_MAX_BACKOFF = 1800  # seconds
+BREAKER_JITTER = 0.25  # share of each backoff randomly added or removed
+BREAKER_TRIAL_TIMEOUT = 30  # seconds a half-open trial request may take
+KEY_BREAKER = "breaker"  # listener key notified on breaker state changes
+
+# Write-ahead journal: writes are kept until the API answers them, and
+# replayed with backoff once an unreachable thermostat responds again
+WRITE_JOURNAL_SAVE_DELAY = 1  # seconds
+WRITE_RETRY_BASE = 30  # seconds before the first replay
+WRITE_RETRY_MAX = 1800  # seconds
+WRITE_PENDING_MAX_AGE = 86400  # seconds; older writes are dropped, not replayed
+KEY_PENDING = "pending_writes"  # state attribute listing undelivered values
+
+# Fleet analytics (needs numpy): polls are binned into thermostat x time
+# arrays and scanned for problems by the fleet_report service
+FLEET_SAMPLE_INTERVAL = 300  # seconds per time bin
+FLEET_RETENTION = 7 * 86400  # seconds of telemetry kept
+FLEET_MIN_HOURS = 6  # hours of readings before a sensor or setpoint is judged
+DEFAULT_FLEET_REPORT_HOURS = 24
+DEFAULT_CO2_LIMIT = 1000  # ppm
+SHORT_CYCLE_LIMIT = 6  # more heating or cooling starts within an hour is short cycling
+STUCK_SENSOR_RANGE = 0.1  # degrees; a smaller temperature range is a stuck sensor
+SETPOINT_TOLERANCE = 2.0  # degrees outside the active setpoint that count as a miss
+SETPOINT_MISS_SHARE = 0.5  # share of controlled time missed before it is reported
+
+# Weekly schedules (ThermostatSchedule object), downloaded on first use and
+# kept in storage under a content hash
+VALUE_DAY_OF_WEEK = "dayOfWeek"
+VALUE_SET_TIME = "setTime"  # index of a period within its day, from 1
+VALUE_START_TIME = "startTime"  # 24 hour HH:MM
+VALUE_KEYPAD = "keypad"
+VALUE_DELETE = "delete"
+VALUE_DELETE_ALL = "deleteAll"
+SCHEDULE_DAYS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Vacation")
+SCHEDULE_REFRESH_INTERVAL = 86400  # seconds
+SCHEDULE_CHECK_INTERVAL = 3600  # seconds between looks for stale schedules
+
+# Last good snapshot, persisted so entities start before the cloud answers
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60  # seconds; writes are batched to spare the disk
+ATTR_STALE = "stale"
+ATTR_DATA_AS_OF = "data_as_of"
+
+# Request metrics, shown by site diagnostic sensors
+KEY_METRICS = "metrics"  # listener key notified after every poll
+KEY_RUNTIME = "runtime"  # listener key notified when runtime totals change
@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+import contextlib
 import logging
+import time
 import xml.etree.ElementTree as ET
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -19,62 +28,133 @@ from .const import (
     API_SELECTION,
     API_USERNAME,
     API_VALUE,
+    BULK_WRITE_CONCURRENCY,
     CONF_BASE_URL,
+    CONF_BURST_DURATION,
+    CONF_HISTORY_RETENTION,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     CONF_PASSWORD,
     CONF_POLL_INTERVAL,
     CONF_THERMOSTAT_NAME,
+    CONF_THERMOSTATS,
     CONF_USERNAME,
+    CONFIG_REFRESH_INTERVAL,
     DEFAULT_BASE_URL,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    FLEET_RETENTION,
+    FLEET_SAMPLE_INTERVAL,
+    KEY_BREAKER,
+    KEY_METRICS,
+    KEY_RUNTIME,
     OBJECT_THERMOSTAT,
+    OBJECT_THERMOSTAT_SCHEDULE,
+    PARSE_CHUNK_SIZE,
     REQUEST_GET,
     REQUEST_SET,
-    VALUE_ANTICIPATION_DEGREES,
-    VALUE_AUX_STATUS,
-    VALUE_CALIBRATION_OFFSET,
-    VALUE_CO2_LEVEL,
-    VALUE_CO2_SETTING,
-    VALUE_COOL_STAGES,
-    VALUE_CYCLE_RATE,
-    VALUE_DEHUMIDIFY_SETTING,
-    VALUE_FAN,
-    VALUE_FAN_STAGES,
-    VALUE_FRONT_KEYPAD,
-    VALUE_GATEWAY,
-    VALUE_HEAT_STAGES,
-    VALUE_HUMIDIFY_SETTING,
-    VALUE_HUMIDITY,
-    VALUE_HUMIDITY_CONTROL,
-    VALUE_INSTALL_DATE,
-    VALUE_MAX_COOL_SETTING,
-    VALUE_MAX_HEAT_SETTING,
-    VALUE_MAX_SAFE_TEMP,
-    VALUE_MIN_COOL_SETTING,
-    VALUE_MIN_HEAT_SETTING,
-    VALUE_MIN_SAFE_TEMP,
-    VALUE_NOTIFICATION_SENSITIVITY,
-    VALUE_NOTIFICATION_SETPOINT,
-    VALUE_NOTIFICATION_UNREACHABLE,
-    VALUE_RUN_STATUS,
-    VALUE_SCHEDULE,
-    VALUE_SERIAL_NO,
-    VALUE_SET_BY,
-    VALUE_STATUS,
-    VALUE_STATUS_DISPLAY,
-    VALUE_SYSTEM_TYPE,
+    SCHEDULE_REFRESH_INTERVAL,
+    SETTINGS_POLL_EVERY,
+    SIGNAL_NEW_THERMOSTATS,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+    TIER_CONFIG,
+    TIER_SETTINGS,
+    TIER_TELEMETRY,
+    VALUE_NAME,
     VALUE_TEMPERATURE,
-    VALUE_TEMPERATURE_FORMAT,
-    VALUE_VERSION,
+    WRITE_PENDING_MAX_AGE,
 )
+from .breaker import BreakerState, CircuitBreaker
+from .fields import ALL_VALUES, FIELDS_BY_KEY, POLL_TIERS, WRITABLE_FIELDS
+from .fleet import FleetTelemetry, analyze_fleet, np
+from .history import HISTORY_KEYS, PelicanHistory
+from .metrics import OUTCOME_REJECTED, PelicanMetrics, RequestTrace
+from .parser import create_parser
+from .poll_group import PollGroup, PollLimiter
+from .polling import AdaptivePollScheduler
+from .runtime import RuntimeTracker
+from .schedule import (
+    SCHEDULE_VALUE_LIST,
+    CachedSchedule,
+    PelicanScheduleCache,
+    Week,
+    diff_schedule,
+    merge_days,
+    parse_schedule_response,
+)
+from .scheduler import BudgetExhausted, RequestCancelled, RequestPriority, RequestScheduler
+from .write_journal import PelicanWriteJournal, WriteUndelivered
+from .write_queue import PelicanWriteQueue, values_match
 
 _LOGGER = logging.getLogger(__name__)
 
+# Data keys the coordinator reads itself, polled even when no entity shows
+# them: liveness and adaptive polling, runtime accounting, the history and
+# the fleet telemetry
+COORDINATOR_KEYS = frozenset(
+    {"temperature", "run_status", "fan_mode", "aux_status", "system_mode", *HISTORY_KEYS}
+)
+
+
+@dataclass
+class RefreshStats:
+    """Counters of the single-flight refresh layer."""
+
+    requested: int = 0  # refreshes asked of the coordinator
+    fetched: int = 0  # fetches actually sent
+    joined: int = 0  # refreshes that waited for a follow-up fetch
+
+    @property
+    def saved(self) -> int:
+        """Return the number of fetches avoided by sharing."""
+        return self.requested - self.fetched
+
+
+def diff_snapshots(
+    old: dict[str, dict[str, Any]] | None, new: dict[str, dict[str, Any]]
+) -> dict[str, set[str]]:
+    """Return the data keys that differ between two snapshots, per thermostat."""
+    old = old or {}
+    changed: dict[str, set[str]] = {}
+    for thermostat_name in old.keys() | new.keys():
+        old_values = old.get(thermostat_name, {})
+        new_values = new.get(thermostat_name, {})
+        if old_values == new_values:
+            continue
+        changed[thermostat_name] = {
+            key
+            for key in old_values.keys() | new_values.keys()
+            if old_values.get(key) != new_values.get(key)
+        }
+    return changed
+
 
 class PelicanThermostatCoordinator(DataUpdateCoordinator):
-    """Data coordinator for Pelican Thermostat."""
+    """Site-wide data coordinator for Pelican Thermostats.
+
+    One GET request returns every thermostat of the site; data is keyed by
+    thermostat name. Each poll is diffed against the previous snapshot and
+    only listeners subscribed to a changed key are notified.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        session: aiohttp.ClientSession,
+        scheduler: RequestScheduler | None = None,
+        poll_group: PollGroup | None = None,
+    ) -> None:
+        """Initialize the coordinator.
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize the coordinator."""
+        Without a scheduler, requests are sent without a rate limit; without
+        a poll group, polls are scheduled by Home Assistant alone.
+        """
         # Check options first, fall back to data, then default
         poll_interval = entry.options.get(
             CONF_POLL_INTERVAL,
@@ -86,283 +166,1170 @@ class PelicanThermostatCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Pelican Thermostat",
             update_interval=timedelta(seconds=poll_interval),
+            always_update=False,
         )
         self.entry = entry
         self.base_url = entry.data.get(CONF_BASE_URL, DEFAULT_BASE_URL)
         self.username = entry.data[CONF_USERNAME]
         self.password = entry.data[CONF_PASSWORD]
-        self.thermostat_name = entry.data[CONF_THERMOSTAT_NAME]
+        # Entries created for a single thermostat keep polling only that unit
+        self.thermostat_name: str | None = entry.data.get(CONF_THERMOSTAT_NAME) or None
+        # Entries created for some thermostats poll the site and keep only
+        # those; entries for the whole site also take thermostats added later
+        self.thermostats: frozenset[str] | None = (
+            frozenset(entry.data.get(CONF_THERMOSTATS) or ()) or None
+        )
+        self._new_thermostats: list[str] = []
+        self.session = session
+        self.scheduler = scheduler
+        self.poll_group = poll_group
+        self._budget_exhausted = False
+        self._write_queues: dict[str, PelicanWriteQueue] = {}
+        # Writes not yet answered by the API, replayed when a unit responds
+        self.journal = PelicanWriteJournal(hass, entry.entry_id)
+        self._replaying: set[str] = set()
+        # Last confirmed value of each optimistically written key, per thermostat
+        self._unconfirmed: dict[str, dict[str, Any]] = {}
+        # Data keys read by the latest poll or a read-back since, per thermostat
+        self._confirmed: dict[str, set[str]] = {}
+        # Snapshot of the last poll and the keys it changed; None notifies all
+        self._poll_diff: tuple[dict[str, dict[str, Any]], dict[str, set[str]] | None] | None = None
+        self._notified_success = True
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.refresh_stats = RefreshStats()
+        self.metrics = PelicanMetrics()
+        self._fetch_task: asyncio.Task[dict[str, dict[str, Any]]] | None = None
+        self._follow_up: asyncio.Future[dict[str, dict[str, Any]]] | None = None
+        # Data restored from the last run is stale until a live poll succeeds
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.stale = False
+        self.data_as_of: datetime | None = None
+        self._poll_count = 0
+        self._config_fetched_at: float | None = None
+        # API values polled for the entities listening; None polls everything
+        self._polled: frozenset[str] | None = None
+        self._polled_dirty = True
+        # Data keys of the values left out of the poll, dropped from the snapshot
+        self._unpolled_keys: frozenset[str] = frozenset()
+        self.poll_scheduler = AdaptivePollScheduler(
+            poll_interval,
+            self._option(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            self._option(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+            self._option(CONF_BURST_DURATION, DEFAULT_BURST_DURATION),
+        )
+        # Readings of recent polls, for trend queries that skip the recorder
+        self.history = PelicanHistory(
+            self._option(CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION) * 3600,
+            self.poll_scheduler.minimum,
+        )
+        # Thermostat x time arrays for the fleet report; needs numpy
+        self.fleet = (
+            FleetTelemetry(FLEET_RETENTION, FLEET_SAMPLE_INTERVAL) if np is not None else None
+        )
+        # Longer gaps than two slow polls are not counted as runtime
+        self.runtime = RuntimeTracker(2 * self.poll_scheduler.maximum)
+        # Weekly schedules, downloaded on first use and refreshed daily
+        self.schedules = PelicanScheduleCache()
+        self._schedule_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.schedules"
+        )
+        self._schedule_lock = asyncio.Lock()
         _LOGGER.info("Coordinator initialized with update_interval: %s", self.update_interval)
 
+    def _option(self, key: str, default: Any) -> Any:
+        """Return a setting from options, falling back to data, then default."""
+        return self.entry.options.get(key, self.entry.data.get(key, default))
+
     def update_poll_interval(self) -> None:
         """Update the poll interval from config entry options."""
-        poll_interval = self.entry.options.get(
-            CONF_POLL_INTERVAL,
-            self.entry.data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
-        )
-        new_interval = timedelta(seconds=poll_interval)
+        self.poll_scheduler.base = self._option(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+        self.poll_scheduler.minimum = self._option(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)
+        self.poll_scheduler.maximum = self._option(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+        self.poll_scheduler.burst = self._option(CONF_BURST_DURATION, DEFAULT_BURST_DURATION)
+        self._apply_poll_interval()
+
+    def _apply_poll_interval(self) -> None:
+        """Use the interval chosen by the adaptive poll scheduler."""
+        new_interval = timedelta(seconds=self.poll_scheduler.interval)
         if self.update_interval != new_interval:
-            _LOGGER.info("Updating poll interval from %s to %s", self.update_interval, new_interval)
+            _LOGGER.debug("Updating poll interval from %s to %s", self.update_interval, new_interval)
             self.update_interval = new_interval
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via API."""
-        _LOGGER.info("Polling thermostat data...")
+    @callback
+    def async_start_phase(self) -> None:
+        """Move the site's polls onto its phase of the poll interval.
+
+        Home Assistant schedules each poll one interval after the previous
+        one, so a single refresh at the start of the phase shifts the polls
+        that follow it onto the phase too.
+        """
+        if self.poll_group is None or self.entry.pref_disable_polling:
+            return
+        delay = self.poll_group.delay(
+            self.entry.entry_id, self.update_interval.total_seconds(), time.time()
+        )
+        self.entry.async_on_unload(
+            async_call_later(
+                self.hass,
+                delay,
+                HassJob(self._async_phase_refresh, cancel_on_shutdown=True),
+            )
+        )
+
+    async def _async_phase_refresh(self, _now: datetime) -> None:
+        """Poll at the start of the site's phase."""
+        await self.async_refresh()
+
+    @property
+    def thermostat_names(self) -> list[str]:
+        """Return the names of the thermostats in the latest data."""
+        return list(self.data) if self.data else []
+
+    async def async_load_snapshot(self) -> bool:
+        """Restore the last persisted snapshot; return True if there was one."""
+        stored = await self._store.async_load()
+        if not stored or not stored.get("data"):
+            return False
+        self.data = stored["data"]
+        self.data_as_of = datetime.fromisoformat(stored["saved_at"])
+        self.runtime.restore(stored.get("runtime", {}))
+        self.stale = True
+        _LOGGER.debug(
+            "Restored %d thermostats from the snapshot of %s", len(self.data), self.data_as_of
+        )
+        return True
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the confirmed data to persist, without optimistic values."""
+        data = {
+            thermostat_name: {**values, **self._unconfirmed.get(thermostat_name, {})}
+            for thermostat_name, values in (self.data or {}).items()
+        }
+        return {
+            "saved_at": self.data_as_of.isoformat(),
+            "data": data,
+            "runtime": self.runtime.as_dict(),
+        }
+
+    async def async_save_snapshot(self) -> None:
+        """Persist the current snapshot now."""
+        if self.data and self.data_as_of and not self.stale:
+            await self._store.async_save(self._snapshot())
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners of the keys the last poll changed.
+
+        The diff is only used with the snapshot it was computed for; any
+        other data notifies every listener. Refreshes that joined the same
+        fetch share its result, and only the first one notifies its changes.
+        """
+        # Only dispatched once the snapshot holding them is in place, so their
+        # entities start with data
+        new = [name for name in self._new_thermostats if self.data and name in self.data]
+        if new:
+            self._new_thermostats = [name for name in self._new_thermostats if name not in new]
+            _LOGGER.info("Adding new thermostats: %s", ", ".join(new))
+            async_dispatcher_send(
+                self.hass, SIGNAL_NEW_THERMOSTATS.format(self.entry.entry_id), new
+            )
+            # Their settings and configuration are fetched by the next poll
+            self.hass.async_create_background_task(
+                self.async_request_refresh(), f"{DOMAIN} refresh new thermostats"
+            )
+        poll_diff = self._poll_diff
+        if poll_diff is not None and poll_diff[0] is self.data:
+            changed = poll_diff[1]
+            self._poll_diff = (self.data, {})
+        else:
+            changed = self._poll_diff = None
+        # Set for the single refresh that replaces restored data, see below
+        self.always_update = False
+        self._async_notify_keys(changed)
+
+    @callback
+    def _async_notify_keys(self, changed: dict[str | None, set[str]] | None) -> None:
+        """Notify only the listeners subscribed to a changed key.
+
+        Entities pass (thermostat name, data keys) as their listener context;
+        site-wide entities use None as the thermostat name. Listeners without
+        a context, and every listener when the update status flips, are
+        always notified.
+        """
+        if changed is None or self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not context[1].isdisjoint(changed.get(context[0], ())):
+                update_callback()
+
+    @callback
+    def _async_notify_changed(self, changed: dict[str | None, set[str]]) -> None:
+        """Notify the listeners of values changed outside of a poll."""
+        if changed:
+            self._async_notify_keys(changed)
+
+    @callback
+    def _async_notify_metrics(self) -> None:
+        """Notify the site diagnostic sensors that new metrics are recorded."""
+        self._async_notify_changed({None: {KEY_METRICS}})
+
+    def breaker(self, thermostat_name: str) -> CircuitBreaker:
+        """Return the circuit breaker of a thermostat."""
+        if thermostat_name not in self.breakers:
+            self.breakers[thermostat_name] = CircuitBreaker()
+        return self.breakers[thermostat_name]
+
+    def _allow_request(self, thermostat_name: str) -> bool:
+        """Return True if a request to a thermostat may be sent now."""
+        breaker = self.breaker(thermostat_name)
+        state = breaker.state
+        allowed = breaker.allow_request()
+        if breaker.state is not state:
+            self._async_notify_changed({thermostat_name: {KEY_BREAKER}})
+        return allowed
+
+    def _record_reachability(self, outcomes: dict[str, bool]) -> None:
+        """Feed request outcomes to the breakers and notify state changes."""
+        changed = {}
+        now = time.time()
+        for thermostat_name, success in outcomes.items():
+            breaker = self.breaker(thermostat_name)
+            state = breaker.state
+            if success:
+                breaker.record_success()
+                if self.journal.due(thermostat_name, now):
+                    self._async_replay(thermostat_name)
+            else:
+                breaker.record_failure()
+            if breaker.state is state:
+                continue
+            changed[thermostat_name] = {KEY_BREAKER}
+            if breaker.state is BreakerState.OPEN:
+                _LOGGER.warning(
+                    "%s is unreachable; pausing requests to it for %.0f seconds",
+                    thermostat_name,
+                    breaker.retry_in,
+                )
+            elif breaker.state is BreakerState.CLOSED:
+                _LOGGER.info("%s is reachable again", thermostat_name)
+        self._async_notify_changed(changed)
+
+    def _poll_outcomes(
+        self, result: dict[str, dict[str, Any]], value_list: list[str]
+    ) -> dict[str, bool]:
+        """Return which thermostats answered a poll with live values."""
+        # Unreachable units are still listed by the site, but without readings
+        live = VALUE_TEMPERATURE not in value_list
+        outcomes = {
+            thermostat_name: live or "temperature" in values
+            for thermostat_name, values in result.items()
+        }
+        for thermostat_name in self.data or {}:
+            outcomes.setdefault(thermostat_name, False)
+        if self.thermostat_name:
+            outcomes.setdefault(self.thermostat_name, False)
+        return outcomes
+
+    def _current_value(self, thermostat_name: str, value_type: str) -> Any:
+        """Return the last confirmed value of a writable API value.
+
+        Values left out of the latest poll and not read back since may have
+        been changed at the thermostat, so None is returned for them.
+        """
+        if not self.data or value_type not in WRITABLE_FIELDS:
+            return None
+        key = WRITABLE_FIELDS[value_type].key
+        if key not in self._confirmed.get(thermostat_name, ()):
+            return None
+        unconfirmed = self._unconfirmed.get(thermostat_name, {})
+        if key in unconfirmed:
+            return unconfirmed[key]
+        return self.data.get(thermostat_name, {}).get(key)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates; the values polled follow the listeners."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._polled_dirty = True
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            self._polled_dirty = True
+
+        return _remove_listener
+
+    def polled_values(self) -> frozenset[str] | None:
+        """Return the API values polled, or None when every value is polled."""
+        return self._polled
+
+    def _update_polled_values(self) -> frozenset[str] | None:
+        """Work out the API values to poll from the listeners, and return them.
+
+        Entities listen with the data keys they render, and disabled
+        entities are never added, so only enabled entities widen the poll.
+        Before any entity listens, or when a listener gives no keys,
+        everything is polled. Only the poll calls this.
+        """
+        if not self._polled_dirty:
+            return self._polled
+        self._polled_dirty = False
+        contexts = [context for _, context in self._listeners.values()]
+        polled: frozenset[str] | None = None
+        if contexts and None not in contexts:
+            keys = set(COORDINATOR_KEYS).union(*(data_keys for _, data_keys in contexts))
+            polled = frozenset(FIELDS_BY_KEY[key].tag for key in keys if key in FIELDS_BY_KEY)
+        if self._polled is not None and (polled is None or not polled <= self._polled):
+            # Newly enabled entities get their values on the next poll, not
+            # when their tier is next due
+            self.async_request_config_refresh()
+        if polled != self._polled:
+            _LOGGER.debug(
+                "Polling %s values", len(polled) if polled is not None else "all"
+            )
+        self._polled = polled
+        self._unpolled_keys = (
+            frozenset(key for key, field in FIELDS_BY_KEY.items() if field.tag not in polled)
+            if polled is not None
+            else frozenset()
+        )
+        return polled
+
+    def async_request_config_refresh(self) -> None:
+        """Fetch the configuration tier again on the next poll."""
+        self._config_fetched_at = None
+
+    def _due_tiers(self) -> list[str]:
+        """Return the refresh tiers to fetch on this poll."""
+        if not self.data or self._config_fetched_at is None:
+            return list(POLL_TIERS)
+        tiers = [TIER_TELEMETRY]
+        if self._poll_count % SETTINGS_POLL_EVERY == 0:
+            tiers.append(TIER_SETTINGS)
+        if time.monotonic() - self._config_fetched_at >= CONFIG_REFRESH_INTERVAL:
+            tiers.append(TIER_CONFIG)
+        return tiers
+
+    def _merge_tiers(
+        self, result: dict[str, dict[str, Any]], tiers: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Merge a partial poll into the previous snapshot.
+
+        Thermostats missing from the response keep their last known values.
+        Values no longer polled are dropped rather than kept at their last
+        reading, unless a write to them is still unconfirmed.
+        """
+        previous = self.data or {}
+        merged = dict(previous)
+        unpolled = self._unpolled_keys
+        for thermostat_name, values in result.items():
+            values = merged[thermostat_name] = {**previous.get(thermostat_name, {}), **values}
+            if not unpolled.isdisjoint(values):
+                unconfirmed = self._unconfirmed.get(thermostat_name, {})
+                for key in unpolled.intersection(values).difference(unconfirmed):
+                    del values[key]
+            if previous and thermostat_name not in previous:
+                self._new_thermostats.append(thermostat_name)
+        if len(tiers) < len(POLL_TIERS) and any(
+            thermostat_name not in previous for thermostat_name in result
+        ):
+            # A new thermostat appeared; fetch its slower tiers on the next poll
+            self.async_request_config_refresh()
+        return merged
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Wait for the shared scheduler to let a request through."""
+        if self.scheduler is not None:
+            await self.scheduler.acquire(priority)
+
+    def _poll_slot(
+        self, priority: RequestPriority
+    ) -> PollLimiter | contextlib.nullcontext[None]:
+        """Return the slot a request holds; only polls count against the site limit."""
+        if self.poll_group is None or priority is not RequestPriority.POLL:
+            return contextlib.nullcontext()
+        return self.poll_group.slot()
+
+    def _selected(self, result: dict[str, Any]) -> dict[str, Any]:
+        """Return the part of a site-wide response the entry covers."""
+        if self.thermostats is None:
+            return result
+        return {name: values for name, values in result.items() if name in self.thermostats}
+
+    def _selection(self, thermostat_name: str | None) -> str:
+        """Return the API selection for one thermostat, or for the whole site."""
+        return f"name:{thermostat_name};" if thermostat_name else ""
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Update data via API, sharing fetches between concurrent refreshes.
+
+        A refresh started while no fetch is running starts one. A refresh
+        started while a fetch is in flight waits for it to finish and then
+        shares a single follow-up fetch with every other refresh that
+        arrived in the meantime.
+        """
+        self.refresh_stats.requested += 1
+        if self._fetch_task is None:
+            return await asyncio.shield(self._async_start_fetch())
+        self.refresh_stats.joined += 1
+        if self._follow_up is None:
+            self._follow_up = self.hass.loop.create_future()
+        return await asyncio.shield(self._follow_up)
+
+    @callback
+    def _async_start_fetch(self) -> asyncio.Task[dict[str, dict[str, Any]]]:
+        """Start a fetch that concurrent refreshes can attach to."""
+        self.refresh_stats.fetched += 1
+        self._fetch_task = self.hass.async_create_background_task(
+            self._async_fetch_update(), f"{DOMAIN} refresh"
+        )
+        self._fetch_task.add_done_callback(self._async_fetch_done)
+        return self._fetch_task
+
+    @callback
+    def _async_fetch_done(self, task: asyncio.Task[dict[str, dict[str, Any]]]) -> None:
+        """Start the follow-up fetch, if one was requested."""
+        self._fetch_task = None
+        if not task.cancelled():
+            # Retrieved here so a fetch nobody waits for any more is not logged
+            task.exception()
+        follow_up, self._follow_up = self._follow_up, None
+        if follow_up is None:
+            return
+
+        def _resolve(next_task: asyncio.Task[dict[str, dict[str, Any]]]) -> None:
+            if follow_up.done():
+                return
+            if next_task.cancelled():
+                follow_up.cancel()
+            elif (err := next_task.exception()) is not None:
+                follow_up.set_exception(err)
+                follow_up.exception()  # waiters may all have been cancelled
+            else:
+                follow_up.set_result(next_task.result())
+
+        self._async_start_fetch().add_done_callback(_resolve)
+
+    async def _async_fetch_update(self) -> dict[str, dict[str, Any]]:
+        """Fetch the due tiers and merge them into a new snapshot."""
+        _LOGGER.debug("Polling thermostat data")
+        target = self.thermostat_name
+        if target and not self._allow_request(target):
+            _LOGGER.debug("Skipping poll of %s while it is unreachable", target)
+            return self.data or {}
         try:
-            async with asyncio.timeout(15):  # Increased timeout for offline thermostats
-                result = await self._fetch_thermostat_data()
-                _LOGGER.info("Successfully polled thermostat data")
-                return result
+            polled = self._update_polled_values()
+            tiers = self._due_tiers()
+            value_list = [
+                value
+                for tier in tiers
+                for value in POLL_TIERS[tier]
+                if polled is None or value in polled
+            ]
+            result = self._selected(await self._fetch_thermostat_data(value_list=value_list))
+            self._budget_exhausted = False
+            _LOGGER.debug("Successfully polled thermostat data (%s)", ", ".join(tiers))
+            self._poll_count += 1
+            self._record_reachability(self._poll_outcomes(result, value_list))
+            if TIER_CONFIG in tiers and result:
+                self._config_fetched_at = time.monotonic()
+            data = self._merge_tiers(self._overlay_unconfirmed(result), tiers)
+            self._confirmed = {name: set(values) for name, values in result.items()}
+            now = time.time()
+            live = [name for name, values in result.items() if "temperature" in values]
+            self.history.record(now, data, live)
+            if self.fleet is not None:
+                self.fleet.record(now, data, live)
+            # Runtimes grow while values stay the same, so they are notified
+            # here rather than through the snapshot diff
+            runtimes = self.runtime.update(now, data, live)
+            self._async_notify_changed(
+                {None: {KEY_METRICS}} | {name: {KEY_RUNTIME} for name in runtimes}
+            )
+            self._poll_diff = (data, diff_snapshots(self.data, data))
+            if result:
+                self.data_as_of = datetime.now(timezone.utc)
+                if self.stale:
+                    # Every entity drops its stale marker, even if no value
+                    # changed since the snapshot was saved
+                    self.stale = False
+                    self._poll_diff = (data, None)
+                    self.always_update = True
+                self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+            self.poll_scheduler.record_poll(
+                True, (values.get("run_status") for values in data.values())
+            )
+            self._apply_poll_interval()
+            return data
+        except RequestCancelled:
+            _LOGGER.debug("Queued poll dropped in favour of a write")
+            return self.data or {}
+        except BudgetExhausted:
+            if not self._budget_exhausted:
+                _LOGGER.warning("Daily request budget used up; polling resumes tomorrow")
+            self._budget_exhausted = True
+            return self.data or {}
         except asyncio.TimeoutError:
             _LOGGER.warning("Timeout fetching thermostat data (thermostat may be offline)")
+            if target:
+                self._record_reachability({target: False})
+            self.poll_scheduler.record_poll(False, ())
+            self._apply_poll_interval()
+            self._async_notify_metrics()
             # Return last known data instead of failing completely
             return self.data if self.data else {}
         except Exception as err:
+            # API and HTTP errors come from the cloud service, not from the
+            # thermostats, so they are kept away from the breakers
             _LOGGER.error("Error polling thermostat data: %s", err)
+            self.poll_scheduler.record_poll(False, ())
+            self._apply_poll_interval()
+            self._async_notify_metrics()
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    async def _fetch_thermostat_data(self) -> dict[str, Any]:
-        """Fetch thermostat data from API."""
-        # Get all data in a single request to improve performance
-        # Build comprehensive value list for all attributes
-        value_list = [
-            # Measurements
-            VALUE_TEMPERATURE, VALUE_HUMIDITY, VALUE_CO2_LEVEL, VALUE_RUN_STATUS,
-            # System and settings
-            "system", "heatSetting", "coolSetting", VALUE_SCHEDULE, VALUE_FAN,
-            # Status
-            VALUE_STATUS, VALUE_SET_BY, VALUE_FRONT_KEYPAD, VALUE_AUX_STATUS, VALUE_STATUS_DISPLAY,
-            # Humidity control
-            VALUE_HUMIDIFY_SETTING, VALUE_DEHUMIDIFY_SETTING, VALUE_HUMIDITY_CONTROL,
-            # CO2 control
-            VALUE_CO2_SETTING,
-            # System configuration
-            VALUE_HEAT_STAGES, VALUE_COOL_STAGES, VALUE_FAN_STAGES, VALUE_SYSTEM_TYPE,
-            VALUE_TEMPERATURE_FORMAT, VALUE_CYCLE_RATE, VALUE_ANTICIPATION_DEGREES, VALUE_CALIBRATION_OFFSET,
-            # Temperature limits
-            VALUE_MIN_HEAT_SETTING, VALUE_MAX_HEAT_SETTING, VALUE_MIN_COOL_SETTING, VALUE_MAX_COOL_SETTING,
-            VALUE_MIN_SAFE_TEMP, VALUE_MAX_SAFE_TEMP,
-            # Device info
-            VALUE_SERIAL_NO, VALUE_GATEWAY, VALUE_VERSION, VALUE_INSTALL_DATE,
-            # Notification settings
-            VALUE_NOTIFICATION_SENSITIVITY, VALUE_NOTIFICATION_SETPOINT, VALUE_NOTIFICATION_UNREACHABLE,
-        ]
+    async def _fetch_thermostat_data(
+        self,
+        thermostat_name: str | None = None,
+        value_list: list[str] | None = None,
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch data for every thermostat of the site, or only some values of one.
+
+        Raises PelicanParseError when the API reports an error or the
+        response cannot be parsed.
+        """
+        if value_list is None:
+            value_list = ALL_VALUES
+        elif VALUE_NAME not in value_list:
+            value_list = [VALUE_NAME, *value_list]
         
         params = {
             API_USERNAME: self.username,
             API_PASSWORD: self.password,
             API_REQUEST: REQUEST_GET,
             API_OBJECT: OBJECT_THERMOSTAT,
-            API_SELECTION: f"name:{self.thermostat_name};",
+            API_SELECTION: self._selection(thermostat_name or self.thermostat_name),
             API_VALUE: ";".join(value_list),
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.base_url, params=params) as response:
-                response.raise_for_status()
-                data = await response.text()
-                _LOGGER.debug("API response: %s", data)
-                
-                result = self._parse_thermostat_data(data)
-                
-                return result
-
-    def _parse_thermostat_data(self, data: str) -> dict[str, Any]:
-        """Parse thermostat data from API response."""
+        await self._async_acquire(priority)
+        trace = RequestTrace(self.metrics)
         try:
-            root = ET.fromstring(data)
-            
-            # Check if the request was successful
-            success_elem = root.find("success")
-            if success_elem is None or success_elem.text != "1":
-                _LOGGER.error("API request was not successful")
-                return {}
-            
-            # Parse thermostat data
-            thermostat_elem = root.find("Thermostat")
-            if thermostat_elem is None:
-                _LOGGER.error("No thermostat data found in response")
-                return {}
-            
-            result = {}
-            
-            # Helper function to parse elements
-            def parse_float(tag: str, key: str = None) -> None:
-                key = key or tag.replace("_", "_").lower()
-                elem = thermostat_elem.find(tag)
-                if elem is not None and elem.text:
-                    try:
-                        result[key] = float(elem.text)
-                    except ValueError:
-                        _LOGGER.warning("Invalid %s value: %s", tag, elem.text)
-            
-            def parse_int(tag: str, key: str = None) -> None:
-                key = key or tag.replace("_", "_").lower()
-                elem = thermostat_elem.find(tag)
-                if elem is not None and elem.text:
-                    try:
-                        result[key] = int(elem.text)
-                    except ValueError:
-                        _LOGGER.warning("Invalid %s value: %s", tag, elem.text)
-            
-            def parse_string(tag: str, key: str = None) -> None:
-                key = key or tag.replace("_", "_").lower()
-                elem = thermostat_elem.find(tag)
-                result[key] = elem.text if elem is not None and elem.text else None
-            
-            # Parse measurements
-            parse_float("temperature")
-            parse_float("humidity")
-            parse_int("co2Level", "co2_level")
-            parse_string("runStatus", "run_status")
-            
-            # Parse system and settings
-            parse_string("system", "system_mode")
-            parse_float("heatSetting", "heat_setting")
-            parse_float("coolSetting", "cool_setting")
-            parse_string("schedule")
-            parse_string("fan", "fan_mode")
-            
-            # Parse status
-            parse_string("status")
-            parse_string("setBy", "set_by")
-            parse_string("frontKeypad", "front_keypad")
-            parse_string("auxStatus", "aux_status")
-            parse_string("statusDisplay", "status_display")
-            
-            # Parse humidity control
-            parse_int("humidifySetting", "humidify_setting")
-            parse_int("dehumidifySetting", "dehumidify_setting")
-            parse_string("humidityControl", "humidity_control")
-            
-            # Parse CO2 control
-            parse_int("co2Setting", "co2_setting")
-            
-            # Parse system configuration
-            parse_int("heatStages", "heat_stages")
-            parse_int("coolStages", "cool_stages")
-            parse_int("fanStages", "fan_stages")
-            parse_string("systemType", "system_type")
-            parse_string("temperatureFormat", "temperature_format")
-            parse_int("cycleRate", "cycle_rate")
-            parse_float("anticipationDegrees", "anticipation_degrees")
-            parse_float("calibrationOffset", "calibration_offset")
-            
-            # Parse temperature limits
-            parse_int("minHeatSetting", "min_heat_setting")
-            parse_int("maxHeatSetting", "max_heat_setting")
-            parse_int("minCoolSetting", "min_cool_setting")
-            parse_int("maxCoolSetting", "max_cool_setting")
-            parse_int("minSafeTemp", "min_safe_temp")
-            parse_int("maxSafeTemp", "max_safe_temp")
-            
-            # Parse device info
-            parse_string("serialNo", "serial_no")
-            parse_string("gateway")
-            parse_string("version")
-            parse_string("installDate", "install_date")
-            
-            # Parse notification settings
-            parse_string("notificationSensitivity", "notification_sensitivity")
-            parse_int("notificationSetpoint", "notification_setpoint")
-            parse_string("notificationUnreachable", "notification_unreachable")
-            
-            return result
-            
-        except ET.ParseError as err:
-            _LOGGER.error("Failed to parse XML response: %s", err)
-            return {}
+            async with self._poll_slot(priority), asyncio.timeout(15):  # Increased timeout for offline thermostats
+                async with self.session.get(
+                    self.base_url, params=params, trace_request_ctx=trace
+                ) as response:
+                    response.raise_for_status()
+                    # Parse the body as it streams in rather than after it has arrived
+                    parser = create_parser(self.thermostat_name)
+                    size = 0
+                    parse_time = 0.0
+                    async for chunk in response.content.iter_chunked(PARSE_CHUNK_SIZE):
+                        size += len(chunk)
+                        start = time.perf_counter()
+                        parser.feed(chunk)
+                        parse_time += time.perf_counter() - start
+                    start = time.perf_counter()
+                    result = parser.close()
+                    parse_time += time.perf_counter() - start
         except Exception as err:
-            _LOGGER.error("Error parsing thermostat data: %s", err)
+            self.metrics.record_failure(REQUEST_GET, err)
+            raise
+        trace.finish_get(size, parse_time)
+        _LOGGER.debug("Parsed %d thermostats from %d bytes", len(result), size)
+        return result
+
+    async def async_write(self, thermostat_name: str, values: dict[str, str]) -> bool:
+        """Apply writes optimistically and send them in the background.
+
+        Concurrent writes to the same thermostat share one SET, which is then
+        confirmed with a GET limited to the written values.
+        """
+        self._apply_optimistic(thermostat_name, values)
+        self._start_poll_burst()
+        # Journaled first, so a newer value replaces one still waiting for replay
+        self._journal_writes([thermostat_name], values)
+        self.hass.async_create_background_task(
+            self._write_queue(thermostat_name).async_write(values),
+            f"pelican_thermostat write {thermostat_name}",
+        )
+        return True
+
+    def _write_queue(self, thermostat_name: str) -> PelicanWriteQueue:
+        """Return the write queue of a thermostat."""
+        if thermostat_name not in self._write_queues:
+            self._write_queues[thermostat_name] = PelicanWriteQueue(
+                self.hass,
+                thermostat_name,
+                self._async_set_and_confirm,
+                self._current_value,
+                self._settle_dropped,
+            )
+        return self._write_queues[thermostat_name]
+
+    def pending_writes(self, thermostat_name: str) -> dict[str, Any]:
+        """Return the journaled values of a thermostat, keyed by data key."""
+        pending = self.journal.get(thermostat_name)
+        if pending is None:
             return {}
-            
-    async def set_system_mode(self, mode: str) -> bool:
-        """Set the system mode."""
-        return await self._set_thermostat_value("system", mode)
+        writes = {}
+        for value_type, value in pending.values.items():
+            field = WRITABLE_FIELDS.get(value_type)
+            if field is None:
+                continue
+            try:
+                writes[field.key] = field.convert(value)
+            except ValueError:
+                writes[field.key] = value
+        return writes
+
+    def _async_notify_pending(self, thermostat_names: list[str], values: dict[str, str]) -> None:
+        """Notify the entities showing values whose pending state changed."""
+        keys = {WRITABLE_FIELDS[tag].key for tag in values if tag in WRITABLE_FIELDS}
+        if keys:
+            self._async_notify_changed(dict.fromkeys(thermostat_names, keys))
+
+    def _journal_writes(self, thermostat_names: list[str], values: dict[str, str]) -> None:
+        """Record writes in the journal before they are sent."""
+        for thermostat_name in thermostat_names:
+            self.journal.record(thermostat_name, values)
+        self._async_notify_pending(thermostat_names, values)
+
+    async def _async_deliver(
+        self, thermostat_names: list[str], values: dict[str, str], site_wide: bool = False
+    ) -> bool | None:
+        """Send one SET of journaled values to a thermostat, or to the whole site.
+
+        Returns whether the API took the values, and None when the SET may not
+        have arrived; the values then stay journaled and are replayed with
+        backoff once the thermostat responds again.
+        """
+        try:
+            sent = await self._set_thermostat_values(
+                None if site_wide else thermostat_names[0], values
+            )
+        except WriteUndelivered:
+            for thermostat_name in thermostat_names:
+                backoff = self.journal.defer(thermostat_name)
+                _LOGGER.info(
+                    "Keeping writes to %s; retrying once it responds, in %.0f seconds at the earliest",
+                    thermostat_name,
+                    backoff,
+                )
+            return None
+        # Answered either way; a rejected write is not retried
+        for thermostat_name in thermostat_names:
+            self.journal.discard(thermostat_name, values)
+        self._async_notify_pending(thermostat_names, values)
+        return sent
+
+    @callback
+    def _async_replay(self, thermostat_name: str) -> None:
+        """Replay the journaled writes of a thermostat that responds again."""
+        pending = self.journal.get(thermostat_name)
+        if pending is None or thermostat_name in self._replaying:
+            return
+        values = dict(pending.values)
+        if time.time() - pending.queued_at > WRITE_PENDING_MAX_AGE:
+            _LOGGER.warning(
+                "Dropping writes to %s queued too long ago to replay: %s", thermostat_name, values
+            )
+            self.journal.discard(thermostat_name)
+            self._async_notify_pending([thermostat_name], values)
+            return
+        self._replaying.add(thermostat_name)
+        # Applied now, so a poll being merged keeps the values as unconfirmed
+        self._apply_optimistic(thermostat_name, values)
+        self.hass.async_create_background_task(
+            self._async_replay_writes(thermostat_name, values),
+            f"pelican_thermostat replay {thermostat_name}",
+        )
+
+    async def _async_replay_writes(self, thermostat_name: str, values: dict[str, str]) -> None:
+        """Send journaled writes again through the thermostat's write queue."""
+        _LOGGER.info("Replaying writes to %s: %s", thermostat_name, values)
+        try:
+            await self._write_queue(thermostat_name).async_write(values)
+        except Exception as err:  # noqa: BLE001 - kept journaled for the next replay
+            _LOGGER.debug("Could not replay writes to %s: %s", thermostat_name, err)
+        finally:
+            self._replaying.discard(thermostat_name)
+
+    def _start_poll_burst(self) -> None:
+        """Switch to fast polling right away after a user write."""
+        previous = self.update_interval
+        self.poll_scheduler.record_write()
+        self._apply_poll_interval()
+        if self.update_interval != previous and self._listeners:
+            # Replace the pending slow poll with one at the burst interval
+            self._schedule_refresh()
+
+    def _apply_optimistic(self, thermostat_name: str, values: dict[str, str]) -> None:
+        """Show written values right away, remembering the confirmed ones."""
+        if not self.data or thermostat_name not in self.data:
+            return
+        data = self.data[thermostat_name]
+        unconfirmed = self._unconfirmed.setdefault(thermostat_name, {})
+        changed = set()
+        for value_type, value in values.items():
+            field = WRITABLE_FIELDS.get(value_type)
+            if field is None:
+                continue
+            key = field.key
+            unconfirmed.setdefault(key, data.get(key))
+            try:
+                new_value = field.convert(value)
+            except ValueError:
+                new_value = value
+            if data.get(key) != new_value:
+                data[key] = new_value
+                changed.add(key)
+        self._async_notify_changed({thermostat_name: changed} if changed else {})
+
+    def _settle_values(
+        self, thermostat_name: str, values: dict[str, str], actual: dict[str, Any] | None
+    ) -> list[str]:
+        """Settle optimistic values once a write has been answered.
+
+        ``actual`` holds the values read back from the thermostat; when it is
+        None the confirmed values are restored. Returns the keys whose
+        optimistic value turned out to be wrong.
+        """
+        data = self.data.get(thermostat_name) if self.data else None
+        unconfirmed = self._unconfirmed.get(thermostat_name, {})
+        if data is None:
+            return []
+
+        mismatched = []
+        for value_type, value in values.items():
+            if value_type not in WRITABLE_FIELDS:
+                continue
+            key = WRITABLE_FIELDS[value_type].key
+            if key not in unconfirmed or not values_match(data.get(key), value):
+                # A newer write to this key is still in flight
+                continue
+            confirmed = unconfirmed.pop(key)
+            if actual is None:
+                data[key] = confirmed
+                mismatched.append(key)
+            elif key in actual:
+                data[key] = actual[key]
+                self._confirmed.setdefault(thermostat_name, set()).add(key)
+                if not values_match(actual[key], value):
+                    mismatched.append(key)
+        if not unconfirmed:
+            self._unconfirmed.pop(thermostat_name, None)
+        self._async_notify_changed({thermostat_name: set(mismatched)} if mismatched else {})
+        return mismatched
+
+    def _settle_dropped(self, thermostat_name: str, values: dict[str, str]) -> None:
+        """Settle writes the queue dropped because they matched the confirmed value."""
+        self.journal.discard(thermostat_name, values)
+        self._async_notify_pending([thermostat_name], values)
+        actual = {
+            WRITABLE_FIELDS[value_type].key: self._current_value(thermostat_name, value_type)
+            for value_type in values
+            if value_type in WRITABLE_FIELDS
+        }
+        self._settle_values(thermostat_name, values, actual)
+
+    def _overlay_unconfirmed(
+        self, result: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Keep optimistic values that a poll raced ahead of."""
+        for thermostat_name, unconfirmed in self._unconfirmed.items():
+            if thermostat_name not in result or not self.data:
+                continue
+            values = result[thermostat_name]
+            current = self.data.get(thermostat_name, {})
+            for key in unconfirmed:
+                if key in values:
+                    # The poll is the newest confirmed value for a rollback
+                    unconfirmed[key] = values[key]
+                    values[key] = current.get(key)
+        return result
+
+    async def _async_set_and_confirm(
+        self, thermostat_name: str, values: dict[str, str]
+    ) -> bool:
+        """Send one SET, then read back only the written values."""
+        sent = await self._async_deliver([thermostat_name], values)
+        if sent is None:
+            # Shown as pending rather than as the new value until replayed
+            self._settle_values(thermostat_name, values, None)
+            return False
+        if not sent:
+            mismatched = self._settle_values(thermostat_name, values, None)
+            self._notify_write_failed(thermostat_name, mismatched)
+            return False
+
+        value_list = list(values)
+        try:
+            result = await self._fetch_thermostat_data(
+                thermostat_name, value_list, RequestPriority.CONFIRM
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Timeout confirming write to %s", thermostat_name)
+            self._record_reachability({thermostat_name: False})
+            return True
+        except Exception as err:  # noqa: BLE001 - the next poll confirms instead
+            _LOGGER.debug("Could not confirm write to %s: %s", thermostat_name, err)
+            return True
+        self._record_reachability({thermostat_name: thermostat_name in result})
 
-    async def set_heat_setting(self, temperature: float) -> bool:
-        """Set the heating setpoint."""
-        return await self._set_thermostat_value("heatSetting", str(temperature))
+        actual = result.get(thermostat_name, {})
+        keys = [
+            WRITABLE_FIELDS[value_type].key
+            for value_type in value_list
+            if value_type in WRITABLE_FIELDS
+        ]
+        actual = {key: actual.get(key) for key in keys}
+        if mismatched := self._settle_values(thermostat_name, values, actual):
+            self._notify_write_failed(thermostat_name, mismatched)
+            return False
+        return True
 
-    async def set_cool_setting(self, temperature: float) -> bool:
-        """Set the cooling setpoint."""
-        return await self._set_thermostat_value("coolSetting", str(temperature))
+    def _notify_write_failed(self, thermostat_name: str, keys: list[str]) -> None:
+        """Raise a persistent notification for a write that did not stick."""
+        if not keys:
+            return
+        _LOGGER.warning("Write to %s was not applied for: %s", thermostat_name, keys)
+        persistent_notification.async_create(
+            self.hass,
+            f"The thermostat **{thermostat_name}** did not accept the new value for "
+            f"{', '.join(keys)}. The previous value has been restored.",
+            title="Pelican Thermostat",
+            notification_id=f"{DOMAIN}_write_{thermostat_name}",
+        )
 
-    async def set_fan_mode(self, mode: str) -> bool:
-        """Set the fan mode (Auto/On)."""
-        return await self._set_thermostat_value("fan", mode)
+    async def async_set_values(self, thermostat_name: str, values: dict[str, Any]) -> bool:
+        """Write values, keyed by data key, to one thermostat."""
+        return await self.async_write(thermostat_name, self._format_writes(values))
 
-    async def set_schedule(self, value: str) -> bool:
-        """Set the schedule (On/Off or schedule name)."""
-        return await self._set_thermostat_value("schedule", value)
+    def _format_writes(self, values: dict[str, Any]) -> dict[str, str]:
+        """Return values keyed by data key as SET values keyed by API tag."""
+        writes = {}
+        for key, value in values.items():
+            field = FIELDS_BY_KEY.get(key)
+            if field is None or not field.writable:
+                raise ValueError(f"{key} is not a writable thermostat value")
+            writes[field.tag] = field.format_value(value)
+        return writes
 
-    async def set_keypad(self, value: str) -> bool:
-        """Set the front keypad status (On/Off)."""
-        return await self._set_thermostat_value("frontKeypad", value)
+    async def async_bulk_set(
+        self, thermostat_names: list[str], values: dict[str, Any]
+    ) -> dict[str, bool]:
+        """Write the same values, keyed by data key, to many thermostats.
 
-    async def set_humidify_setting(self, value: int) -> bool:
-        """Set the humidify setpoint."""
-        return await self._set_thermostat_value("humidifySetting", str(value))
+        When the targets are every thermostat of the site, one SET with the
+        site-wide selection covers them all. The API has no selection for a
+        list of names, so other target sets get one SET per thermostat, at
+        most BULK_WRITE_CONCURRENCY at a time. Either way the writes are then
+        confirmed with a single GET limited to the written values. Returns
+        whether each thermostat took the values.
+        """
+        writes = self._format_writes(values)
+        thermostat_names = list(dict.fromkeys(thermostat_names))
+        for thermostat_name in thermostat_names:
+            self._apply_optimistic(thermostat_name, writes)
+        self._start_poll_burst()
+        self._journal_writes(thermostat_names, writes)
 
-    async def set_dehumidify_setting(self, value: int) -> bool:
-        """Set the dehumidify setpoint."""
-        return await self._set_thermostat_value("dehumidifySetting", str(value))
+        if (
+            not self.thermostat_name
+            and self.thermostats is None
+            and len(thermostat_names) > 1
+            and self.data
+            and set(thermostat_names) >= set(self.data)
+        ):
+            sent = dict.fromkeys(
+                thermostat_names,
+                await self._async_deliver(thermostat_names, writes, site_wide=True),
+            )
+        else:
+            semaphore = asyncio.Semaphore(BULK_WRITE_CONCURRENCY)
 
-    async def set_co2_setting(self, value: int) -> bool:
-        """Set the CO2 setpoint."""
-        return await self._set_thermostat_value("co2Setting", str(value))
+            async def _async_set(thermostat_name: str) -> bool | None:
+                async with semaphore:
+                    return await self._async_deliver([thermostat_name], writes)
 
-    async def set_min_heat_setting(self, value: int) -> bool:
-        """Set the minimum heat setting."""
-        return await self._set_thermostat_value("minHeatSetting", str(value))
+            sent = dict(
+                zip(
+                    thermostat_names,
+                    await asyncio.gather(*map(_async_set, thermostat_names)),
+                )
+            )
+        return await self._async_confirm_bulk(writes, sent)
 
-    async def set_max_heat_setting(self, value: int) -> bool:
-        """Set the maximum heat setting."""
-        return await self._set_thermostat_value("maxHeatSetting", str(value))
+    async def _async_confirm_bulk(
+        self, values: dict[str, str], sent: dict[str, bool | None]
+    ) -> dict[str, bool]:
+        """Read back a bulk write with one GET and settle every thermostat.
 
-    async def set_min_cool_setting(self, value: int) -> bool:
-        """Set the minimum cool setting."""
-        return await self._set_thermostat_value("minCoolSetting", str(value))
+        Writes that did not arrive stay journaled and count as not taken.
+        """
+        results = {}
+        for thermostat_name in [name for name, success in sent.items() if not success]:
+            mismatched = self._settle_values(thermostat_name, values, None)
+            if sent[thermostat_name] is not None:
+                self._notify_write_failed(thermostat_name, mismatched)
+            results[thermostat_name] = False
+        confirm = [name for name, success in sent.items() if success]
+        if not confirm:
+            return results
 
-    async def set_max_cool_setting(self, value: int) -> bool:
-        """Set the maximum cool setting."""
-        return await self._set_thermostat_value("maxCoolSetting", str(value))
+        value_list = list(values)
+        try:
+            # A site entry reads every thermostat back in one request
+            result = await self._fetch_thermostat_data(
+                confirm[0] if len(confirm) == 1 else None,
+                value_list,
+                RequestPriority.CONFIRM,
+            )
+        except Exception as err:  # noqa: BLE001 - the next poll confirms instead
+            _LOGGER.debug("Could not confirm bulk write: %s", err)
+            results.update(dict.fromkeys(confirm, True))
+            return results
+        self._record_reachability({name: name in result for name in confirm})
+
+        keys = [
+            WRITABLE_FIELDS[value_type].key
+            for value_type in value_list
+            if value_type in WRITABLE_FIELDS
+        ]
+        for thermostat_name in confirm:
+            actual = result.get(thermostat_name, {})
+            actual = {key: actual.get(key) for key in keys}
+            mismatched = self._settle_values(thermostat_name, values, actual)
+            self._notify_write_failed(thermostat_name, mismatched)
+            results[thermostat_name] = not mismatched
+        return results
 
-    async def _set_thermostat_value(self, value_type: str, value: str) -> bool:
-        """Set a thermostat value via API."""
+    async def async_fleet_report(
+        self, names: list[str], hours: float, co2_limit: float
+    ) -> list[dict[str, Any]]:
+        """Return the fleet diagnostics of some thermostats over the last hours.
+
+        The window is copied here and analyzed in the executor, so polls
+        keep recording while the report is computed.
+        """
+        if self.fleet is None:
+            raise HomeAssistantError("The fleet report needs numpy, which is not installed")
+        window = self.fleet.window(names, hours * 3600, time.time())
+        return await self.hass.async_add_executor_job(analyze_fleet, window, co2_limit)
+
+    async def async_load_schedules(self) -> None:
+        """Restore the schedules cached by the last run."""
+        if stored := await self._schedule_store.async_load():
+            self.schedules.restore(stored)
+
+    async def _fetch_schedules(
+        self, thermostat_name: str | None, priority: RequestPriority
+    ) -> dict[str, Week]:
+        """Download the weekly schedules of one thermostat, or of the whole site."""
+        params = {
+            API_USERNAME: self.username,
+            API_PASSWORD: self.password,
+            API_REQUEST: REQUEST_GET,
+            API_OBJECT: OBJECT_THERMOSTAT_SCHEDULE,
+            API_SELECTION: self._selection(thermostat_name or self.thermostat_name),
+            API_VALUE: ";".join(SCHEDULE_VALUE_LIST),
+        }
+        await self._async_acquire(priority)
+        try:
+            async with asyncio.timeout(15):
+                async with self.session.get(self.base_url, params=params) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            result = parse_schedule_response(body, self.thermostat_name)
+        except Exception as err:
+            self.metrics.record_failure(REQUEST_GET, err)
+            raise
+        self.metrics.record_success(REQUEST_GET)
+        return result
+
+    async def _async_download_schedules(
+        self,
+        thermostat_name: str | None = None,
+        priority: RequestPriority = RequestPriority.CONFIRM,
+    ) -> None:
+        """Download schedules into the cache; None downloads the whole site."""
+        result = self._selected(await self._fetch_schedules(thermostat_name, priority))
+        now = time.time()
+        # Thermostats left out of the response have no schedule entries
+        names = [thermostat_name] if thermostat_name else [*self.thermostat_names, *result]
+        changed = [
+            name
+            for name in dict.fromkeys(names)
+            if self.schedules.update(name, result.get(name, {}), now)
+        ]
+        _LOGGER.debug("Downloaded %d schedules, %d changed", len(names), len(changed))
+        self._schedule_store.async_delay_save(self.schedules.as_dict, SNAPSHOT_SAVE_DELAY)
+
+    async def _async_cached_schedule(self, thermostat_name: str, refresh: bool) -> CachedSchedule:
+        """Return a cached schedule, downloading it first if needed."""
+        cached = self.schedules.get(thermostat_name)
+        if cached is None:
+            # A site-wide download caches every thermostat in one request
+            await self._async_download_schedules()
+        elif refresh:
+            await self._async_download_schedules(thermostat_name)
+        return self.schedules.get(thermostat_name) or CachedSchedule({}, time.time())
+
+    async def async_get_schedule(self, thermostat_name: str, refresh: bool = False) -> CachedSchedule:
+        """Return the weekly schedule of a thermostat.
+
+        The schedule is downloaded only when not cached yet, or when refresh
+        is requested.
+        """
+        async with self._schedule_lock:
+            return await self._async_cached_schedule(thermostat_name, refresh)
+
+    async def async_set_schedule(
+        self, thermostat_name: str, days: dict[str, list[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Replace some days of a thermostat's schedule, uploading only the changes.
+
+        The new days are diffed against the cached schedule and only the
+        periods and values that differ are sent, one SET per period.
+        """
+        async with self._schedule_lock:
+            cached = await self._async_cached_schedule(thermostat_name, False)
+            new_days = merge_days(cached.days, days)
+            changes = diff_schedule(cached.days, new_days)
+            sent = 0
+            for change in changes:
+                try:
+                    delivered = await self._async_send_set(
+                        OBJECT_THERMOSTAT_SCHEDULE,
+                        thermostat_name,
+                        f"{self._selection(thermostat_name)}{change.selection}",
+                        change.value,
+                    )
+                except WriteUndelivered:
+                    delivered = False
+                if not delivered:
+                    # Part of the upload may have been applied; download it again next time
+                    self.schedules.invalidate(thermostat_name)
+                    break
+                sent += 1
+            if changes:
+                if sent == len(changes):
+                    self.schedules.update(thermostat_name, new_days, time.time())
+                self._schedule_store.async_delay_save(self.schedules.as_dict, SNAPSHOT_SAVE_DELAY)
+            cached = self.schedules.get(thermostat_name)
+            return {
+                "success": sent == len(changes),
+                "changes": len(changes),
+                "sent": sent,
+                "hash": cached.content_hash if cached else None,
+            }
+
+    async def async_refresh_stale_schedules(self, now: datetime | None = None) -> None:
+        """Download again the cached schedules older than the refresh interval."""
+        cutoff = time.time() - SCHEDULE_REFRESH_INTERVAL
+        stale = [
+            thermostat_name
+            for thermostat_name, cached in self.schedules.thermostats.items()
+            if cached.fetched_at < cutoff
+        ]
+        if not stale:
+            return
+        async with self._schedule_lock:
+            try:
+                await self._async_download_schedules(
+                    stale[0] if len(stale) == 1 else None, RequestPriority.POLL
+                )
+            except (BudgetExhausted, RequestCancelled):
+                return
+            except Exception as err:  # noqa: BLE001 - retried at the next check
+                _LOGGER.debug("Could not refresh schedules: %s", err)
+
+    async def _set_thermostat_values(
+        self, thermostat_name: str | None, values: dict[str, str]
+    ) -> bool:
+        """Set values on one thermostat, or on the whole site, via a single API request."""
+        value = ";".join(f"{value_type}:{item}" for value_type, item in values.items())
+        return await self._async_send_set(
+            OBJECT_THERMOSTAT, thermostat_name, self._selection(thermostat_name), value
+        )
+
+    async def _async_send_set(
+        self, object_type: str, thermostat_name: str | None, selection: str, value: str
+    ) -> bool:
+        """Send one SET request; thermostat_name is None for the whole site.
+
+        Returns whether the API took the values, False only when it answered
+        with <success>0</success>. Raises WriteUndelivered when the request
+        may not have reached the thermostat or the answer could not be read.
+        """
         params = {
             API_USERNAME: self.username,
             API_PASSWORD: self.password,
             API_REQUEST: REQUEST_SET,
-            API_OBJECT: OBJECT_THERMOSTAT,
-            API_SELECTION: f"name:{self.thermostat_name};",
-            API_VALUE: f"{value_type}:{value}",
+            API_OBJECT: object_type,
+            API_SELECTION: selection,
+            API_VALUE: value,
         }
+        target = thermostat_name or "every thermostat"
+        if thermostat_name and not self._allow_request(thermostat_name):
+            _LOGGER.warning("Not setting %s on %s: thermostat is unreachable", value, thermostat_name)
+            raise WriteUndelivered(f"{thermostat_name} is unreachable")
 
+        await self._async_acquire(RequestPriority.WRITE)
+        trace = RequestTrace(self.metrics)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=20)) as response:
-                    response.raise_for_status()
-                    response_text = await response.text()
-                    _LOGGER.debug("Set value response: %s", response_text)
-                    
-                    # Parse the response to check if it was successful
-                    try:
-                        root = ET.fromstring(response_text)
-                        success_elem = root.find("success")
-                        if success_elem is not None and success_elem.text == "1":
-                            _LOGGER.info("Successfully set %s to %s", value_type, value)
-                            return True
-                        else:
-                            _LOGGER.error("Failed to set %s to %s", value_type, value)
-                            return False
-                    except ET.ParseError:
-                        _LOGGER.warning("Could not parse SET response, assuming success")
+            async with self.session.get(self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=20), trace_request_ctx=trace) as response:
+                response.raise_for_status()
+                response_text = await response.text()
+                trace.finish_set()
+                _LOGGER.debug("Set value response: %s", response_text)
+                if thermostat_name:
+                    self._record_reachability({thermostat_name: True})
+                
+                # Parse the response to check if it was successful
+                try:
+                    root = ET.fromstring(response_text)
+                    success_elem = root.find("success")
+                    if success_elem is None:
+                        raise ET.ParseError("Response has no success element")
+                    if success_elem.text == "1":
+                        _LOGGER.info("Successfully set %s on %s", value, target)
+                        self.metrics.record_success(REQUEST_SET)
                         return True
-                        
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Timeout setting %s to %s (thermostat may be offline or disconnected)", value_type, value)
-            return True  # Assume success for timeouts - thermostat may be offline
+                    else:
+                        _LOGGER.error("Failed to set %s on %s", value, target)
+                        self.metrics.record_failure(REQUEST_SET, OUTCOME_REJECTED)
+                        return False
+                except ET.ParseError as err:
+                    # Whether the values were taken is unknown; replaying them is harmless
+                    _LOGGER.warning("Could not parse SET response for %s on %s", value, target)
+                    self.metrics.record_failure(REQUEST_SET, err)
+                    raise WriteUndelivered(
+                        f"Unreadable response setting {value} on {target}"
+                    ) from err
+
+        except WriteUndelivered:
+            raise
+        except asyncio.TimeoutError as err:
+            _LOGGER.warning("Timeout setting %s on %s (thermostat may be offline or disconnected)", value, target)
+            self.metrics.record_failure(REQUEST_SET, err)
+            if thermostat_name:
+                self._record_reachability({thermostat_name: False})
+            raise WriteUndelivered(f"Timeout setting {value} on {target}") from err
+        except aiohttp.ClientError as err:
+            # Connection and HTTP errors are the cloud service's, so the
+            # thermostat's breaker is left alone
+            _LOGGER.error("Error setting %s on %s: %s", value, target, err)
+            self.metrics.record_failure(REQUEST_SET, err)
+            raise WriteUndelivered(f"Error setting {value} on {target}: {err}") from err
         except Exception as err:
-            _LOGGER.error("Error setting thermostat value %s to %s: %s", value_type, value, err)
-            return False 
\ No newline at end of file
+            _LOGGER.error("Error setting %s on %s: %s", value, target, err)
+            self.metrics.record_failure(REQUEST_SET, err)
+            raise WriteUndelivered(f"Error setting {value} on {target}: {err}") from err 
\ No newline at end of file
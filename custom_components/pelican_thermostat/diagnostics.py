@@ -0,0 +1,105 @@
+"""Diagnostics support for Pelican Thermostat."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .coordinator import PelicanThermostatCoordinator
+from .scheduler import RequestScheduler
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "serial_no"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: PelicanThermostatCoordinator = hass.data[DOMAIN][entry.entry_id]
+    refresh_stats = coordinator.refresh_stats
+    polled = coordinator.polled_values()
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "poll_phase": (
+                coordinator.poll_group.phase(entry.entry_id) if coordinator.poll_group else None
+            ),
+            "max_concurrent_polls": (
+                coordinator.poll_group.limit if coordinator.poll_group else None
+            ),
+            "polled_values": sorted(polled) if polled is not None else None,
+            "last_update_success": coordinator.last_update_success,
+            "stale": coordinator.stale,
+            "data_as_of": coordinator.data_as_of.isoformat() if coordinator.data_as_of else None,
+            "refresh": {
+                "requested": refresh_stats.requested,
+                "fetched": refresh_stats.fetched,
+                "joined": refresh_stats.joined,
+                "saved": refresh_stats.saved,
+            },
+        },
+        "breakers": {
+            thermostat_name: {
+                "state": breaker.state.value,
+                "consecutive_failures": breaker.failures,
+                "retry_in": breaker.retry_in,
+            }
+            for thermostat_name, breaker in coordinator.breakers.items()
+        },
+        "pending_writes": {
+            thermostat_name: {
+                "values": pending.values,
+                "attempts": pending.attempts,
+                "queued_at": pending.queued_at,
+                "retry_at": pending.retry_at,
+            }
+            for thermostat_name, pending in coordinator.journal.pending.items()
+        },
+        "scheduler": _scheduler_diagnostics(coordinator.scheduler),
+        "history": {
+            "retention": coordinator.history.retention,
+            "capacity": coordinator.history.capacity,
+            "samples": {
+                thermostat_name: len(history)
+                for thermostat_name, history in coordinator.history.thermostats.items()
+            },
+            "bytes": coordinator.history.nbytes,
+        },
+        "fleet": (
+            {
+                "thermostats": len(coordinator.fleet.rows),
+                "bins": coordinator.fleet.columns,
+                "bytes": coordinator.fleet.nbytes,
+            }
+            if coordinator.fleet is not None
+            else None
+        ),
+        "schedules": {
+            thermostat_name: {"hash": cached.content_hash, "fetched_at": cached.fetched_at}
+            for thermostat_name, cached in coordinator.schedules.thermostats.items()
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "data": async_redact_data(coordinator.data or {}, TO_REDACT),
+    }
+
+
+def _scheduler_diagnostics(scheduler: RequestScheduler | None) -> dict[str, Any] | None:
+    """Return the state of the shared request scheduler."""
+    if scheduler is None:
+        return None
+    return {
+        "requests_per_minute": scheduler.rate * 60,
+        "daily_budget": scheduler.daily_budget,
+        "used_today": scheduler.used_today,
+        "queued": scheduler.queued,
+        "sent": dict(scheduler.sent),
+        "cancelled_polls": scheduler.cancelled,
+        "refused_polls": scheduler.refused,
+    }
@@ -0,0 +1,139 @@
+"""Base entity for Pelican Thermostat."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    ATTR_DATA_AS_OF,
+    ATTR_STALE,
+    CONF_THERMOSTAT_NAME,
+    DOMAIN,
+    KEY_PENDING,
+    MANUFACTURER,
+    SIGNAL_NEW_THERMOSTATS,
+)
+from .coordinator import PelicanThermostatCoordinator
+
+
+@callback
+def async_add_thermostat_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator: PelicanThermostatCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    create: Callable[[str], Iterable[Entity]],
+) -> None:
+    """Add the entities of every thermostat, and of thermostats found later."""
+
+    @callback
+    def _async_add_thermostats(thermostat_names: list[str]) -> None:
+        async_add_entities(
+            entity
+            for thermostat_name in thermostat_names
+            for entity in create(thermostat_name)
+        )
+
+    _async_add_thermostats(coordinator.thermostat_names)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_NEW_THERMOSTATS.format(config_entry.entry_id),
+            _async_add_thermostats,
+        )
+    )
+
+
+class PelicanThermostatBaseEntity(CoordinatorEntity):
+    """Entity bound to one thermostat of a site coordinator.
+
+    The entity subscribes to the data keys it renders, so the coordinator
+    only asks it to write state when one of those values changed.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        thermostat_name: str,
+        key: str,
+        data_keys: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(
+            coordinator,
+            (thermostat_name, frozenset(data_keys if data_keys is not None else (key,))),
+        )
+        self.config_entry = config_entry
+        self.thermostat_name = thermostat_name
+
+        # Entries created for a single thermostat keep their original unique IDs
+        if config_entry.data.get(CONF_THERMOSTAT_NAME) == thermostat_name:
+            self._attr_unique_id = f"{config_entry.entry_id}_{key}"
+        else:
+            self._attr_unique_id = f"{config_entry.entry_id}_{thermostat_name}_{key}"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{config_entry.entry_id}_{thermostat_name}")},
+            name=thermostat_name,
+            manufacturer=MANUFACTURER,
+        )
+
+    @property
+    def thermostat_data(self) -> dict[str, Any]:
+        """Return the latest data for this entity's thermostat."""
+        return self.coordinator.data.get(self.thermostat_name, {})
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark values restored from the last run until a live poll succeeds.
+
+        Values written but not yet delivered to the thermostat are listed
+        under pending_writes.
+        """
+        attributes: dict[str, Any] = {}
+        if self.coordinator.stale:
+            attributes[ATTR_STALE] = True
+            attributes[ATTR_DATA_AS_OF] = self.coordinator.data_as_of.isoformat()
+        data_keys = self.coordinator_context[1]
+        if pending := {
+            key: value
+            for key, value in self.coordinator.pending_writes(self.thermostat_name).items()
+            if key in data_keys
+        }:
+            attributes[KEY_PENDING] = pending
+        return attributes or None
+
+
+class PelicanSiteBaseEntity(CoordinatorEntity):
+    """Entity describing a whole site rather than one of its thermostats."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        key: str,
+        data_keys: Iterable[str],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, (None, frozenset(data_keys)))
+        self.config_entry = config_entry
+        self._attr_unique_id = f"{config_entry.entry_id}_site_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=config_entry.title,
+            manufacturer=MANUFACTURER,
+            entry_type=DeviceEntryType.SERVICE,
+        )
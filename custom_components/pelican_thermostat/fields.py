@@ -0,0 +1,222 @@
+"""Field registry for Pelican Thermostat.
+
+Every thermostat value the integration reads or writes is described once
+here. The request value lists, the parse table, the sensor and number
+entities and the setters are all derived from this registry at import time.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
+
+from .const import (
+    TIER_CONFIG,
+    TIER_SETTINGS,
+    TIER_TELEMETRY,
+    VALUE_ANTICIPATION_DEGREES,
+    VALUE_AUX_STATUS,
+    VALUE_CALIBRATION_OFFSET,
+    VALUE_CO2_LEVEL,
+    VALUE_CO2_SETTING,
+    VALUE_COOL_SETTING,
+    VALUE_COOL_STAGES,
+    VALUE_CYCLE_RATE,
+    VALUE_DEHUMIDIFY_SETTING,
+    VALUE_FAN,
+    VALUE_FAN_STAGES,
+    VALUE_FRONT_KEYPAD,
+    VALUE_GATEWAY,
+    VALUE_HEAT_SETTING,
+    VALUE_HEAT_STAGES,
+    VALUE_HUMIDIFY_SETTING,
+    VALUE_HUMIDITY,
+    VALUE_HUMIDITY_CONTROL,
+    VALUE_INSTALL_DATE,
+    VALUE_MAX_COOL_SETTING,
+    VALUE_MAX_HEAT_SETTING,
+    VALUE_MAX_SAFE_TEMP,
+    VALUE_MIN_COOL_SETTING,
+    VALUE_MIN_HEAT_SETTING,
+    VALUE_MIN_SAFE_TEMP,
+    VALUE_NAME,
+    VALUE_NOTIFICATION_SENSITIVITY,
+    VALUE_NOTIFICATION_SETPOINT,
+    VALUE_NOTIFICATION_UNREACHABLE,
+    VALUE_RUN_STATUS,
+    VALUE_SCHEDULE,
+    VALUE_SERIAL_NO,
+    VALUE_SET_BY,
+    VALUE_STATUS,
+    VALUE_STATUS_DISPLAY,
+    VALUE_SYSTEM,
+    VALUE_SYSTEM_TYPE,
+    VALUE_TEMPERATURE,
+    VALUE_TEMPERATURE_FORMAT,
+    VALUE_VERSION,
+)
+
+FAHRENHEIT = UnitOfTemperature.FAHRENHEIT
+PPM = "ppm"
+
+
+@dataclass(frozen=True, slots=True)
+class PelicanField:
+    """A thermostat value as exposed by the API and by Home Assistant."""
+
+    tag: str  # API value name
+    key: str  # key in coordinator data
+    kind: type  # str, int or float; also converts the API text
+    tier: str  # refresh tier the value is polled in
+    writable: bool = False
+    unit: str | None = None
+    # Entity created for the value, if any
+    platform: Platform | None = None
+    name: str | None = None
+    icon: str | None = None
+    # Number entity range as (min, max, step)
+    number_range: tuple[float, float, float] | None = None
+
+    @property
+    def enabled_default(self) -> bool:
+        """Return True if the entity of the value is enabled when first added.
+
+        Static configuration rarely changes, so its read-only sensors are
+        disabled until wanted and their values are then not polled.
+        """
+        return self.tier != TIER_CONFIG or self.writable
+
+    @property
+    def convert(self) -> Callable[[str], Any]:
+        """Return the converter for values read from the API."""
+        return self.kind
+
+    def format_value(self, value: Any) -> str:
+        """Return a value in the form the API expects in a SET."""
+        if self.kind is int:
+            return str(int(value))
+        if self.kind is float:
+            return f"{float(value):g}"
+        return str(value)
+
+
+FIELDS: tuple[PelicanField, ...] = (
+    # Measurements
+    PelicanField(VALUE_TEMPERATURE, "temperature", float, TIER_TELEMETRY, unit=FAHRENHEIT,
+                 platform=Platform.SENSOR, name="Temperature", icon="mdi:thermometer"),
+    PelicanField(VALUE_HUMIDITY, "humidity", float, TIER_TELEMETRY, unit=PERCENTAGE,
+                 platform=Platform.SENSOR, name="Humidity", icon="mdi:water-percent"),
+    PelicanField(VALUE_CO2_LEVEL, "co2_level", int, TIER_TELEMETRY, unit=PPM,
+                 platform=Platform.SENSOR, name="CO2 Level", icon="mdi:molecule-co2"),
+    PelicanField(VALUE_RUN_STATUS, "run_status", str, TIER_TELEMETRY,
+                 platform=Platform.SENSOR, name="Run Status", icon="mdi:fan"),
+    # Status
+    PelicanField(VALUE_STATUS, "status", str, TIER_TELEMETRY,
+                 platform=Platform.SENSOR, name="Status", icon="mdi:information"),
+    PelicanField(VALUE_AUX_STATUS, "aux_status", str, TIER_TELEMETRY,
+                 platform=Platform.SENSOR, name="Aux Status", icon="mdi:electric-switch"),
+    PelicanField(VALUE_STATUS_DISPLAY, "status_display", str, TIER_TELEMETRY,
+                 platform=Platform.SENSOR, name="Status Display", icon="mdi:text-box"),
+    # System and settings
+    PelicanField(VALUE_SYSTEM, "system_mode", str, TIER_SETTINGS, writable=True),
+    PelicanField(VALUE_HEAT_SETTING, "heat_setting", float, TIER_SETTINGS, writable=True, unit=FAHRENHEIT),
+    PelicanField(VALUE_COOL_SETTING, "cool_setting", float, TIER_SETTINGS, writable=True, unit=FAHRENHEIT),
+    PelicanField(VALUE_SCHEDULE, "schedule", str, TIER_SETTINGS, writable=True,
+                 platform=Platform.SENSOR, name="Schedule", icon="mdi:calendar-clock"),
+    PelicanField(VALUE_FAN, "fan_mode", str, TIER_SETTINGS, writable=True,
+                 platform=Platform.SENSOR, name="Fan Mode", icon="mdi:fan"),
+    # Control source
+    PelicanField(VALUE_SET_BY, "set_by", str, TIER_SETTINGS,
+                 platform=Platform.SENSOR, name="Set By", icon="mdi:account"),
+    PelicanField(VALUE_FRONT_KEYPAD, "front_keypad", str, TIER_SETTINGS, writable=True,
+                 platform=Platform.SENSOR, name="Front Keypad", icon="mdi:keyboard"),
+    # Humidity control
+    PelicanField(VALUE_HUMIDIFY_SETTING, "humidify_setting", int, TIER_SETTINGS, writable=True, unit=PERCENTAGE,
+                 platform=Platform.NUMBER, name="Humidify Setpoint", icon="mdi:water-plus",
+                 number_range=(0, 100, 1)),
+    PelicanField(VALUE_DEHUMIDIFY_SETTING, "dehumidify_setting", int, TIER_SETTINGS, writable=True, unit=PERCENTAGE,
+                 platform=Platform.NUMBER, name="Dehumidify Setpoint", icon="mdi:water-minus",
+                 number_range=(0, 100, 1)),
+    PelicanField(VALUE_HUMIDITY_CONTROL, "humidity_control", str, TIER_SETTINGS,
+                 platform=Platform.SENSOR, name="Humidity Control", icon="mdi:water-percent"),
+    # CO2 control
+    PelicanField(VALUE_CO2_SETTING, "co2_setting", int, TIER_SETTINGS, writable=True, unit=PPM,
+                 platform=Platform.NUMBER, name="CO2 Setpoint", icon="mdi:molecule-co2",
+                 number_range=(0, 2000, 50)),
+    # System configuration
+    PelicanField(VALUE_HEAT_STAGES, "heat_stages", int, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Heat Stages", icon="mdi:fire"),
+    PelicanField(VALUE_COOL_STAGES, "cool_stages", int, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Cool Stages", icon="mdi:snowflake"),
+    PelicanField(VALUE_FAN_STAGES, "fan_stages", int, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Fan Stages", icon="mdi:fan"),
+    PelicanField(VALUE_SYSTEM_TYPE, "system_type", str, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="System Type", icon="mdi:hvac"),
+    PelicanField(VALUE_TEMPERATURE_FORMAT, "temperature_format", str, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Temperature Format", icon="mdi:thermometer"),
+    PelicanField(VALUE_CYCLE_RATE, "cycle_rate", int, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Cycle Rate", icon="mdi:sync"),
+    PelicanField(VALUE_ANTICIPATION_DEGREES, "anticipation_degrees", float, TIER_CONFIG, unit=FAHRENHEIT,
+                 platform=Platform.SENSOR, name="Anticipation Degrees", icon="mdi:thermometer-chevron-up"),
+    PelicanField(VALUE_CALIBRATION_OFFSET, "calibration_offset", float, TIER_CONFIG, unit=FAHRENHEIT,
+                 platform=Platform.SENSOR, name="Calibration Offset", icon="mdi:thermometer-lines"),
+    # Temperature limits
+    PelicanField(VALUE_MIN_HEAT_SETTING, "min_heat_setting", int, TIER_CONFIG, writable=True, unit=FAHRENHEIT,
+                 platform=Platform.NUMBER, name="Min Heat Setting", icon="mdi:thermometer-low",
+                 number_range=(40, 90, 1)),
+    PelicanField(VALUE_MAX_HEAT_SETTING, "max_heat_setting", int, TIER_CONFIG, writable=True, unit=FAHRENHEIT,
+                 platform=Platform.NUMBER, name="Max Heat Setting", icon="mdi:thermometer-high",
+                 number_range=(40, 90, 1)),
+    PelicanField(VALUE_MIN_COOL_SETTING, "min_cool_setting", int, TIER_CONFIG, writable=True, unit=FAHRENHEIT,
+                 platform=Platform.NUMBER, name="Min Cool Setting", icon="mdi:thermometer-low",
+                 number_range=(40, 90, 1)),
+    PelicanField(VALUE_MAX_COOL_SETTING, "max_cool_setting", int, TIER_CONFIG, writable=True, unit=FAHRENHEIT,
+                 platform=Platform.NUMBER, name="Max Cool Setting", icon="mdi:thermometer-high",
+                 number_range=(40, 90, 1)),
+    PelicanField(VALUE_MIN_SAFE_TEMP, "min_safe_temp", int, TIER_CONFIG, unit=FAHRENHEIT),
+    PelicanField(VALUE_MAX_SAFE_TEMP, "max_safe_temp", int, TIER_CONFIG, unit=FAHRENHEIT),
+    # Device info
+    PelicanField(VALUE_SERIAL_NO, "serial_no", str, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Serial Number", icon="mdi:identifier"),
+    PelicanField(VALUE_GATEWAY, "gateway", str, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Gateway", icon="mdi:router-wireless"),
+    PelicanField(VALUE_VERSION, "version", str, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Version", icon="mdi:information-outline"),
+    PelicanField(VALUE_INSTALL_DATE, "install_date", str, TIER_CONFIG,
+                 platform=Platform.SENSOR, name="Install Date", icon="mdi:calendar"),
+    # Notification settings
+    PelicanField(VALUE_NOTIFICATION_SENSITIVITY, "notification_sensitivity", str, TIER_CONFIG),
+    PelicanField(VALUE_NOTIFICATION_SETPOINT, "notification_setpoint", int, TIER_CONFIG),
+    PelicanField(VALUE_NOTIFICATION_UNREACHABLE, "notification_unreachable", str, TIER_CONFIG),
+)
+
+FIELDS_BY_TAG: dict[str, PelicanField] = {field.tag: field for field in FIELDS}
+FIELDS_BY_KEY: dict[str, PelicanField] = {field.key: field for field in FIELDS}
+
+# Writable fields by API tag, used for SETs, optimistic updates and read-backs
+WRITABLE_FIELDS: dict[str, PelicanField] = {
+    field.tag: field for field in FIELDS if field.writable
+}
+
+# API tag -> (data key, converter) for the response parser
+PARSE_TABLE: dict[str, tuple[str, Callable[[str], Any]]] = {
+    field.tag: (field.key, field.convert) for field in FIELDS
+}
+
+# Values fetched per refresh tier. The name is always requested first so the
+# response can be split per thermostat.
+POLL_TIERS: dict[str, list[str]] = {
+    tier: [field.tag for field in FIELDS if field.tier == tier]
+    for tier in (TIER_TELEMETRY, TIER_SETTINGS, TIER_CONFIG)
+}
+POLL_TIERS[TIER_TELEMETRY].insert(0, VALUE_NAME)
+ALL_VALUES: list[str] = [tag for tags in POLL_TIERS.values() for tag in tags]
+
+SENSOR_FIELDS: tuple[PelicanField, ...] = tuple(
+    field for field in FIELDS if field.platform == Platform.SENSOR
+)
+NUMBER_FIELDS: tuple[PelicanField, ...] = tuple(
+    field for field in FIELDS if field.platform == Platform.NUMBER
+)
@@ -0,0 +1,271 @@
+"""Columnar fleet telemetry and diagnostics for Pelican Thermostat."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from homeassistant.components.climate import HVACAction
+
+from .const import (
+    FLEET_MIN_HOURS,
+    SETPOINT_MISS_SHARE,
+    SETPOINT_TOLERANCE,
+    SHORT_CYCLE_LIMIT,
+    STUCK_SENSOR_RANGE,
+    SYSTEM_AUTO,
+    SYSTEM_COOL,
+    SYSTEM_HEAT,
+)
+from .runtime import classify_run_status
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fleet analytics are off without it
+    np = None
+
+PROBLEM_SHORT_CYCLING = "short_cycling"
+PROBLEM_STUCK_SENSOR = "stuck_sensor"
+PROBLEM_CO2_EXCURSION = "co2_excursion"
+PROBLEM_MISSING_SETPOINT = "missing_setpoint"
+
+ROW_CHUNK = 16  # rows are added in chunks as thermostats appear
+
+
+def _number(value: Any) -> float:
+    """Return a reading as a float, NaN when missing."""
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+def setpoint_error(values: dict[str, Any]) -> float:
+    """Return how far a thermostat is outside its active setpoints, NaN when off.
+
+    Heating counts degrees below the heat setpoint, cooling degrees above
+    the cool setpoint, and auto either.
+    """
+    temperature = _number(values.get("temperature"))
+    mode = values.get("system_mode")
+    errors = []
+    if mode in (SYSTEM_HEAT, SYSTEM_AUTO):
+        errors.append(_number(values.get("heat_setting")) - temperature)
+    if mode in (SYSTEM_COOL, SYSTEM_AUTO):
+        errors.append(temperature - _number(values.get("cool_setting")))
+    errors = [error for error in errors if not math.isnan(error)]
+    return max(0.0, *errors) if errors else math.nan
+
+
+@dataclass(slots=True)
+class FleetWindow:
+    """Copy of the telemetry rows of some thermostats, and the bins of a window.
+
+    Rows keep every bin in ring order; ``columns`` lists the bins of the
+    window in time order.
+    """
+
+    names: list[str]
+    interval: float
+    columns: Any  # intp column indexes
+    temperature: Any  # float32 thermostats x bins
+    co2_level: Any  # float32, peak of each bin
+    setpoint_error: Any  # float32
+    starts: Any  # uint8, heating or cooling starts in each bin
+
+
+class FleetTelemetry:
+    """Telemetry of every thermostat of a site as thermostat x time arrays.
+
+    Polls are binned on a fixed grid of ``interval`` seconds covering the
+    retention; each column is a time bin, reused in a ring, and each row a
+    thermostat. The columns are what the fleet diagnostics need: the latest
+    temperature, the peak CO2 level and the setpoint error of each bin, and
+    the heating or cooling starts counted in it. One thermostat costs 13
+    bytes per bin, about 26 kB for a week of 5 minute bins.
+    """
+
+    def __init__(self, retention: float, interval: float) -> None:
+        """Initialize empty telemetry; retention and interval are in seconds."""
+        self.interval = interval
+        self.columns = math.ceil(retention / interval)
+        self.rows: dict[str, int] = {}
+        # Bin number held by each column; -1 for never used
+        self.bins = np.full(self.columns, -1, np.int64)
+        self.temperature = self._floats(0)
+        self.co2_level = self._floats(0)
+        self.setpoint_error = self._floats(0)
+        self.starts = np.zeros((0, self.columns), np.uint8)
+        # Whether each thermostat was heating or cooling at its last poll
+        self._active = np.zeros(0, bool)
+
+    def _floats(self, rows: int) -> Any:
+        """Return a float column block with every reading missing."""
+        return np.full((rows, self.columns), np.nan, np.float32)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the arrays."""
+        arrays = (self.temperature, self.co2_level, self.setpoint_error, self.starts)
+        return sum(array.nbytes for array in arrays)
+
+    def _row(self, thermostat_name: str) -> int:
+        """Return the row of a thermostat, adding one if needed."""
+        row = self.rows.get(thermostat_name)
+        if row is not None:
+            return row
+        row = self.rows[thermostat_name] = len(self.rows)
+        capacity = len(self._active)
+        if row >= capacity:
+            extra = max(ROW_CHUNK, capacity)
+            self.temperature = np.vstack((self.temperature, self._floats(extra)))
+            self.co2_level = np.vstack((self.co2_level, self._floats(extra)))
+            self.setpoint_error = np.vstack((self.setpoint_error, self._floats(extra)))
+            self.starts = np.vstack((self.starts, np.zeros((extra, self.columns), np.uint8)))
+            self._active = np.concatenate((self._active, np.zeros(extra, bool)))
+        return row
+
+    def record(
+        self, timestamp: float, data: dict[str, dict[str, Any]], names: Iterable[str]
+    ) -> None:
+        """Add the current readings of some thermostats to their time bin."""
+        names = list(names)
+        if not names:
+            return
+        bin_number = int(timestamp // self.interval)
+        column = bin_number % self.columns
+        if self.bins[column] != bin_number:
+            # A new bin reuses the column of the oldest one
+            self.bins[column] = bin_number
+            for array in (self.temperature, self.co2_level, self.setpoint_error):
+                array[:, column] = np.nan
+            self.starts[:, column] = 0
+
+        rows = np.array([self._row(name) for name in names])
+        values = [data[name] for name in names]
+        self.temperature[rows, column] = [_number(item.get("temperature")) for item in values]
+        self.co2_level[rows, column] = np.fmax(
+            self.co2_level[rows, column],
+            np.array([_number(item.get("co2_level")) for item in values], np.float32),
+        )
+        self.setpoint_error[rows, column] = [setpoint_error(item) for item in values]
+        active = np.array(
+            [
+                classify_run_status(item.get("run_status"))
+                in (HVACAction.HEATING, HVACAction.COOLING)
+                for item in values
+            ]
+        )
+        started = active & ~self._active[rows]
+        self.starts[rows, column] = np.minimum(
+            self.starts[rows, column].astype(np.int32) + started, 255
+        )
+        self._active[rows] = active
+
+    def window(self, names: Iterable[str], seconds: float, now: float) -> FleetWindow:
+        """Return a copy of the last seconds of telemetry of some thermostats.
+
+        Only whole rows are copied, which is cheap enough for the event
+        loop; analyze_fleet picks the bins of the window from them.
+        Thermostats without telemetry are left out.
+        """
+        names = [name for name in names if name in self.rows]
+        current = int(now // self.interval)
+        first = current - math.ceil(seconds / self.interval) + 1
+        columns = np.flatnonzero((self.bins >= first) & (self.bins <= current))
+        columns = columns[np.argsort(self.bins[columns])]
+        rows = np.array([self.rows[name] for name in names], np.intp)
+        return FleetWindow(
+            names,
+            self.interval,
+            columns,
+            self.temperature.take(rows, axis=0),
+            self.co2_level.take(rows, axis=0),
+            self.setpoint_error.take(rows, axis=0),
+            self.starts.take(rows, axis=0),
+        )
+
+
+def analyze_fleet(window: FleetWindow, co2_limit: float) -> list[dict[str, Any]]:
+    """Return the diagnostics of every thermostat of a window.
+
+    Runs on copies, so it can be sent to an executor. Every statistic is
+    computed for all thermostats at once along the time axis.
+    """
+    interval = window.interval
+    bins_per_hour = max(1, round(3600 / interval))
+    min_bins = FLEET_MIN_HOURS * bins_per_hour
+
+    columns = window.columns
+    temperature = window.temperature.take(columns, axis=1)
+    valid = ~np.isnan(temperature)
+    samples = valid.sum(axis=1)
+    observed_hours = samples * interval / 3600
+    # Rows without readings get an infinite range rather than a NaN warning
+    highest = np.where(valid, temperature, -np.inf).max(axis=1, initial=-np.inf)
+    lowest = np.where(valid, temperature, np.inf).min(axis=1, initial=np.inf)
+    temperature_range = highest - lowest
+    stuck = (samples >= min_bins) & (temperature_range < STUCK_SENSOR_RANGE)
+
+    # Starts in every hour-long run of bins, from a running total
+    starts = window.starts.take(columns, axis=1).astype(np.int32)
+    totals = np.zeros((starts.shape[0], starts.shape[1] + 1), np.int32)
+    np.cumsum(starts, axis=1, out=totals[:, 1:])
+    span = min(bins_per_hour, starts.shape[1])
+    peak_cycles = (totals[:, span:] - totals[:, :-span]).max(axis=1, initial=0)
+    cycles = totals[:, -1]
+    cycles_per_hour = np.divide(
+        cycles, observed_hours, out=np.zeros(len(cycles)), where=observed_hours > 0
+    )
+    short_cycling = peak_cycles > SHORT_CYCLE_LIMIT
+
+    co2 = window.co2_level.take(columns, axis=1)
+    over = co2 > co2_limit
+    co2_minutes = over.sum(axis=1) * interval / 60
+    co2_peak = np.where(np.isnan(co2), -np.inf, co2).max(axis=1, initial=-np.inf)
+
+    error = window.setpoint_error.take(columns, axis=1)
+    controlled = ~np.isnan(error)
+    controlled_bins = controlled.sum(axis=1)
+    miss_share = np.divide(
+        (error > SETPOINT_TOLERANCE).sum(axis=1),
+        controlled_bins,
+        out=np.zeros(len(controlled_bins)),
+        where=controlled_bins > 0,
+    )
+    mean_error = np.divide(
+        np.where(controlled, error, 0).sum(axis=1),
+        controlled_bins,
+        out=np.zeros(len(controlled_bins)),
+        where=controlled_bins > 0,
+    )
+    missing_setpoint = (controlled_bins >= min_bins) & (miss_share > SETPOINT_MISS_SHARE)
+
+    results = []
+    for row, thermostat_name in enumerate(window.names):
+        problems = [
+            problem
+            for problem, flagged in (
+                (PROBLEM_SHORT_CYCLING, short_cycling[row]),
+                (PROBLEM_STUCK_SENSOR, stuck[row]),
+                (PROBLEM_CO2_EXCURSION, over[row].any()),
+                (PROBLEM_MISSING_SETPOINT, missing_setpoint[row]),
+            )
+            if flagged
+        ]
+        results.append(
+            {
+                "thermostat": thermostat_name,
+                "problems": problems,
+                "hours_observed": round(float(observed_hours[row]), 2),
+                "cycles": int(cycles[row]),
+                "cycles_per_hour": round(float(cycles_per_hour[row]), 2),
+                "peak_cycles_per_hour": int(peak_cycles[row]),
+                "temperature_range": (
+                    round(float(temperature_range[row]), 2) if samples[row] else None
+                ),
+                "co2_peak": float(co2_peak[row]) if np.isfinite(co2_peak[row]) else None,
+                "co2_minutes_over_limit": round(float(co2_minutes[row]), 1),
+                "setpoint_miss_share": round(float(miss_share[row]), 3),
+                "mean_setpoint_error": round(float(mean_error[row]), 2),
+            }
+        )
+    return results
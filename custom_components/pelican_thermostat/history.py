@@ -0,0 +1,188 @@
+"""In-memory reading history for Pelican Thermostats."""
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import math
+import time
+from typing import Any
+
+# Numeric data keys kept for every poll
+HISTORY_KEYS = ("temperature", "humidity", "co2_level", "heat_setting", "cool_setting")
+KEY_RUN_STATUS = "run_status"
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStats:
+    """Summary of one value over a time window."""
+
+    minimum: float
+    maximum: float
+    mean: float
+    count: int
+
+
+class ThermostatHistory:
+    """Fixed-size ring buffer of the readings of one thermostat.
+
+    Each value is a column in a typed array, so a sample costs 29 bytes
+    whatever the number of samples: a float64 timestamp, float32 values
+    (NaN when a value was missing) and a one-byte run status code.
+    Samples older than the retention are evicted as new ones arrive; when
+    the buffer is full, the oldest sample is overwritten.
+    """
+
+    __slots__ = (
+        "capacity",
+        "retention",
+        "_times",
+        "_values",
+        "_run_status",
+        "_statuses",
+        "_start",
+        "_size",
+    )
+
+    def __init__(self, capacity: int, retention: float) -> None:
+        """Initialize an empty buffer; retention is in seconds."""
+        self.capacity = capacity
+        self.retention = retention
+        self._times = array("d", bytes(8 * capacity))
+        self._values = {key: array("f", bytes(4 * capacity)) for key in HISTORY_KEYS}
+        self._run_status = array("B", bytes(capacity))
+        # Run statuses seen so far; the buffer stores their index
+        self._statuses: list[str | None] = [None]
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the sample columns."""
+        columns = [self._times, self._run_status, *self._values.values()]
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def append(self, timestamp: float, values: dict[str, Any]) -> None:
+        """Add the readings of one poll."""
+        self.evict(timestamp)
+        index = (self._start + self._size) % self.capacity
+        if self._size == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._size += 1
+        self._times[index] = timestamp
+        for key, column in self._values.items():
+            value = values.get(key)
+            column[index] = value if isinstance(value, (int, float)) else math.nan
+        run_status = values.get(KEY_RUN_STATUS)
+        try:
+            code = self._statuses.index(run_status)
+        except ValueError:
+            code = len(self._statuses)
+            if code > 255:
+                code = 0  # more distinct statuses than a byte holds; store as unknown
+            else:
+                self._statuses.append(run_status)
+        self._run_status[index] = code
+
+    def evict(self, now: float) -> None:
+        """Drop the samples older than the retention."""
+        cutoff = now - self.retention
+        while self._size and self._times[self._start] < cutoff:
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+
+    def _recent(self, seconds: float, now: float) -> Iterator[int]:
+        """Yield the buffer indexes of the samples in a window, newest first."""
+        cutoff = now - seconds
+        capacity = self.capacity
+        times = self._times
+        for offset in range(self._size - 1, -1, -1):
+            index = (self._start + offset) % capacity
+            if times[index] < cutoff:
+                return
+            yield index
+
+    def window(self, key: str, seconds: float, now: float) -> WindowStats | None:
+        """Return the min, max and mean of a value over the last seconds."""
+        column = self._values[key]
+        count = 0
+        total = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        for index in self._recent(seconds, now):
+            value = column[index]
+            if value != value:  # NaN: missing reading
+                continue
+            count += 1
+            total += value
+            if value < minimum:
+                minimum = value
+            if value > maximum:
+                maximum = value
+        if not count:
+            return None
+        # float32 storage carries noise past the readings' own precision
+        return WindowStats(round(minimum, 2), round(maximum, 2), round(total / count, 2), count)
+
+    def run_status_shares(self, seconds: float, now: float) -> dict[str | None, float]:
+        """Return the share of samples in each run status over the last seconds."""
+        counts = Counter(self._run_status[index] for index in self._recent(seconds, now))
+        total = sum(counts.values())
+        return {self._statuses[code]: count / total for code, count in counts.items()}
+
+
+class PelicanHistory:
+    """Reading history of every thermostat of a site."""
+
+    def __init__(self, retention: float, sample_interval: float) -> None:
+        """Initialize the history.
+
+        Buffers are sized for one sample per sample_interval seconds over
+        the retention, which is in seconds.
+        """
+        self.retention = retention
+        self.capacity = math.ceil(retention / sample_interval) + 1
+        self.thermostats: dict[str, ThermostatHistory] = {}
+
+    def record(
+        self, timestamp: float, data: dict[str, dict[str, Any]], names: Iterable[str]
+    ) -> None:
+        """Add the current readings of some thermostats."""
+        for thermostat_name in names:
+            history = self.thermostats.get(thermostat_name)
+            if history is None:
+                history = self.thermostats[thermostat_name] = ThermostatHistory(
+                    self.capacity, self.retention
+                )
+            history.append(timestamp, data[thermostat_name])
+
+    def window(
+        self, thermostat_name: str, key: str, seconds: float, now: float | None = None
+    ) -> WindowStats | None:
+        """Return the min, max and mean of a thermostat value over the last seconds."""
+        if key not in HISTORY_KEYS:
+            raise ValueError(f"{key} is not kept in the history")
+        history = self.thermostats.get(thermostat_name)
+        if history is None:
+            return None
+        return history.window(key, seconds, time.time() if now is None else now)
+
+    def run_status_shares(
+        self, thermostat_name: str, seconds: float, now: float | None = None
+    ) -> dict[str | None, float]:
+        """Return the share of samples in each run status over the last seconds."""
+        history = self.thermostats.get(thermostat_name)
+        if history is None:
+            return {}
+        return history.run_status_shares(seconds, time.time() if now is None else now)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by every buffer."""
+        return sum(history.nbytes for history in self.thermostats.values())
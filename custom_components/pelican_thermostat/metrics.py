@@ -0,0 +1,240 @@
+"""Request metrics and tracing for Pelican Thermostat."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from .const import REQUEST_GET, REQUEST_SET
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Phases of a poll; aiohttp reports the TCP and TLS handshakes as one
+# connection setup, so "connect" includes TLS for https base URLs
+PHASE_DNS = "dns"
+PHASE_CONNECT = "connect"
+PHASE_TTFB = "ttfb"
+PHASE_BODY = "body"
+PHASE_TOTAL = "total"
+PHASES = (PHASE_DNS, PHASE_CONNECT, PHASE_TTFB, PHASE_BODY, PHASE_TOTAL)
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_REJECTED = "Rejected"  # the API answered a SET with success 0
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations, in seconds."""
+
+    __slots__ = ("counts", "count", "total", "last", "maximum")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # One count per bucket, plus one for values above the last bound
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.last: float | None = None
+        self.maximum = 0.0
+
+    def record(self, value: float) -> None:
+        """Add one duration."""
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound below which a fraction of values fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram summary, in milliseconds."""
+
+        def ms(value: float | None) -> float | None:
+            return round(value * 1000, 1) if value is not None else None
+
+        buckets = {f"le_{ms(bound):g}ms": count for bound, count in zip(LATENCY_BUCKETS, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "last_ms": ms(self.last),
+            "mean_ms": ms(self.mean),
+            "p50_ms": ms(self.percentile(0.5)),
+            "p95_ms": ms(self.percentile(0.95)),
+            "max_ms": ms(self.maximum if self.count else None),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class PelicanMetrics:
+    """Request metrics of one coordinator."""
+
+    phases: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: {phase: LatencyHistogram() for phase in PHASES}
+    )
+    parse: LatencyHistogram = field(default_factory=LatencyHistogram)
+    set_round_trip: LatencyHistogram = field(default_factory=LatencyHistogram)
+    payload_bytes: int = 0  # total response bytes of polls
+    last_payload_bytes: int | None = None
+    connections_created: int = 0
+    connections_reused: int = 0
+    # Outcome counts per request type: "success" or the error class name
+    outcomes: dict[str, Counter[str]] = field(
+        default_factory=lambda: {REQUEST_GET: Counter(), REQUEST_SET: Counter()}
+    )
+
+    def record_success(self, request: str) -> None:
+        """Count a successful request."""
+        self.outcomes[request][OUTCOME_SUCCESS] += 1
+
+    def record_failure(self, request: str, error: BaseException | str) -> None:
+        """Count a failed request under its error class."""
+        name = error if isinstance(error, str) else type(error).__name__
+        self.outcomes[request][name] += 1
+
+    @property
+    def failures(self) -> Counter[str]:
+        """Return the failure counts by error class, over every request type."""
+        failures: Counter[str] = Counter()
+        for outcomes in self.outcomes.values():
+            failures.update(outcomes)
+        del failures[OUTCOME_SUCCESS]
+        return failures
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every metric, for diagnostics."""
+        return {
+            "phases": {phase: histogram.as_dict() for phase, histogram in self.phases.items()},
+            "parse": self.parse.as_dict(),
+            "set_round_trip": self.set_round_trip.as_dict(),
+            "payload_bytes": self.payload_bytes,
+            "last_payload_bytes": self.last_payload_bytes,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "outcomes": {request: dict(outcomes) for request, outcomes in self.outcomes.items()},
+        }
+
+
+class RequestTrace:
+    """Timestamps of one request, filled in by the trace config callbacks.
+
+    Passed to aiohttp as ``trace_request_ctx``; the coordinator finishes the
+    trace once it has read (and parsed) the body.
+    """
+
+    __slots__ = ("metrics", "start", "dns", "connect", "headers", "_dns_mark", "_connect_mark")
+
+    def __init__(self, metrics: PelicanMetrics) -> None:
+        """Initialize the trace."""
+        self.metrics = metrics
+        self.start = time.perf_counter()
+        self.dns = 0.0
+        self.connect = 0.0
+        self.headers: float | None = None
+        self._dns_mark = 0.0
+        self._connect_mark = 0.0
+
+    def finish_get(self, size: int, parse_time: float) -> None:
+        """Record a completed poll request."""
+        metrics = self.metrics
+        now = time.perf_counter()
+        headers = self.headers if self.headers is not None else now
+        if self.dns:
+            metrics.phases[PHASE_DNS].record(self.dns)
+        if self.connect:
+            metrics.phases[PHASE_CONNECT].record(self.connect)
+        metrics.phases[PHASE_TTFB].record(max(0.0, headers - self.start - self.dns - self.connect))
+        metrics.phases[PHASE_BODY].record(max(0.0, now - headers - parse_time))
+        metrics.phases[PHASE_TOTAL].record(now - self.start)
+        metrics.parse.record(parse_time)
+        metrics.payload_bytes += size
+        metrics.last_payload_bytes = size
+        metrics.record_success(REQUEST_GET)
+
+    def finish_set(self) -> None:
+        """Record the round trip of an answered SET request."""
+        self.metrics.set_round_trip.record(time.perf_counter() - self.start)
+
+
+def _trace(context: SimpleNamespace) -> RequestTrace | None:
+    """Return the trace of a request, if it is traced."""
+    trace = context.trace_request_ctx
+    return trace if isinstance(trace, RequestTrace) else None
+
+
+async def _on_request_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Restart the clock when aiohttp starts sending the request."""
+    if trace := _trace(context):
+        trace.start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Mark the start of a DNS lookup."""
+    if trace := _trace(context):
+        trace._dns_mark = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Add the time spent resolving the host."""
+    if trace := _trace(context):
+        trace.dns += time.perf_counter() - trace._dns_mark
+
+
+async def _on_connection_create_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Mark the start of a new connection."""
+    if trace := _trace(context):
+        trace._connect_mark = time.perf_counter()
+
+
+async def _on_connection_create_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Add the time spent opening the connection."""
+    if trace := _trace(context):
+        # DNS resolution happens inside connection setup; count it only once
+        trace.connect += time.perf_counter() - trace._connect_mark - trace.dns
+        trace.metrics.connections_created += 1
+
+
+async def _on_connection_reuseconn(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Count a request sent over a pooled connection."""
+    if trace := _trace(context):
+        trace.metrics.connections_reused += 1
+
+
+async def _on_request_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    """Mark the arrival of the response headers."""
+    if trace := _trace(context):
+        trace.headers = time.perf_counter()
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Return a trace config timing the phases of traced requests."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
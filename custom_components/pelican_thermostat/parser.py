@@ -0,0 +1,115 @@
+"""Streaming XML parser for Pelican Thermostat API responses."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+import xml.etree.ElementTree as ET
+
+from .const import OBJECT_THERMOSTAT, VALUE_NAME
+from .fields import PARSE_TABLE
+
+_LOGGER = logging.getLogger(__name__)
+
+SUCCESS_TAG = "success"
+
+
+class PelicanParseError(Exception):
+    """Error raised when an API response cannot be parsed."""
+
+
+class ThermostatResponseParser:
+    """Single-pass, incremental parser for thermostat GET responses.
+
+    Bytes are fed as they arrive from the network. Each <Thermostat> is
+    parsed as soon as it closes, with one walk over its children dispatched
+    through the registry's PARSE_TABLE, and is then cleared so large
+    multi-thermostat responses are never held as a whole tree. The stdlib
+    pull parser runs expat and the tree builder in C; lxml's pull parser
+    measured slower on the same responses.
+    """
+
+    def __init__(self, default_name: str | None = None) -> None:
+        """Initialize the parser."""
+        self._default_name = default_name
+        self._parser = ET.XMLPullParser(events=("end",))
+        self._success = False
+        self.result: dict[str, dict[str, Any]] = {}
+
+    @property
+    def success(self) -> bool:
+        """Return True if the response reported success so far."""
+        return self._success
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the response."""
+        try:
+            self._parser.feed(data)
+        except ET.ParseError as err:
+            raise PelicanParseError(f"Failed to parse XML response: {err}") from err
+        self._drain()
+
+    def close(self) -> dict[str, dict[str, Any]]:
+        """Finish parsing and return data keyed by thermostat name."""
+        try:
+            self._parser.close()
+        except ET.ParseError as err:
+            raise PelicanParseError(f"Failed to parse XML response: {err}") from err
+        self._drain()
+        if not self._success:
+            raise PelicanParseError("API request was not successful")
+        if not self.result:
+            raise PelicanParseError("No thermostat data found in response")
+        return self.result
+
+    def _drain(self) -> None:
+        """Handle the elements that closed since the last chunk."""
+        for _, elem in self._parser.read_events():
+            tag = elem.tag
+            if tag == OBJECT_THERMOSTAT:
+                self._parse_thermostat(elem)
+                elem.clear()
+            elif tag == SUCCESS_TAG:
+                self._success = (elem.text or "").strip() == "1"
+
+    def _parse_thermostat(self, thermostat_elem: Any) -> None:
+        """Parse the values of a single <Thermostat> element."""
+        fields = PARSE_TABLE
+        thermostat: dict[str, Any] = {}
+        name = self._default_name
+        for elem in thermostat_elem:
+            tag = elem.tag
+            text = elem.text
+            field = fields.get(tag)
+            if field is None:
+                if tag == VALUE_NAME and text:
+                    name = text
+                continue
+            key, convert = field
+            # Strings keep empty values as None; numbers with empty or
+            # invalid text are left out
+            if not text:
+                if convert is str:
+                    thermostat[key] = None
+                continue
+            try:
+                thermostat[key] = convert(text)
+            except ValueError:
+                _LOGGER.warning("Invalid %s value: %s", tag, text)
+        if name:
+            self.result[name] = thermostat
+        else:
+            _LOGGER.warning("Skipping thermostat without a name in response")
+
+
+def create_parser(default_name: str | None = None) -> ThermostatResponseParser:
+    """Create a response parser."""
+    return ThermostatResponseParser(default_name)
+
+
+def parse_thermostat_response(
+    data: str | bytes, default_name: str | None = None
+) -> dict[str, dict[str, Any]]:
+    """Parse a complete thermostat GET response."""
+    parser = create_parser(default_name)
+    parser.feed(data.encode() if isinstance(data, str) else data)
+    return parser.close()
@@ -0,0 +1,122 @@
+"""Staggered polling shared by every Pelican Thermostat config entry."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_POLL_GROUP, POLL_MIN_GAP, POLL_PHASE_JITTER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def stable_fraction(entry_id: str) -> float:
+    """Return a fraction in [0, 1) derived from an entry id, the same on every run."""
+    digest = hashlib.sha256(entry_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+class PollLimiter:
+    """Cap on the polls running at once that can be changed while polls run.
+
+    Polls are counted against the current limit, so a lowered limit holds
+    back new polls until enough running ones finish, and a raised one lets
+    waiting polls in as the next running poll finishes.
+    """
+
+    def __init__(self, limit: int = 1) -> None:
+        """Initialize the limiter."""
+        self.limit = limit
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        """Wait until a poll may start."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Let the next waiting poll start."""
+        self.active -= 1
+        async with self._condition:
+            self._condition.notify_all()
+
+
+class PollGroup:
+    """Spread the polls of every site over the poll interval.
+
+    Home Assistant schedules each poll a whole interval after the previous
+    one, so sites set up together poll in lockstep. Here each site is moved
+    onto its own phase of the interval instead, by one poll at the start of
+    its phase: sites are given evenly spaced slots in entry id order,
+    shifted by a small jitter derived from the entry id so phases are stable
+    across restarts. At most ``limit`` polls run at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        # Concurrent poll limit asked for by each entry
+        self.limits: dict[str, int] = {}
+        self.limit = 0
+        self._limiter = PollLimiter()
+
+    def join(self, entry_id: str, limit: int) -> None:
+        """Add a site, or update its concurrent poll limit."""
+        self.limits[entry_id] = limit
+        self._apply_limit()
+
+    def leave(self, entry_id: str) -> None:
+        """Remove a site; the others move to the freed slots."""
+        if self.limits.pop(entry_id, None) is not None:
+            self._apply_limit()
+
+    def _apply_limit(self) -> None:
+        """Hold the group to the strictest limit of its sites."""
+        limit = min(self.limits.values(), default=0)
+        if limit and limit != self.limit:
+            self.limit = self._limiter.limit = limit
+
+    def slot(self) -> PollLimiter:
+        """Return the limiter a poll holds while it runs."""
+        return self._limiter
+
+    def phase(self, entry_id: str) -> float:
+        """Return the phase of a site, as a fraction of its poll interval."""
+        members = sorted(self.limits)
+        index = members.index(entry_id) if entry_id in members else 0
+        jitter = (stable_fraction(entry_id) - 0.5) * POLL_PHASE_JITTER
+        return ((index + jitter) / max(len(members), 1)) % 1.0
+
+    def delay(self, entry_id: str, interval: float, now: float) -> float:
+        """Return the seconds until a site's next poll on its phase.
+
+        ``now`` is wall-clock time, so every site shares the same grid.
+        Polls are at least POLL_MIN_GAP of an interval apart.
+        """
+        delay = (self.phase(entry_id) * interval - now) % interval
+        if delay < interval * POLL_MIN_GAP:
+            delay += interval
+        return delay
+
+
+def async_join_poll_group(hass: HomeAssistant, entry_id: str, limit: int) -> PollGroup:
+    """Return the poll group, adding a site to it."""
+    group: PollGroup | None = hass.data.get(DATA_POLL_GROUP)
+    if group is None:
+        group = hass.data[DATA_POLL_GROUP] = PollGroup()
+    group.join(entry_id, limit)
+    _LOGGER.debug("%s polls at phase %.2f", entry_id, group.phase(entry_id))
+    return group
+
+
+def async_leave_poll_group(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove a site from the poll group, dropping the group with the last one."""
+    group: PollGroup | None = hass.data.get(DATA_POLL_GROUP)
+    if group is None:
+        return
+    group.leave(entry_id)
+    if not group.limits:
+        hass.data.pop(DATA_POLL_GROUP)
@@ -0,0 +1,63 @@
+"""Adaptive poll scheduling for Pelican Thermostat."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import time
+
+from .const import IDLE_AFTER
+from .runtime import RUNNING_ACTIONS, classify_run_status
+
+
+def is_active_run_status(run_status: str | None) -> bool:
+    """Return True if a run status reports active heating or cooling."""
+    return classify_run_status(run_status) in RUNNING_ACTIONS
+
+
+class AdaptivePollScheduler:
+    """Choose the next poll interval from HVAC activity and connectivity.
+
+    Polls run at the minimum interval while equipment is heating or cooling
+    and for a short burst after a user write, at the base interval
+    otherwise, and at the maximum interval once the site has been idle for a
+    long time. Consecutive failed polls back off exponentially up to the
+    maximum interval.
+    """
+
+    def __init__(
+        self, base: float, minimum: float, maximum: float, burst: float
+    ) -> None:
+        """Initialize the scheduler."""
+        self.base = base
+        self.minimum = minimum
+        self.maximum = maximum
+        self.burst = burst
+        self.failures = 0
+        self.active = False
+        self._burst_until = 0.0
+        self._last_active = time.monotonic()
+
+    def record_write(self) -> None:
+        """Poll faster for a while after a user write."""
+        self._burst_until = time.monotonic() + self.burst
+
+    def record_poll(self, success: bool, run_statuses: Iterable[str | None]) -> None:
+        """Record the outcome of a poll."""
+        if not success:
+            self.failures += 1
+            return
+        self.failures = 0
+        self.active = any(is_active_run_status(run_status) for run_status in run_statuses)
+        if self.active:
+            self._last_active = time.monotonic()
+
+    @property
+    def interval(self) -> float:
+        """Return the interval until the next poll, in seconds."""
+        now = time.monotonic()
+        if self.failures:
+            return min(self.base * 2 ** self.failures, self.maximum)
+        if self.active or now < self._burst_until:
+            return self.minimum
+        if now - self._last_active >= IDLE_AFTER:
+            return self.maximum
+        return self.base
@@ -0,0 +1,206 @@
+"""Incremental HVAC runtime and duty-cycle accounting for Pelican Thermostat."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.components.climate import HVACAction
+from homeassistant.util import dt as dt_util
+
+from .const import AUX_ON, FAN_ON
+
+RUNNING_ACTIONS = (HVACAction.HEATING, HVACAction.COOLING)
+CYCLE_WINDOW = 3600  # seconds over which cycles per hour are counted
+
+
+@lru_cache(maxsize=64)
+def classify_run_status(run_status: str | None) -> HVACAction:
+    """Map a Pelican run status to the HVAC action it reports.
+
+    The site reports a handful of distinct statuses, so each is matched
+    once and then served from the cache.
+    """
+    if not run_status:
+        return HVACAction.IDLE
+    run_status = run_status.lower()
+    if "heat" in run_status:
+        return HVACAction.HEATING
+    if "cool" in run_status:
+        return HVACAction.COOLING
+    if "fan" in run_status:
+        return HVACAction.FAN
+    return HVACAction.IDLE
+
+
+@dataclass(slots=True)
+class ThermostatRuntime:
+    """Runtime totals of one thermostat for the current day, in seconds."""
+
+    heat: float = 0.0
+    cool: float = 0.0
+    fan: float = 0.0  # blower running: heating, cooling, fan only or fan set to On
+    aux: float = 0.0
+    observed: float = 0.0  # time covered by polls, the base of the duty cycle
+    cycles: int = 0  # heating or cooling starts
+    # State reported by the last poll, held until the next one
+    action: HVACAction | None = None
+    fan_on: bool = False
+    aux_on: bool = False
+    updated: float | None = None
+    recent_cycles: deque[float] = field(default_factory=deque)
+
+    @property
+    def duty_cycle(self) -> float | None:
+        """Return the share of today's observed time spent heating or cooling, in %."""
+        if not self.observed:
+            return None
+        return (self.heat + self.cool) / self.observed * 100
+
+    @property
+    def cycles_per_hour(self) -> int:
+        """Return the heating or cooling starts of the last hour."""
+        return len(self.recent_cycles)
+
+    def reset(self) -> None:
+        """Start a new day, keeping the current state."""
+        self.heat = self.cool = self.fan = self.aux = self.observed = 0.0
+        self.cycles = 0
+
+    def update(self, timestamp: float, values: dict[str, Any], max_gap: float) -> None:
+        """Account for the time since the last poll and take the new state.
+
+        The state reported by the previous poll is assumed to have held
+        until this one, unless polls were more than max_gap seconds apart.
+        """
+        if self.updated is not None and self.action is not None:
+            elapsed = timestamp - self.updated
+            if 0 < elapsed <= max_gap:
+                self.observed += elapsed
+                if self.action is HVACAction.HEATING:
+                    self.heat += elapsed
+                elif self.action is HVACAction.COOLING:
+                    self.cool += elapsed
+                if self.fan_on:
+                    self.fan += elapsed
+                if self.aux_on:
+                    self.aux += elapsed
+
+        action = classify_run_status(values.get("run_status"))
+        if action in RUNNING_ACTIONS and action is not self.action:
+            self.cycles += 1
+            self.recent_cycles.append(timestamp)
+        recent_cycles = self.recent_cycles
+        while recent_cycles and recent_cycles[0] <= timestamp - CYCLE_WINDOW:
+            recent_cycles.popleft()
+        self.action = action
+        self.fan_on = action is not HVACAction.IDLE or values.get("fan_mode") == FAN_ON
+        self.aux_on = values.get("aux_status") == AUX_ON
+        self.updated = timestamp
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals and state, for storage."""
+        return {
+            "heat": self.heat,
+            "cool": self.cool,
+            "fan": self.fan,
+            "aux": self.aux,
+            "observed": self.observed,
+            "cycles": self.cycles,
+            "action": self.action,
+            "fan_on": self.fan_on,
+            "aux_on": self.aux_on,
+            "updated": self.updated,
+            "recent_cycles": list(self.recent_cycles),
+        }
+
+    @classmethod
+    def from_dict(cls, stored: dict[str, Any]) -> ThermostatRuntime:
+        """Restore totals saved by as_dict."""
+        action = stored.get("action")
+        return cls(
+            heat=stored["heat"],
+            cool=stored["cool"],
+            fan=stored["fan"],
+            aux=stored["aux"],
+            observed=stored["observed"],
+            cycles=stored["cycles"],
+            action=HVACAction(action) if action else None,
+            fan_on=stored["fan_on"],
+            aux_on=stored["aux_on"],
+            updated=stored["updated"],
+            recent_cycles=deque(stored["recent_cycles"]),
+        )
+
+
+class RuntimeTracker:
+    """Daily runtime accounting for every thermostat of a site.
+
+    Each poll costs O(1) per thermostat: the time since the previous poll
+    is added to the totals of the state that poll reported. Totals reset
+    at local midnight.
+    """
+
+    def __init__(self, max_gap: float) -> None:
+        """Initialize the tracker; longer gaps between polls are not counted."""
+        self.max_gap = max_gap
+        self.thermostats: dict[str, ThermostatRuntime] = {}
+        self._day_start = 0.0
+        self._day_end = 0.0
+
+    def _roll_day(self, timestamp: float) -> list[str]:
+        """Reset the totals when a poll falls on a new day; return the reset ones."""
+        if self._day_start <= timestamp < self._day_end:
+            return []
+        start = dt_util.start_of_local_day(
+            dt_util.as_local(dt_util.utc_from_timestamp(timestamp))
+        )
+        new_day = start.timestamp() != self._day_start
+        self._day_start = start.timestamp()
+        self._day_end = dt_util.start_of_local_day(start.date() + timedelta(days=1)).timestamp()
+        if not new_day:
+            return []
+        reset = []
+        for thermostat_name, runtime in self.thermostats.items():
+            if runtime.updated is not None and runtime.updated < self._day_start:
+                runtime.reset()
+                # Count only the part of the gap after midnight
+                runtime.updated = self._day_start
+                reset.append(thermostat_name)
+        return reset
+
+    def update(
+        self,
+        timestamp: float,
+        data: dict[str, dict[str, Any]],
+        names: Iterable[str],
+    ) -> dict[str, ThermostatRuntime]:
+        """Account for a poll of some thermostats; return the runtimes that changed."""
+        updated = {
+            thermostat_name: self.thermostats[thermostat_name]
+            for thermostat_name in self._roll_day(timestamp)
+        }
+        for thermostat_name in names:
+            runtime = self.thermostats.get(thermostat_name)
+            if runtime is None:
+                runtime = self.thermostats[thermostat_name] = ThermostatRuntime()
+            runtime.update(timestamp, data[thermostat_name], self.max_gap)
+            updated[thermostat_name] = runtime
+        return updated
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every thermostat's runtime, for storage."""
+        return {
+            thermostat_name: runtime.as_dict()
+            for thermostat_name, runtime in self.thermostats.items()
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore runtimes saved by as_dict."""
+        self.thermostats = {
+            thermostat_name: ThermostatRuntime.from_dict(runtime)
+            for thermostat_name, runtime in stored.items()
+        }
@@ -0,0 +1,231 @@
+"""Weekly schedule cache and diffing for Pelican Thermostat."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+from typing import Any
+import xml.etree.ElementTree as ET
+
+from .const import (
+    OBJECT_THERMOSTAT_SCHEDULE,
+    SCHEDULE_DAYS,
+    VALUE_COOL_SETTING,
+    VALUE_DAY_OF_WEEK,
+    VALUE_DELETE,
+    VALUE_DELETE_ALL,
+    VALUE_FAN,
+    VALUE_HEAT_SETTING,
+    VALUE_KEYPAD,
+    VALUE_NAME,
+    VALUE_SET_TIME,
+    VALUE_START_TIME,
+    VALUE_SYSTEM,
+)
+from .parser import SUCCESS_TAG, PelicanParseError
+
+_LOGGER = logging.getLogger(__name__)
+
+KEY_SET_TIME = "set_time"
+
+
+def normalize_time(text: str) -> str:
+    """Return a time of day as HH:MM."""
+    hours, _, minutes = text.partition(":")
+    try:
+        return f"{int(hours):02d}:{int(minutes):02d}"
+    except ValueError:
+        return text
+
+
+# API tag -> (key, converter) of the values of one schedule period
+SCHEDULE_VALUES: dict[str, tuple[str, Callable[[str], Any]]] = {
+    VALUE_START_TIME: ("start_time", normalize_time),
+    VALUE_SYSTEM: ("system_mode", str),
+    VALUE_HEAT_SETTING: ("heat_setting", int),
+    VALUE_COOL_SETTING: ("cool_setting", int),
+    VALUE_FAN: ("fan_mode", str),
+    VALUE_KEYPAD: ("keypad", str),
+}
+SCHEDULE_TAGS: dict[str, str] = {key: tag for tag, (key, _) in SCHEDULE_VALUES.items()}
+SCHEDULE_VALUE_LIST: list[str] = [VALUE_NAME, VALUE_DAY_OF_WEEK, VALUE_SET_TIME, *SCHEDULE_VALUES]
+
+# Periods of each day, in set time order; each period holds its set_time
+Week = dict[str, list[dict[str, Any]]]
+
+
+def schedule_hash(days: Week) -> str:
+    """Return the content hash of a weekly schedule."""
+    canonical = json.dumps(days, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def parse_schedule_response(
+    data: bytes | str, default_name: str | None = None
+) -> dict[str, Week]:
+    """Parse a ThermostatSchedule GET response into schedules by thermostat name."""
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError as err:
+        raise PelicanParseError(f"Failed to parse XML response: {err}") from err
+    if (root.findtext(SUCCESS_TAG) or "").strip() != "1":
+        raise PelicanParseError("API request was not successful")
+
+    result: dict[str, Week] = {}
+    for elem in root.iter(OBJECT_THERMOSTAT_SCHEDULE):
+        name = elem.findtext(VALUE_NAME) or default_name
+        day = elem.findtext(VALUE_DAY_OF_WEEK)
+        try:
+            set_time = int(elem.findtext(VALUE_SET_TIME) or "")
+        except ValueError:
+            set_time = None
+        if not name or day not in SCHEDULE_DAYS or set_time is None:
+            _LOGGER.warning("Skipping incomplete schedule entry in response")
+            continue
+        period: dict[str, Any] = {KEY_SET_TIME: set_time}
+        for tag, (key, convert) in SCHEDULE_VALUES.items():
+            text = elem.findtext(tag)
+            if not text:
+                continue
+            try:
+                period[key] = convert(text)
+            except ValueError:
+                _LOGGER.warning("Invalid schedule %s value: %s", tag, text)
+        result.setdefault(name, {}).setdefault(day, []).append(period)
+
+    for days in result.values():
+        for periods in days.values():
+            periods.sort(key=lambda period: period[KEY_SET_TIME])
+    return result
+
+
+def merge_days(current: Week, days: dict[str, list[dict[str, Any]]]) -> Week:
+    """Return the schedule with some days replaced.
+
+    Each given day is replaced by its periods, numbered in order from set
+    time 1; values left out of a period keep those of the period it
+    replaces. Days not given are kept, and days given no periods are
+    removed.
+    """
+    merged = {day: [dict(period) for period in periods] for day, periods in current.items()}
+    for day, periods in days.items():
+        if not periods:
+            merged.pop(day, None)
+            continue
+        before = {period[KEY_SET_TIME]: period for period in current.get(day, [])}
+        merged[day] = [
+            {**before.get(set_time, {}), **period, KEY_SET_TIME: set_time}
+            for set_time, period in enumerate(periods, start=1)
+        ]
+    return merged
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleChange:
+    """One SET of a schedule upload."""
+
+    day: str
+    set_time: int | None  # None for the whole day
+    values: dict[str, str] | None  # None deletes the period or day
+
+    @property
+    def selection(self) -> str:
+        """Return the selection of the change, after the thermostat name."""
+        if self.set_time is None:
+            return f"{VALUE_DAY_OF_WEEK}:{self.day};"
+        return f"{VALUE_DAY_OF_WEEK}:{self.day};{VALUE_SET_TIME}:{self.set_time};"
+
+    @property
+    def value(self) -> str:
+        """Return the API value of the change."""
+        if self.values is None:
+            # Deletes take no value
+            return VALUE_DELETE if self.set_time is not None else VALUE_DELETE_ALL
+        return ";".join(f"{tag}:{value}" for tag, value in self.values.items())
+
+
+def diff_schedule(old: Week, new: Week) -> list[ScheduleChange]:
+    """Return the SETs that turn one schedule into another.
+
+    Only the values that differ are sent; a day that lost every period is
+    deleted in one request, and trailing periods are deleted last first so
+    set time indexes stay valid.
+    """
+    changes: list[ScheduleChange] = []
+    for day in SCHEDULE_DAYS:
+        old_periods = {period[KEY_SET_TIME]: period for period in old.get(day, [])}
+        new_periods = {period[KEY_SET_TIME]: period for period in new.get(day, [])}
+        if not new_periods:
+            if old_periods:
+                changes.append(ScheduleChange(day, None, None))
+            continue
+        for set_time, period in new_periods.items():
+            before = old_periods.get(set_time, {})
+            values = {
+                SCHEDULE_TAGS[key]: str(value)
+                for key, value in period.items()
+                if key in SCHEDULE_TAGS and before.get(key) != value
+            }
+            if values:
+                changes.append(ScheduleChange(day, set_time, values))
+        for set_time in sorted(old_periods.keys() - new_periods.keys(), reverse=True):
+            changes.append(ScheduleChange(day, set_time, None))
+    return changes
+
+
+@dataclass(slots=True)
+class CachedSchedule:
+    """The weekly schedule of one thermostat as last downloaded or uploaded."""
+
+    days: Week
+    fetched_at: float
+    content_hash: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Hash the schedule."""
+        self.content_hash = schedule_hash(self.days)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the schedule, for storage and service responses."""
+        return {"hash": self.content_hash, "fetched_at": self.fetched_at, "days": self.days}
+
+
+class PelicanScheduleCache:
+    """Weekly schedules of the thermostats of a site, keyed by content hash."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.thermostats: dict[str, CachedSchedule] = {}
+
+    def get(self, thermostat_name: str) -> CachedSchedule | None:
+        """Return the cached schedule of a thermostat."""
+        return self.thermostats.get(thermostat_name)
+
+    def update(self, thermostat_name: str, days: Week, timestamp: float) -> bool:
+        """Store a schedule; return True if its content changed."""
+        cached = CachedSchedule(days, timestamp)
+        previous = self.thermostats.get(thermostat_name)
+        self.thermostats[thermostat_name] = cached
+        return previous is None or previous.content_hash != cached.content_hash
+
+    def invalidate(self, thermostat_name: str) -> None:
+        """Forget a schedule that may no longer match the thermostat."""
+        self.thermostats.pop(thermostat_name, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every schedule, for storage."""
+        return {
+            thermostat_name: cached.as_dict()
+            for thermostat_name, cached in self.thermostats.items()
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore schedules saved by as_dict, skipping any that fail their hash."""
+        for thermostat_name, cached in stored.items():
+            schedule = CachedSchedule(cached["days"], cached["fetched_at"])
+            if schedule.content_hash != cached["hash"]:
+                _LOGGER.warning("Discarding corrupt cached schedule of %s", thermostat_name)
+                continue
+            self.thermostats[thermostat_name] = schedule
@@ -0,0 +1,168 @@
+"""Shared request scheduler for one Pelican cloud base URL."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import date
+from enum import IntEnum
+import heapq
+import itertools
+import logging
+import time
+
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_REQUEST_BURST
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Lane of a request; lower values are sent first."""
+
+    WRITE = 0  # user-initiated SET
+    CONFIRM = 1  # read-back of a write
+    POLL = 2  # background GET
+
+
+class RequestCancelled(Exception):
+    """A queued poll was dropped to make room for a write."""
+
+
+class BudgetExhausted(Exception):
+    """The daily request budget has been used up."""
+
+
+class RequestScheduler:
+    """Admit requests to the Pelican cloud under a shared rate limit.
+
+    Requests take tokens from a bucket refilled at a fixed rate. Requests
+    that find no token wait in priority lanes, so user writes and their
+    read-backs go ahead of background polls, and a write cancels the polls
+    still waiting in the queue; the write's own read-back and the fast polls
+    after it make them redundant. Once the daily budget is spent, polls are
+    refused until midnight while writes are still let through.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = DEFAULT_REQUEST_BURST,
+        daily_budget: int = 0,
+    ) -> None:
+        """Initialize the scheduler; rate is in requests per second."""
+        self.rate = rate
+        self.burst = burst
+        self.daily_budget = daily_budget  # 0 is unlimited
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._day: date = dt_util.now().date()
+        self.used_today = 0
+        self.sent: Counter[str] = Counter()
+        self.cancelled = 0
+        self.refused = 0
+
+    def configure(self, rate: float, daily_budget: int) -> None:
+        """Apply new limits to requests not yet sent."""
+        self._refill()
+        self.rate = rate
+        self.daily_budget = daily_budget
+        self._dispatch()
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    @property
+    def budget_exhausted(self) -> bool:
+        """Return True if the daily budget is used up."""
+        today = dt_util.now().date()
+        if today != self._day:
+            self._day = today
+            self.used_today = 0
+        return bool(self.daily_budget) and self.used_today >= self.daily_budget
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """Wait until a request of this priority may be sent.
+
+        Raises RequestCancelled when a queued poll is dropped for a write,
+        and BudgetExhausted for polls once the daily budget is spent.
+        """
+        if priority is RequestPriority.POLL and self.budget_exhausted:
+            self.refused += 1
+            raise BudgetExhausted
+        if priority is RequestPriority.WRITE:
+            self._cancel_polls()
+        if not self._queue:
+            self._refill()
+            if self._tokens >= 1:
+                self._send(priority)
+                return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The waiting caller went away; its slot is skipped on dispatch
+            if future.done() and not future.cancelled():
+                # A token was already taken for it; hand it back
+                self._tokens += 1
+                self.used_today -= 1
+                self._dispatch()
+            raise
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _send(self, priority: RequestPriority) -> None:
+        """Take a token for a request that is sent now."""
+        self._tokens -= 1
+        self.used_today += 1
+        self.sent[priority.name.lower()] += 1
+
+    def _dispatch(self) -> None:
+        """Release queued requests while tokens are available."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._refill()
+        while self._queue:
+            priority, _, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            if priority is RequestPriority.POLL and self.budget_exhausted:
+                heapq.heappop(self._queue)
+                self.refused += 1
+                future.set_exception(BudgetExhausted())
+                continue
+            if self._tokens < 1:
+                break
+            heapq.heappop(self._queue)
+            self._send(priority)
+            future.set_result(None)
+        if self._queue:
+            delay = (1 - self._tokens) / self.rate
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _cancel_polls(self) -> None:
+        """Drop the polls still waiting in the queue."""
+        polls = [entry for entry in self._queue if entry[0] is RequestPriority.POLL]
+        if not polls:
+            return
+        self._queue = [entry for entry in self._queue if entry[0] is not RequestPriority.POLL]
+        heapq.heapify(self._queue)
+        for _, _, future in polls:
+            if not future.done():
+                self.cancelled += 1
+                future.set_exception(RequestCancelled())
+        _LOGGER.debug("Cancelled %d queued polls in favour of a write", len(polls))
@@ -1,171 +1,225 @@
 """Sensor entities for Pelican Thermostat."""
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
-    UnitOfTemperature,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .breaker import BreakerState
+from .const import DOMAIN, KEY_BREAKER, KEY_METRICS, KEY_RUNTIME
 from .coordinator import PelicanThermostatCoordinator
+from .entity import (
+    PelicanSiteBaseEntity,
+    PelicanThermostatBaseEntity,
+    async_add_thermostat_entities,
+)
+from .fields import SENSOR_FIELDS, PelicanField
+from .metrics import PHASE_TOTAL, PHASE_TTFB, PHASES, LatencyHistogram, PelicanMetrics
+from .runtime import ThermostatRuntime
+
+# Unique ID suffixes that predate the field registry and differ from the
+# data key; kept so existing entities are not orphaned
+UNIQUE_ID_KEYS = {"fan_mode": "fan"}
+
+
+def _milliseconds(value: float | None) -> float | None:
+    """Return a duration in seconds as rounded milliseconds."""
+    return round(value * 1000, 1) if value is not None else None
+
+
+def _histogram_attributes(histogram: LatencyHistogram) -> dict[str, Any]:
+    """Return the summary of a latency histogram as state attributes."""
+    return {
+        "count": histogram.count,
+        "mean_ms": _milliseconds(histogram.mean),
+        "p50_ms": _milliseconds(histogram.percentile(0.5)),
+        "p95_ms": _milliseconds(histogram.percentile(0.95)),
+        "max_ms": _milliseconds(histogram.maximum if histogram.count else None),
+    }
+
+
+@dataclass(frozen=True, kw_only=True)
+class PelicanMetricSensorDescription(SensorEntityDescription):
+    """Description of a site request metric sensor."""
+
+    value_fn: Callable[[PelicanMetrics], float | int | None]
+    attributes_fn: Callable[[PelicanMetrics], dict[str, Any]]
+
+
+METRIC_SENSORS = (
+    PelicanMetricSensorDescription(
+        key="poll_duration",
+        name="Poll duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.phases[PHASE_TOTAL].last),
+        # Mean and p95 of every phase, to see where poll time goes
+        attributes_fn=lambda metrics: {
+            f"{phase}_{stat}_ms": _milliseconds(value)
+            for phase in PHASES
+            for stat, value in (
+                ("mean", metrics.phases[phase].mean),
+                ("p95", metrics.phases[phase].percentile(0.95)),
+            )
+        },
+    ),
+    PelicanMetricSensorDescription(
+        key="poll_time_to_first_byte",
+        name="Poll time to first byte",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: _milliseconds(metrics.phases[PHASE_TTFB].last),
+        attributes_fn=lambda metrics: _histogram_attributes(metrics.phases[PHASE_TTFB]),
+    ),
+    PelicanMetricSensorDescription(
+        key="poll_payload",
+        name="Poll payload size",
+        icon="mdi:download-network-outline",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.last_payload_bytes,
+        attributes_fn=lambda metrics: {"total_bytes": metrics.payload_bytes},
+    ),
+    PelicanMetricSensorDescription(
+        key="parse_time",
+        name="Response parse time",
+        icon="mdi:code-tags",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: _milliseconds(metrics.parse.last),
+        attributes_fn=lambda metrics: _histogram_attributes(metrics.parse),
+    ),
+    PelicanMetricSensorDescription(
+        key="write_round_trip",
+        name="Write round trip",
+        icon="mdi:swap-horizontal",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: _milliseconds(metrics.set_round_trip.last),
+        attributes_fn=lambda metrics: _histogram_attributes(metrics.set_round_trip),
+    ),
+    PelicanMetricSensorDescription(
+        key="request_failures",
+        name="Request failures",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.failures.total(),
+        attributes_fn=lambda metrics: dict(metrics.failures),
+    ),
+)
+
+
+
+def _hours(seconds: float) -> float:
+    """Return a duration in seconds as hours."""
+    return round(seconds / 3600, 3)
+
 
-SENSORS = [
-    # Measurement sensors
-    {
-        "key": "temperature",
-        "name": "Temperature",
-        "unit": UnitOfTemperature.FAHRENHEIT,
-        "icon": "mdi:thermometer",
-    },
-    {
-        "key": "humidity",
-        "name": "Humidity",
-        "unit": PERCENTAGE,
-        "icon": "mdi:water-percent",
-    },
-    {
-        "key": "co2_level",
-        "name": "CO2 Level",
-        "unit": "ppm",
-        "icon": "mdi:molecule-co2",
-    },
-    # Status sensors
-    {
-        "key": "run_status",
-        "name": "Run Status",
-        "unit": None,
-        "icon": "mdi:fan",
-    },
-    {
-        "key": "status",
-        "name": "Status",
-        "unit": None,
-        "icon": "mdi:information",
-    },
-    {
-        "key": "set_by",
-        "name": "Set By",
-        "unit": None,
-        "icon": "mdi:account",
-    },
-    {
-        "key": "front_keypad",
-        "name": "Front Keypad",
-        "unit": None,
-        "icon": "mdi:keyboard",
-    },
-    {
-        "key": "aux_status",
-        "name": "Aux Status",
-        "unit": None,
-        "icon": "mdi:electric-switch",
-    },
-    {
-        "key": "status_display",
-        "name": "Status Display",
-        "unit": None,
-        "icon": "mdi:text-box",
-    },
-    {
-        "key": "schedule",
-        "name": "Schedule",
-        "unit": None,
-        "icon": "mdi:calendar-clock",
-    },
-    # Fan sensor
-    {
-        "key": "fan",
-        "name": "Fan Mode",
-        "unit": None,
-        "icon": "mdi:fan",
-    },
-    # System configuration sensors
-    {
-        "key": "heat_stages",
-        "name": "Heat Stages",
-        "unit": None,
-        "icon": "mdi:fire",
-    },
-    {
-        "key": "cool_stages",
-        "name": "Cool Stages",
-        "unit": None,
-        "icon": "mdi:snowflake",
-    },
-    {
-        "key": "fan_stages",
-        "name": "Fan Stages",
-        "unit": None,
-        "icon": "mdi:fan",
-    },
-    {
-        "key": "system_type",
-        "name": "System Type",
-        "unit": None,
-        "icon": "mdi:hvac",
-    },
-    {
-        "key": "temperature_format",
-        "name": "Temperature Format",
-        "unit": None,
-        "icon": "mdi:thermometer",
-    },
-    {
-        "key": "cycle_rate",
-        "name": "Cycle Rate",
-        "unit": None,
-        "icon": "mdi:sync",
-    },
-    {
-        "key": "anticipation_degrees",
-        "name": "Anticipation Degrees",
-        "unit": UnitOfTemperature.FAHRENHEIT,
-        "icon": "mdi:thermometer-chevron-up",
-    },
-    {
-        "key": "calibration_offset",
-        "name": "Calibration Offset",
-        "unit": UnitOfTemperature.FAHRENHEIT,
-        "icon": "mdi:thermometer-lines",
-    },
-    # Device info sensors
-    {
-        "key": "serial_no",
-        "name": "Serial Number",
-        "unit": None,
-        "icon": "mdi:identifier",
-    },
-    {
-        "key": "gateway",
-        "name": "Gateway",
-        "unit": None,
-        "icon": "mdi:router-wireless",
-    },
-    {
-        "key": "version",
-        "name": "Version",
-        "unit": None,
-        "icon": "mdi:information-outline",
-    },
-    {
-        "key": "install_date",
-        "name": "Install Date",
-        "unit": None,
-        "icon": "mdi:calendar",
-    },
-    # Humidity control sensor
-    {
-        "key": "humidity_control",
-        "name": "Humidity Control",
-        "unit": None,
-        "icon": "mdi:water-percent",
-    },
-]
+@dataclass(frozen=True, kw_only=True)
+class PelicanRuntimeSensorDescription(SensorEntityDescription):
+    """Description of a daily runtime sensor."""
+
+    value_fn: Callable[[ThermostatRuntime], float | int | None]
+
+
+RUNTIME_SENSORS = (
+    PelicanRuntimeSensorDescription(
+        key="heat_runtime",
+        name="Heating runtime today",
+        icon="mdi:fire",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        value_fn=lambda runtime: _hours(runtime.heat),
+    ),
+    PelicanRuntimeSensorDescription(
+        key="cool_runtime",
+        name="Cooling runtime today",
+        icon="mdi:snowflake",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        value_fn=lambda runtime: _hours(runtime.cool),
+    ),
+    PelicanRuntimeSensorDescription(
+        key="fan_runtime",
+        name="Fan runtime today",
+        icon="mdi:fan",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        value_fn=lambda runtime: _hours(runtime.fan),
+    ),
+    PelicanRuntimeSensorDescription(
+        key="aux_runtime",
+        name="Aux heat runtime today",
+        icon="mdi:heating-coil",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        value_fn=lambda runtime: _hours(runtime.aux),
+    ),
+    PelicanRuntimeSensorDescription(
+        key="cycles",
+        name="Cycles today",
+        icon="mdi:sync",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda runtime: runtime.cycles,
+    ),
+    PelicanRuntimeSensorDescription(
+        key="cycles_per_hour",
+        name="Cycles per hour",
+        icon="mdi:sync",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="cycles/h",
+        entity_registry_enabled_default=False,
+        value_fn=lambda runtime: runtime.cycles_per_hour,
+    ),
+    PelicanRuntimeSensorDescription(
+        key="duty_cycle",
+        name="Duty cycle today",
+        icon="mdi:percent-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        value_fn=lambda runtime: runtime.duty_cycle,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -178,41 +232,59 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    entities = []
-    for sensor in SENSORS:
-        entities.append(
-            PelicanThermostatSensor(coordinator, config_entry, sensor)
-        )
+    async_add_entities(
+        PelicanMetricSensor(coordinator, config_entry, description)
+        for description in METRIC_SENSORS
+    )
+    async_add_thermostat_entities(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        lambda thermostat_name: [
+            *(
+                PelicanThermostatSensor(coordinator, config_entry, thermostat_name, field)
+                for field in SENSOR_FIELDS
+            ),
+            PelicanBreakerSensor(coordinator, config_entry, thermostat_name),
+            *(
+                PelicanRuntimeSensor(coordinator, config_entry, thermostat_name, description)
+                for description in RUNTIME_SENSORS
+            ),
+        ],
+    )
 
-    async_add_entities(entities)
 
-
-class PelicanThermostatSensor(CoordinatorEntity, SensorEntity):
+class PelicanThermostatSensor(PelicanThermostatBaseEntity, SensorEntity):
     """Representation of a Pelican Thermostat sensor."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: PelicanThermostatCoordinator,
         config_entry: ConfigEntry,
-        sensor_info: dict,
+        thermostat_name: str,
+        field: PelicanField,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.config_entry = config_entry
-        self.sensor_info = sensor_info
-        
-        self._attr_name = sensor_info['name']
-        self._attr_unique_id = f"{config_entry.entry_id}_{sensor_info['key']}"
-        self._attr_native_unit_of_measurement = sensor_info["unit"]
-        self._attr_icon = sensor_info["icon"]
+        super().__init__(
+            coordinator,
+            config_entry,
+            thermostat_name,
+            UNIQUE_ID_KEYS.get(field.key, field.key),
+            (field.key,),
+        )
+        self.field = field
+
+        self._attr_name = field.name
+        self._attr_native_unit_of_measurement = field.unit
+        self._attr_icon = field.icon
+        self._attr_entity_registry_enabled_default = field.enabled_default
 
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        data = self.coordinator.data
-        return data.get(self.sensor_info["key"])
+        data = self.thermostat_data
+        return data.get(self.field.key)
 
     @property
     def available(self) -> bool:
@@ -221,4 +293,103 @@ class PelicanThermostatSensor(CoordinatorEntity, SensorEntity):
         # but we still want to show last known values
         return True
 
- 
\ No newline at end of file
+ 
+
+class PelicanBreakerSensor(PelicanThermostatBaseEntity, SensorEntity):
+    """Diagnostic sensor reporting the circuit breaker state of a thermostat."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_options = [state.value for state in BreakerState]
+
+    def __init__(
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        thermostat_name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, config_entry, thermostat_name, KEY_BREAKER, (KEY_BREAKER,)
+        )
+        self._attr_name = "Connection"
+        self._attr_icon = "mdi:lan-connect"
+
+    @property
+    def native_value(self) -> str:
+        """Return the breaker state."""
+        return self.coordinator.breaker(self.thermostat_name).state.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the failure count and retry timing."""
+        breaker = self.coordinator.breaker(self.thermostat_name)
+        last_success = None
+        if breaker.last_success is not None:
+            last_success = datetime.fromtimestamp(breaker.last_success, timezone.utc).isoformat()
+        retry_in = breaker.retry_in
+        return {
+            "consecutive_failures": breaker.failures,
+            "retry_in": round(retry_in) if retry_in is not None else None,
+            "last_success": last_success,
+            **(super().extra_state_attributes or {}),
+        }
+
+
+class PelicanRuntimeSensor(PelicanThermostatBaseEntity, SensorEntity):
+    """Daily runtime total of a thermostat, kept across restarts."""
+
+    entity_description: PelicanRuntimeSensorDescription
+
+    def __init__(
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        thermostat_name: str,
+        description: PelicanRuntimeSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, config_entry, thermostat_name, description.key, (KEY_RUNTIME,)
+        )
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the total for today."""
+        runtime = self.coordinator.runtime.thermostats.get(self.thermostat_name)
+        if runtime is None:
+            return None
+        return self.entity_description.value_fn(runtime)
+
+
+class PelicanMetricSensor(PelicanSiteBaseEntity, SensorEntity):
+    """Diagnostic sensor reporting a request metric of the site."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: PelicanMetricSensorDescription
+
+    def __init__(
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        description: PelicanMetricSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, config_entry, description.key, (KEY_METRICS,))
+        self.entity_description = description
+
+    @property
+    def available(self) -> bool:
+        """Return True; metrics are most useful while polls are failing."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the latest value of the metric."""
+        return self.entity_description.value_fn(self.coordinator.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the distribution behind the latest value."""
+        return self.entity_description.attributes_fn(self.coordinator.metrics)
@@ -0,0 +1,325 @@
+"""Services for Pelican Thermostat."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.service import async_extract_entity_ids
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_CO2_LIMIT,
+    DEFAULT_FLEET_REPORT_HOURS,
+    DOMAIN,
+    FAN_AUTO,
+    FAN_ON,
+    FLEET_RETENTION,
+    KEYPAD_OFF,
+    KEYPAD_ON,
+    SCHEDULE_DAYS,
+    SYSTEM_AUTO,
+    SYSTEM_COOL,
+    SYSTEM_HEAT,
+    SYSTEM_OFF,
+)
+from .coordinator import PelicanThermostatCoordinator
+from .fields import WRITABLE_FIELDS
+
+SERVICE_BULK_SET = "bulk_set"
+SERVICE_GET_SCHEDULE = "get_schedule"
+SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_FLEET_REPORT = "fleet_report"
+ATTR_THERMOSTATS = "thermostats"
+ATTR_REFRESH = "refresh"
+ATTR_DAYS = "days"
+ATTR_HOURS = "hours"
+ATTR_CO2_LIMIT = "co2_limit"
+ATTR_PROBLEMS_ONLY = "problems_only"
+
+WRITABLE_KEYS = tuple(field.key for field in WRITABLE_FIELDS.values())
+_VALIDATORS = {int: vol.Coerce(int), float: vol.Coerce(float), str: cv.string}
+
+TARGET_SCHEMA = {
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional(ATTR_THERMOSTATS): vol.All(cv.ensure_list, [cv.string]),
+}
+TARGET_KEYS = (ATTR_ENTITY_ID, ATTR_DEVICE_ID, ATTR_AREA_ID, ATTR_THERMOSTATS)
+HAS_TARGET = cv.has_at_least_one_key(*TARGET_KEYS)
+
+BULK_SET_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_SCHEMA,
+            **{
+                vol.Optional(field.key): _VALIDATORS[field.kind]
+                for field in WRITABLE_FIELDS.values()
+            },
+        }
+    ),
+    HAS_TARGET,
+    cv.has_at_least_one_key(*WRITABLE_KEYS),
+)
+
+GET_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema({**TARGET_SCHEMA, vol.Optional(ATTR_REFRESH, default=False): cv.boolean}),
+    HAS_TARGET,
+)
+
+SCHEDULE_PERIOD_SCHEMA = vol.Schema(
+    {
+        vol.Required("start_time"): vol.All(cv.time, lambda value: value.strftime("%H:%M")),
+        vol.Optional("system_mode"): vol.In([SYSTEM_AUTO, SYSTEM_HEAT, SYSTEM_COOL, SYSTEM_OFF]),
+        vol.Optional("heat_setting"): vol.Coerce(int),
+        vol.Optional("cool_setting"): vol.Coerce(int),
+        vol.Optional("fan_mode"): vol.In([FAN_AUTO, FAN_ON]),
+        vol.Optional("keypad"): vol.In([KEYPAD_ON, KEYPAD_OFF]),
+    }
+)
+
+SET_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_SCHEMA,
+            vol.Required(ATTR_DAYS): vol.Schema(
+                {vol.In(SCHEDULE_DAYS): vol.All(cv.ensure_list, [SCHEDULE_PERIOD_SCHEMA])}
+            ),
+        }
+    ),
+    HAS_TARGET,
+)
+
+# Without a target the report covers every thermostat
+FLEET_REPORT_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Optional(ATTR_HOURS, default=DEFAULT_FLEET_REPORT_HOURS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=FLEET_RETENTION / 3600)
+        ),
+        vol.Optional(ATTR_CO2_LIMIT, default=DEFAULT_CO2_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=400)
+        ),
+        vol.Optional(ATTR_PROBLEMS_ONLY, default=True): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services, once for every config entry."""
+    if hass.services.has_service(DOMAIN, SERVICE_BULK_SET):
+        return
+
+    async def _async_bulk_set(call: ServiceCall) -> ServiceResponse:
+        """Write the same values to every targeted thermostat."""
+        values = {key: call.data[key] for key in WRITABLE_KEYS if key in call.data}
+        targets, unknown = await _async_resolve_targets(hass, call)
+        coordinators = list(targets)
+        outcomes = await asyncio.gather(
+            *(
+                coordinator.async_bulk_set(targets[coordinator], values)
+                for coordinator in coordinators
+            )
+        )
+        results: list[dict[str, Any]] = []
+        for coordinator, coordinator_results in zip(coordinators, outcomes):
+            for thermostat_name, success in coordinator_results.items():
+                result: dict[str, Any] = {"thermostat": thermostat_name, "success": success}
+                if not success and coordinator.journal.get(thermostat_name):
+                    # Retried automatically once the thermostat responds
+                    result["error"] = "pending"
+                results.append(result)
+        return {"results": results + _unknown_results(unknown)}
+
+    async def _async_get_schedule(call: ServiceCall) -> ServiceResponse:
+        """Return the cached weekly schedules of the targeted thermostats."""
+        targets, unknown = await _async_resolve_targets(hass, call)
+        pairs = [
+            (coordinator, thermostat_name)
+            for coordinator, names in targets.items()
+            for thermostat_name in names
+        ]
+        schedules = await asyncio.gather(
+            *(
+                coordinator.async_get_schedule(thermostat_name, call.data[ATTR_REFRESH])
+                for coordinator, thermostat_name in pairs
+            )
+        )
+        results: list[dict[str, Any]] = [
+            {
+                "thermostat": thermostat_name,
+                "hash": schedule.content_hash,
+                "fetched_at": dt_util.utc_from_timestamp(schedule.fetched_at).isoformat(),
+                "days": schedule.days,
+            }
+            for (_, thermostat_name), schedule in zip(pairs, schedules)
+        ]
+        return {"results": results + _unknown_results(unknown)}
+
+    async def _async_set_schedule(call: ServiceCall) -> ServiceResponse:
+        """Replace days of the weekly schedule of the targeted thermostats."""
+        targets, unknown = await _async_resolve_targets(hass, call)
+        pairs = [
+            (coordinator, thermostat_name)
+            for coordinator, names in targets.items()
+            for thermostat_name in names
+        ]
+        outcomes = await asyncio.gather(
+            *(
+                coordinator.async_set_schedule(thermostat_name, call.data[ATTR_DAYS])
+                for coordinator, thermostat_name in pairs
+            )
+        )
+        results: list[dict[str, Any]] = [
+            {"thermostat": thermostat_name, **outcome}
+            for (_, thermostat_name), outcome in zip(pairs, outcomes)
+        ]
+        return {"results": results + _unknown_results(unknown)}
+
+    async def _async_fleet_report(call: ServiceCall) -> ServiceResponse:
+        """Return the problems found in the telemetry of the targeted thermostats."""
+        if any(key in call.data for key in TARGET_KEYS):
+            targets, unknown = await _async_resolve_targets(hass, call)
+        else:
+            coordinators: dict[str, PelicanThermostatCoordinator] = hass.data.get(DOMAIN, {})
+            targets = {
+                coordinator: list(coordinator.data or {}) for coordinator in coordinators.values()
+            }
+            unknown = []
+        reports = await asyncio.gather(
+            *(
+                coordinator.async_fleet_report(
+                    names, call.data[ATTR_HOURS], call.data[ATTR_CO2_LIMIT]
+                )
+                for coordinator, names in targets.items()
+            )
+        )
+        results: list[dict[str, Any]] = [
+            result
+            for report in reports
+            for result in report
+            if result["problems"] or not call.data[ATTR_PROBLEMS_ONLY]
+        ]
+        return {
+            "hours": call.data[ATTR_HOURS],
+            "thermostats": sum(len(report) for report in reports),
+            "results": results + _unknown_results(unknown),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        _async_bulk_set,
+        schema=BULK_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        _async_get_schedule,
+        schema=GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULE,
+        _async_set_schedule,
+        schema=SET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FLEET_REPORT,
+        _async_fleet_report,
+        schema=FLEET_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services once no config entry is left."""
+    if not hass.data.get(DOMAIN):
+        for service in (
+            SERVICE_BULK_SET,
+            SERVICE_GET_SCHEDULE,
+            SERVICE_SET_SCHEDULE,
+            SERVICE_FLEET_REPORT,
+        ):
+            hass.services.async_remove(DOMAIN, service)
+
+
+def _unknown_results(unknown: list[str]) -> list[dict[str, Any]]:
+    """Return the service results of thermostat names that matched nothing."""
+    return [
+        {"thermostat": thermostat_name, "success": False, "error": "unknown thermostat"}
+        for thermostat_name in unknown
+    ]
+
+
+async def _async_resolve_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[dict[PelicanThermostatCoordinator, list[str]], list[str]]:
+    """Return the targeted thermostat names per coordinator, and unknown names.
+
+    Entities, devices, areas and groups are resolved to the thermostat
+    devices they belong to; thermostat names are looked up in every entry.
+    Raises ServiceValidationError when nothing matches.
+    """
+    coordinators: dict[str, PelicanThermostatCoordinator] = hass.data.get(DOMAIN, {})
+    targets: dict[PelicanThermostatCoordinator, list[str]] = {}
+
+    def _add(coordinator: PelicanThermostatCoordinator, thermostat_name: str) -> None:
+        names = targets.setdefault(coordinator, [])
+        if thermostat_name not in names:
+            names.append(thermostat_name)
+
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    for entity_id in sorted(await async_extract_entity_ids(hass, call, expand_group=True)):
+        entity = entity_registry.async_get(entity_id)
+        if (
+            entity is None
+            or entity.platform != DOMAIN
+            or entity.device_id is None
+            or entity.config_entry_id not in coordinators
+        ):
+            continue
+        device = device_registry.async_get(entity.device_id)
+        if device is None:
+            continue
+        prefix = f"{entity.config_entry_id}_"
+        for domain, identifier in device.identifiers:
+            # Site diagnostic devices are identified by the bare entry id
+            if domain == DOMAIN and identifier.startswith(prefix):
+                _add(coordinators[entity.config_entry_id], identifier[len(prefix):])
+
+    unknown = []
+    for thermostat_name in call.data.get(ATTR_THERMOSTATS, []):
+        matches = [
+            coordinator
+            for coordinator in coordinators.values()
+            if coordinator.data and thermostat_name in coordinator.data
+        ]
+        if not matches:
+            unknown.append(thermostat_name)
+        for coordinator in matches:
+            _add(coordinator, thermostat_name)
+    if not targets:
+        raise ServiceValidationError("No Pelican thermostats match the service target")
+    return targets, unknown
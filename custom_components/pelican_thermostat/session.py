@@ -0,0 +1,110 @@
+"""Shared HTTP session management for Pelican Thermostat."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_SESSIONS,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_LIMIT_PER_HOST,
+    SESSION_WARM_UP_TIMEOUT,
+)
+from .metrics import create_trace_config
+from .scheduler import RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _SharedSession:
+    """A pooled client session and the number of entries using it."""
+
+    session: aiohttp.ClientSession
+    users: int = 0
+    scheduler: RequestScheduler | None = None
+    # Requests per minute and daily budget asked for by each entry
+    limits: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def apply_limits(self) -> None:
+        """Hold the scheduler to the strictest limits of the entries using it."""
+        if self.scheduler is None or not self.limits:
+            return
+        rate = min(rate for rate, _ in self.limits.values())
+        budgets = [budget for _, budget in self.limits.values() if budget]
+        self.scheduler.configure(rate / 60, min(budgets, default=0))
+
+
+def async_acquire_session(hass: HomeAssistant, base_url: str) -> aiohttp.ClientSession:
+    """Return the pooled session for a base URL, creating it on first use."""
+    sessions: dict[str, _SharedSession] = hass.data.setdefault(DATA_SESSIONS, {})
+    shared = sessions.get(base_url)
+    if shared is None or shared.session.closed:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=SESSION_LIMIT_PER_HOST,
+            ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+            keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        )
+        # Only requests passing a RequestTrace as trace_request_ctx are timed
+        session = aiohttp.ClientSession(
+            connector=connector, trace_configs=[create_trace_config()]
+        )
+        shared = _SharedSession(session=session)
+        sessions[base_url] = shared
+        _LOGGER.debug("Created pooled HTTP session for %s", base_url)
+    shared.users += 1
+    return shared.session
+
+
+def async_get_scheduler(
+    hass: HomeAssistant,
+    base_url: str,
+    entry_id: str,
+    requests_per_minute: int,
+    daily_budget: int,
+) -> RequestScheduler:
+    """Return the request scheduler shared by the entries of a base URL.
+
+    The session for the base URL must have been acquired first.
+    """
+    shared: _SharedSession = hass.data[DATA_SESSIONS][base_url]
+    if shared.scheduler is None:
+        shared.scheduler = RequestScheduler(requests_per_minute / 60)
+    shared.limits[entry_id] = (requests_per_minute, daily_budget)
+    shared.apply_limits()
+    return shared.scheduler
+
+
+async def async_release_session(
+    hass: HomeAssistant, base_url: str, entry_id: str | None = None
+) -> None:
+    """Release a pooled session, closing it when the last user is gone."""
+    sessions: dict[str, _SharedSession] = hass.data.get(DATA_SESSIONS, {})
+    shared = sessions.get(base_url)
+    if shared is None:
+        return
+    if shared.limits.pop(entry_id, None) is not None:
+        shared.apply_limits()
+    shared.users -= 1
+    if shared.users <= 0:
+        sessions.pop(base_url)
+        await shared.session.close()
+        _LOGGER.debug("Closed pooled HTTP session for %s", base_url)
+
+
+async def async_warm_up_session(session: aiohttp.ClientSession, base_url: str) -> None:
+    """Open a keep-alive connection so the first poll skips DNS and TLS setup."""
+    try:
+        async with session.head(
+            base_url, timeout=aiohttp.ClientTimeout(total=SESSION_WARM_UP_TIMEOUT)
+        ) as response:
+            await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        # Not fatal: the first real request simply pays the handshake instead
+        _LOGGER.debug("Warm-up request to %s failed: %s", base_url, err)
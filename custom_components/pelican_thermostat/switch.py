@@ -8,10 +8,8 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    CONF_THERMOSTAT_NAME,
     DOMAIN,
     KEYPAD_OFF,
     KEYPAD_ON,
@@ -19,6 +17,7 @@ from .const import (
     SCHEDULE_ON,
 )
 from .coordinator import PelicanThermostatCoordinator
+from .entity import PelicanThermostatBaseEntity, async_add_thermostat_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,45 +32,50 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    entities = [
-        PelicanScheduleSwitch(coordinator, config_entry),
-        PelicanKeypadSwitch(coordinator, config_entry),
-    ]
-
-    async_add_entities(entities)
+    async_add_thermostat_entities(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        lambda thermostat_name: [
+            PelicanScheduleSwitch(coordinator, config_entry, thermostat_name),
+            PelicanKeypadSwitch(coordinator, config_entry, thermostat_name),
+        ],
+    )
 
 
-class PelicanScheduleSwitch(CoordinatorEntity, SwitchEntity):
+class PelicanScheduleSwitch(PelicanThermostatBaseEntity, SwitchEntity):
     """Representation of a Pelican Thermostat schedule switch."""
 
-    _attr_has_entity_name = True
-
     def __init__(
-        self, coordinator: PelicanThermostatCoordinator, config_entry: ConfigEntry
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        thermostat_name: str,
     ) -> None:
         """Initialize the schedule switch."""
-        super().__init__(coordinator)
-        self.config_entry = config_entry
+        super().__init__(coordinator, config_entry, thermostat_name, "schedule")
         self._attr_name = "Schedule"
-        self._attr_unique_id = f"{config_entry.entry_id}_schedule"
         self._attr_icon = "mdi:calendar-clock"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if schedule is on."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         schedule = data.get("schedule")
         return schedule == SCHEDULE_ON
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the schedule on."""
-        await self.coordinator.set_schedule(SCHEDULE_ON)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values(
+            self.thermostat_name, {"schedule": SCHEDULE_ON}
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the schedule off."""
-        await self.coordinator.set_schedule(SCHEDULE_OFF)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values(
+            self.thermostat_name, {"schedule": SCHEDULE_OFF}
+        )
 
     @property
     def available(self) -> bool:
@@ -79,37 +83,40 @@ class PelicanScheduleSwitch(CoordinatorEntity, SwitchEntity):
         return True
 
 
-class PelicanKeypadSwitch(CoordinatorEntity, SwitchEntity):
+class PelicanKeypadSwitch(PelicanThermostatBaseEntity, SwitchEntity):
     """Representation of a Pelican Thermostat keypad lock switch."""
 
-    _attr_has_entity_name = True
-
     def __init__(
-        self, coordinator: PelicanThermostatCoordinator, config_entry: ConfigEntry
+        self,
+        coordinator: PelicanThermostatCoordinator,
+        config_entry: ConfigEntry,
+        thermostat_name: str,
     ) -> None:
         """Initialize the keypad switch."""
-        super().__init__(coordinator)
-        self.config_entry = config_entry
+        super().__init__(
+            coordinator, config_entry, thermostat_name, "keypad", ("front_keypad",)
+        )
         self._attr_name = "Front Keypad"
-        self._attr_unique_id = f"{config_entry.entry_id}_keypad"
         self._attr_icon = "mdi:keyboard"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if keypad is enabled."""
-        data = self.coordinator.data
+        data = self.thermostat_data
         keypad = data.get("front_keypad")
         return keypad == KEYPAD_ON
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the keypad."""
-        await self.coordinator.set_keypad(KEYPAD_ON)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values(
+            self.thermostat_name, {"front_keypad": KEYPAD_ON}
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the keypad (lock it)."""
-        await self.coordinator.set_keypad(KEYPAD_OFF)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values(
+            self.thermostat_name, {"front_keypad": KEYPAD_OFF}
+        )
 
     @property
     def available(self) -> bool:
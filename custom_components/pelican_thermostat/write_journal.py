@@ -0,0 +1,124 @@
+"""Persistent write-ahead journal for Pelican Thermostat."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    STORAGE_VERSION,
+    WRITE_JOURNAL_SAVE_DELAY,
+    WRITE_RETRY_BASE,
+    WRITE_RETRY_MAX,
+)
+from .write_queue import values_match
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteUndelivered(Exception):
+    """A SET that may not have reached the thermostat and should be retried."""
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """Values not yet delivered to one thermostat, keyed by API tag."""
+
+    values: dict[str, str]
+    queued_at: float = field(default_factory=time.time)
+    attempts: int = 0  # failed deliveries so far
+    retry_at: float = 0.0  # wall-clock time of the next replay
+
+
+class PelicanWriteJournal:
+    """Writes of a site that are not known to have reached their thermostat.
+
+    Every SET is recorded before it is sent and discarded once the API has
+    answered it, whether it took the values or rejected them. Writes that
+    time out or fail in transit stay recorded, merged per value with later
+    writes, and are replayed with exponential backoff. The journal is
+    saved through a Store so it survives restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty journal."""
+        self.pending: dict[str, PendingWrite] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.writes"
+        )
+
+    async def async_load(self) -> None:
+        """Restore the writes left over from the last run."""
+        for thermostat_name, stored in (await self._store.async_load() or {}).items():
+            self.pending[thermostat_name] = PendingWrite(**stored)
+        if self.pending:
+            _LOGGER.info("Restored pending writes for %s", ", ".join(self.pending))
+
+    async def async_save(self) -> None:
+        """Write the journal to disk now."""
+        await self._store.async_save(self._as_dict())
+
+    def _as_dict(self) -> dict[str, Any]:
+        """Return the journal, for storage."""
+        return {
+            thermostat_name: asdict(pending)
+            for thermostat_name, pending in self.pending.items()
+        }
+
+    def _schedule_save(self) -> None:
+        """Write the journal to disk shortly, batching quick changes."""
+        self._store.async_delay_save(self._as_dict, WRITE_JOURNAL_SAVE_DELAY)
+
+    def get(self, thermostat_name: str) -> PendingWrite | None:
+        """Return the pending writes of a thermostat."""
+        return self.pending.get(thermostat_name)
+
+    def record(self, thermostat_name: str, values: dict[str, str]) -> None:
+        """Record writes about to be sent; later writes replace earlier ones per value."""
+        pending = self.pending.get(thermostat_name)
+        if pending is None:
+            # The first delivery is under way; replays wait for it to fail
+            self.pending[thermostat_name] = PendingWrite(
+                dict(values), retry_at=time.time() + WRITE_RETRY_BASE
+            )
+        elif all(pending.values.get(tag) == value for tag, value in values.items()):
+            return
+        else:
+            pending.values.update(values)
+        self._schedule_save()
+
+    def discard(self, thermostat_name: str, values: dict[str, str] | None = None) -> None:
+        """Forget writes the API has answered, or every write of a thermostat.
+
+        A value written again since is kept, as it has not been sent yet.
+        """
+        pending = self.pending.get(thermostat_name)
+        if pending is None:
+            return
+        for tag, value in (values or pending.values).copy().items():
+            if tag in pending.values and values_match(pending.values[tag], value):
+                del pending.values[tag]
+        if not pending.values:
+            del self.pending[thermostat_name]
+        self._schedule_save()
+
+    def defer(self, thermostat_name: str) -> float | None:
+        """Back off after a failed delivery; return the seconds until the retry."""
+        pending = self.pending.get(thermostat_name)
+        if pending is None:
+            return None
+        pending.attempts += 1
+        backoff = min(WRITE_RETRY_BASE * 2 ** (pending.attempts - 1), WRITE_RETRY_MAX)
+        pending.retry_at = time.time() + backoff
+        self._schedule_save()
+        return backoff
+
+    def due(self, thermostat_name: str, now: float) -> bool:
+        """Return True if a thermostat has writes to replay now."""
+        pending = self.pending.get(thermostat_name)
+        return pending is not None and pending.retry_at <= now
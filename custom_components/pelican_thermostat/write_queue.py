@@ -0,0 +1,93 @@
+"""Write coalescing queue for Pelican Thermostat."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import WRITE_DEBOUNCE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def values_match(current: Any, value: str) -> bool:
+    """Return True if a pending write would not change the current value."""
+    if current is None:
+        return False
+    if isinstance(current, (int, float)):
+        try:
+            return float(current) == float(value)
+        except ValueError:
+            return False
+    return str(current) == value
+
+
+class PelicanWriteQueue:
+    """Debounced per-thermostat queue that merges field writes into one SET.
+
+    Writes arriving within the debounce window are merged (last writer wins
+    per field), writes matching the value last confirmed by the thermostat
+    are dropped, and the remainder is sent as a single compound request.
+    ``current_value`` returns None for values not recently confirmed, which
+    are always sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        thermostat_name: str,
+        send: Callable[[str, dict[str, str]], Awaitable[bool]],
+        current_value: Callable[[str, str], Any],
+        on_dropped: Callable[[str, dict[str, str]], None] | None = None,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.thermostat_name = thermostat_name
+        self._send = send
+        self._current_value = current_value
+        self._on_dropped = on_dropped
+        self._pending: dict[str, str] = {}
+        self._result: asyncio.Future[bool] | None = None
+
+    async def async_write(self, values: dict[str, str]) -> bool:
+        """Queue field writes and wait for the batch they end up in."""
+        self._pending.update(values)
+        if self._result is None:
+            self._result = self.hass.loop.create_future()
+            self.hass.async_create_background_task(
+                self._async_flush(),
+                f"pelican_thermostat write {self.thermostat_name}",
+            )
+        return await asyncio.shield(self._result)
+
+    async def _async_flush(self) -> None:
+        """Send the merged batch once the debounce window has passed."""
+        await asyncio.sleep(WRITE_DEBOUNCE)
+        values, self._pending = self._pending, {}
+        result, self._result = self._result, None
+
+        changed = {
+            value_type: value
+            for value_type, value in values.items()
+            if not values_match(self._current_value(self.thermostat_name, value_type), value)
+        }
+        if len(changed) < len(values):
+            dropped = {
+                value_type: value
+                for value_type, value in values.items()
+                if value_type not in changed
+            }
+            _LOGGER.debug("Dropped no-op writes for %s: %s", self.thermostat_name, dropped)
+            if self._on_dropped is not None:
+                self._on_dropped(self.thermostat_name, dropped)
+        if not changed:
+            result.set_result(True)
+            return
+
+        try:
+            result.set_result(await self._send(self.thermostat_name, changed))
+        except Exception as err:  # noqa: BLE001 - handed to every waiter
+            result.set_exception(err)
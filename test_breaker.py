@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for the per-thermostat circuit breaker."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
+
+from pelican_thermostat import breaker as breaker_module  # noqa: E402
+from pelican_thermostat.breaker import BreakerState, CircuitBreaker  # noqa: E402
+from pelican_thermostat.const import BREAKER_TRIAL_TIMEOUT  # noqa: E402
+
+
+class FakeClock:
+    """Stand-in for the time module that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the breaker's clock and take the jitter out of its backoff."""
+    fake = FakeClock()
+    monkeypatch.setattr(breaker_module, "time", fake)
+    monkeypatch.setattr(breaker_module, "BREAKER_JITTER", 0)
+    return fake
+
+
+def open_breaker(breaker):
+    """Fail a closed breaker up to its threshold."""
+    for _ in range(breaker.threshold):
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+
+def test_opens_after_threshold(clock):
+    """Requests are refused once the failure threshold is reached."""
+    breaker = CircuitBreaker(threshold=3, base=60, maximum=600)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.retry_in is None
+
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.retry_in == 60
+    assert not breaker.allow_request()
+
+
+def test_half_open_trial_closes_on_success(clock):
+    """After the backoff one trial goes through, and a success closes the breaker."""
+    breaker = CircuitBreaker(threshold=3, base=60, maximum=600)
+    open_breaker(breaker)
+
+    clock.now += 59
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+    # Only the one trial until it reports back
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failures == 0
+    assert breaker.opened == 0
+    assert breaker.last_success == clock.now
+    assert breaker.allow_request()
+
+
+def test_half_open_failure_doubles_backoff(clock):
+    """A failed trial opens the breaker again for twice as long, up to the maximum."""
+    breaker = CircuitBreaker(threshold=3, base=60, maximum=200)
+    open_breaker(breaker)
+
+    for backoff in (120, 200, 200):
+        clock.now += breaker.retry_in
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is BreakerState.OPEN
+        assert breaker.retry_in == backoff
+
+
+def test_lost_trial_is_retried(clock):
+    """A trial that never reports back lets another one through after a while."""
+    breaker = CircuitBreaker(threshold=3, base=60, maximum=600)
+    open_breaker(breaker)
+    clock.now += 60
+    assert breaker.allow_request()
+
+    clock.now += BREAKER_TRIAL_TIMEOUT - 1
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+
+
+def test_failures_while_open_keep_backoff(clock):
+    """Polls reporting a unit that is already backing off do not extend the backoff."""
+    breaker = CircuitBreaker(threshold=3, base=60, maximum=600)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.retry_in == 30
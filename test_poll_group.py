@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for the staggered polling shared by every config entry."""
+
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
+
+from pelican_thermostat.const import POLL_MIN_GAP, POLL_PHASE_JITTER  # noqa: E402
+from pelican_thermostat.poll_group import PollGroup, PollLimiter  # noqa: E402
+
+INTERVAL = 60.0
+NOW = 1_700_000_000.0
+
+
+def make_group(count):
+    """Return a group of sites with made-up entry ids."""
+    group = PollGroup()
+    for index in range(count):
+        group.join(f"entry{index:02d}", 4)
+    return group
+
+
+def test_delay_is_deterministic():
+    """The same sites get the same delays in every run, whatever order they join in."""
+    group = make_group(5)
+    shuffled = PollGroup()
+    entry_ids = list(group.limits)
+    random.Random(1).shuffle(entry_ids)
+    for entry_id in entry_ids:
+        shuffled.join(entry_id, 4)
+
+    for entry_id in group.limits:
+        delay = group.delay(entry_id, INTERVAL, NOW)
+        assert delay == group.delay(entry_id, INTERVAL, NOW)
+        assert delay == shuffled.delay(entry_id, INTERVAL, NOW)
+        assert INTERVAL * POLL_MIN_GAP <= delay < INTERVAL * (1 + POLL_MIN_GAP)
+
+
+def test_delays_spread_evenly():
+    """Sites poll one slot apart, give or take the jitter."""
+    for count in (2, 5, 12):
+        group = make_group(count)
+        polls = sorted(
+            (NOW + group.delay(entry_id, INTERVAL, NOW)) % INTERVAL for entry_id in group.limits
+        )
+        gaps = [
+            (later - earlier) % INTERVAL for earlier, later in zip(polls, polls[1:] + polls[:1])
+        ]
+        slot = INTERVAL / count
+        for gap in gaps:
+            assert slot * (1 - POLL_PHASE_JITTER) <= gap <= slot * (1 + POLL_PHASE_JITTER)
+
+
+def test_limiter_holds_cap_while_it_changes():
+    """No poll starts while as many as the current limit are running."""
+
+    async def run():
+        limiter = PollLimiter(3)
+        rng = random.Random(0)
+        admitted_over = []
+        peak = 0
+
+        async def poll():
+            nonlocal peak
+            async with limiter:
+                if limiter.active > limiter.limit:
+                    admitted_over.append((limiter.active, limiter.limit))
+                peak = max(peak, limiter.active)
+                await asyncio.sleep(rng.uniform(0, 0.01))
+
+        tasks = [asyncio.create_task(poll()) for _ in range(60)]
+        for limit in (1, 4, 2, 5, 1, 3):
+            await asyncio.sleep(0.005)
+            limiter.limit = limit
+        await asyncio.gather(*tasks)
+        assert not admitted_over
+        assert peak <= 5
+        assert limiter.active == 0
+
+    asyncio.run(run())
+
+
+def test_group_keeps_one_limiter():
+    """Sites joining and leaving change the limit of the same limiter."""
+    group = PollGroup()
+    limiter = group.slot()
+    group.join("a", 4)
+    group.join("b", 2)
+    assert group.slot() is limiter
+    assert limiter.limit == 2
+    group.leave("b")
+    assert group.slot() is limiter
+    assert limiter.limit == 4
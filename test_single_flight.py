@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for the refreshes that share a single fetch."""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+
+from benchmarks.fake_api import PASSWORD, USERNAME, FakePelicanAPI  # noqa: E402
+from benchmarks.load_test import async_boot  # noqa: E402
+from pelican_thermostat.const import DOMAIN  # noqa: E402
+
+THERMOSTAT = "Thermostat 0001"
+
+
+class GatedAPI(FakePelicanAPI):
+    """Fake site that holds GET requests until the test lets them through."""
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.started = 0
+
+    async def handle(self, request):
+        if request.query.get("request") != "set":
+            self.started += 1
+        await self.gate.wait()
+        return await super().handle(request)
+
+
+def test_joined_refreshes_share_one_fetch(tmp_path):
+    """Refreshes arriving during a fetch share one follow-up GET and notify once."""
+
+    async def run():
+        api = GatedAPI(thermostats=3)
+        runner, url = await api.start()
+        hass = await async_boot(str(tmp_path))
+        try:
+            entry = ConfigEntry(
+                version=1,
+                minor_version=1,
+                domain=DOMAIN,
+                title="Single flight test",
+                data={"base_url": url, "username": USERNAME, "password": PASSWORD},
+                source="user",
+            )
+            await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done()
+            coordinator = hass.data[DOMAIN][entry.entry_id]
+            coordinator.scheduler = None
+
+            calls = []
+            coordinator.async_add_listener(
+                lambda: calls.append(coordinator.data[THERMOSTAT]["temperature"]),
+                (THERMOSTAT, frozenset({"temperature"})),
+            )
+            # Coming back from a failed poll, so every refresh sees the status flip
+            api.failure_rate = 1.0
+            await coordinator.async_refresh()
+            assert not coordinator.last_update_success
+            api.failure_rate = 0.0
+            calls.clear()
+            stats = coordinator.refresh_stats
+            fetched, joined = stats.fetched, stats.joined
+
+            api.gate.clear()
+            first = asyncio.create_task(coordinator.async_refresh())
+            async with asyncio.timeout(5):
+                while api.started == 0 or coordinator._fetch_task is None:
+                    await asyncio.sleep(0.01)
+            started = api.started
+            joiners = [asyncio.create_task(coordinator.async_refresh()) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            api.state[THERMOSTAT]["temperature"] = "60.5"
+            api.gate.set()
+            async with asyncio.timeout(10):
+                await asyncio.gather(first, *joiners)
+
+            # The first fetch, then one follow-up for the three joiners
+            assert api.started - started == 1
+            assert stats.fetched - fetched == 2
+            assert stats.joined - joined == 3
+            assert coordinator.last_update_success
+            assert calls == [60.5]
+        finally:
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+    asyncio.run(run())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Tests for the write journal and the replay of its writes after a restart."""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
+
+from aiohttp import web  # noqa: E402
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from benchmarks.fake_api import PASSWORD, USERNAME, FakePelicanAPI  # noqa: E402
+from benchmarks.load_test import async_boot  # noqa: E402
+from pelican_thermostat.const import DOMAIN, WRITE_RETRY_BASE  # noqa: E402
+from pelican_thermostat.write_journal import PelicanWriteJournal  # noqa: E402
+
+ENTRY_ID = "journal_test"
+THERMOSTAT = "Thermostat 0001"
+
+
+async def async_stop(hass):
+    """Stop a Home Assistant instance started by a test."""
+    await hass.async_stop(force=True)
+
+
+def test_record_merges_per_value(tmp_path):
+    """Later writes replace earlier ones per value and keep the rest."""
+
+    async def run():
+        hass = HomeAssistant(str(tmp_path))
+        journal = PelicanWriteJournal(hass, ENTRY_ID)
+        journal.record(THERMOSTAT, {"heatSetting": "65", "fan": "On"})
+        retry_at = journal.get(THERMOSTAT).retry_at
+        journal.record(THERMOSTAT, {"heatSetting": "66", "coolSetting": "80"})
+        pending = journal.get(THERMOSTAT)
+        assert pending.values == {"heatSetting": "66", "fan": "On", "coolSetting": "80"}
+        # The first delivery is still under way, so its retry time stands
+        assert pending.retry_at == retry_at
+        await async_stop(hass)
+
+    asyncio.run(run())
+
+
+def test_discard_keeps_newer_values(tmp_path):
+    """Answering a SET forgets only the values it carried."""
+
+    async def run():
+        hass = HomeAssistant(str(tmp_path))
+        journal = PelicanWriteJournal(hass, ENTRY_ID)
+        journal.record(THERMOSTAT, {"heatSetting": "65", "fan": "On"})
+        journal.record(THERMOSTAT, {"heatSetting": "66"})
+        journal.discard(THERMOSTAT, {"heatSetting": "65.0", "fan": "On"})
+        assert journal.get(THERMOSTAT).values == {"heatSetting": "66"}
+        journal.discard(THERMOSTAT, {"heatSetting": "66"})
+        assert journal.get(THERMOSTAT) is None
+        await async_stop(hass)
+
+    asyncio.run(run())
+
+
+def test_defer_backs_off(tmp_path):
+    """Each failed delivery doubles the wait before the next replay."""
+
+    async def run():
+        hass = HomeAssistant(str(tmp_path))
+        journal = PelicanWriteJournal(hass, ENTRY_ID)
+        journal.record(THERMOSTAT, {"heatSetting": "65"})
+        assert not journal.due(THERMOSTAT, time.time())
+        assert journal.defer(THERMOSTAT) == WRITE_RETRY_BASE
+        assert journal.defer(THERMOSTAT) == 2 * WRITE_RETRY_BASE
+        assert journal.get(THERMOSTAT).attempts == 2
+        assert journal.due(THERMOSTAT, time.time() + 2 * WRITE_RETRY_BASE)
+        assert journal.defer("Unknown") is None
+        await async_stop(hass)
+
+    asyncio.run(run())
+
+
+def test_journal_survives_restart(tmp_path):
+    """Merged writes and their backoff are restored by the next run."""
+
+    async def run():
+        hass = HomeAssistant(str(tmp_path))
+        journal = PelicanWriteJournal(hass, ENTRY_ID)
+        journal.record(THERMOSTAT, {"heatSetting": "65"})
+        journal.record(THERMOSTAT, {"heatSetting": "66", "coolSetting": "80"})
+        journal.defer(THERMOSTAT)
+        saved = journal.get(THERMOSTAT)
+        await journal.async_save()
+        await async_stop(hass)
+
+        hass = HomeAssistant(str(tmp_path))
+        restored = PelicanWriteJournal(hass, ENTRY_ID)
+        await restored.async_load()
+        assert restored.pending == {THERMOSTAT: saved}
+        await async_stop(hass)
+
+    asyncio.run(run())
+
+
+class GarbledSetAPI(FakePelicanAPI):
+    """Fake site that applies SETs but answers them with a truncated body."""
+
+    async def handle(self, request):
+        response = await super().handle(request)
+        if request.query.get("request") == "set":
+            return web.Response(text="<result><succ", content_type="text/xml")
+        return response
+
+
+async def async_setup_site(hass, url):
+    """Set up an entry for a fake site and return its coordinator."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Journal test",
+        data={"base_url": url, "username": USERNAME, "password": PASSWORD},
+        source="user",
+        entry_id=ENTRY_ID,
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][ENTRY_ID]
+
+
+def test_unreadable_set_response_is_journaled(tmp_path):
+    """A SET whose answer cannot be read stays journaled for a replay."""
+
+    async def run():
+        api = GarbledSetAPI(thermostats=3)
+        runner, url = await api.start()
+        hass = await async_boot(str(tmp_path))
+        try:
+            coordinator = await async_setup_site(hass, url)
+            coordinator.scheduler = None
+            await coordinator.async_write(THERMOSTAT, {"heatSetting": "66"})
+            async with asyncio.timeout(10):
+                while (pending := coordinator.journal.get(THERMOSTAT)) is None or not pending.attempts:
+                    await asyncio.sleep(0.05)
+            assert coordinator.journal.get(THERMOSTAT).values == {"heatSetting": "66"}
+            assert api.requests["set"] == 1
+        finally:
+            await async_stop(hass)
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_replay_after_restart(tmp_path):
+    """Writes left over from the last run are sent once the thermostat responds."""
+
+    async def run():
+        api = FakePelicanAPI(thermostats=3)
+        runner, url = await api.start()
+        hass = await async_boot(str(tmp_path))
+        try:
+            journal = PelicanWriteJournal(hass, ENTRY_ID)
+            journal.record(THERMOSTAT, {"heatSetting": "65", "fan": "On"})
+            journal.defer(THERMOSTAT)
+            journal.pending[THERMOSTAT].retry_at = 0.0
+            await journal.async_save()
+
+            coordinator = await async_setup_site(hass, url)
+
+            async with asyncio.timeout(10):
+                while coordinator.journal.pending:
+                    await asyncio.sleep(0.05)
+            assert api.state[THERMOSTAT]["heatSetting"] == "65"
+            assert api.state[THERMOSTAT]["fan"] == "On"
+            assert api.requests["set"] == 1
+        finally:
+            await async_stop(hass)
+            await runner.cleanup()
+
+    asyncio.run(run())